@@ -0,0 +1,130 @@
+"""
+Micro-benchmark of the cache of HdlGenerateFunctions.split_declaration.
+The cached split_declaration is compared with the uncached _split_declaration on a corpus of declarations.
+The declarations of the signal names and of the ports of the design files given at the command line are used as
+corpus, without design files a generated corpus is used. It contains the kinds of declarations which are
+listed in _split_declaration (ranges, sub-ranges, record slices, initializations, comments) in VHDL and Verilog.
+A batch generation splits each declaration 3 or 4 times, so the benchmark splits each declaration 4 times per
+simulated generation. It also prints the memory of the cache entries, which the limit of the cache is based on.
+Usage (from the root directory of the repository):
+    python benchmarks/bench_split_declaration.py [--generations N] [design.hse ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from codegen import hdl_generate_functions  # noqa: E402
+
+CALLS_PER_DECLARATION_AND_GENERATION = 4
+
+
+def create_generated_corpus(number_of_declarations):
+    """Returns a list of (declaration, language) with the kinds of declarations found in schematics."""
+    corpus = []
+    for index in range(number_of_declarations):
+        width = index % 32 + 1
+        kind = index % 5
+        if kind == 0:
+            declaration = f"data_{index} : std_logic_vector({width - 1} downto 0)"
+        elif kind == 1:
+            declaration = f"data_{index}({width - 1} downto 0) : std_logic_vector(31 downto 0) := X\"00000000\""
+        elif kind == 2:
+            declaration = f"data_{index}(3)(1 downto 0) : t_std_logic_8_array(3 downto 0) -- slice of array {index}"
+        elif kind == 3:
+            declaration = f"rec_{index}.field_{index % 7} : t_record_{index % 11}"
+        else:
+            declaration = f"enable_{index} : std_logic := '0' -- enable {index}"
+        corpus.append((declaration, "VHDL"))
+        if kind == 0:
+            declaration = f"wire [{width - 1}:0] data_{index}"
+        elif kind == 1:
+            declaration = f"wire [{width - 1}:0] data_{index}[3:0] // sub-range of data_{index}"
+        elif kind == 2:
+            declaration = f"logic [7:0] memory_{index} [0:15] = '{{default:0}}"
+        elif kind == 3:
+            declaration = f"reg signed [{width - 1}:0] counter_{index}"
+        else:
+            declaration = f"wire enable_{index} // enable {index}"
+        corpus.append((declaration, "Verilog"))
+    return corpus
+
+
+def read_corpus_from_design_files(file_names):
+    """Returns a list of (declaration, language) with all signal name and port declarations of the design files."""
+    corpus = []
+    for file_name in file_names:
+        with open(file_name, encoding="utf-8") as fileobject:
+            file_dictionary = json.loads(fileobject.read())
+        if "active__architecture" in file_dictionary:
+            design_dictionaries = [
+                design_dictionary
+                for architecture, design_dictionary in file_dictionary.items()
+                if architecture != "active__architecture"
+            ]
+        else:
+            design_dictionaries = [file_dictionary]
+        for design_dictionary in design_dictionaries:
+            language = "VHDL" if design_dictionary["language"] == "VHDL" else "Verilog"
+            for element in design_dictionary["canvas_dictionary"].values():
+                if element[1] == "signal-name":
+                    corpus.append((element[4], language))
+            for port_declaration in design_dictionary["port_declarations"]:
+                corpus.append((port_declaration, language))
+    return corpus
+
+
+def get_memory_of_cache():
+    """Returns the approximate memory in bytes of all entries of the split_declaration cache."""
+    memory = 0
+    for (declaration, _), result in hdl_generate_functions.HdlGenerateFunctions.split_declaration_cache.items():
+        memory += sys.getsizeof(declaration) + sys.getsizeof(result) + sum(sys.getsizeof(part) for part in result)
+    return memory
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Micro-benchmark of the split_declaration cache.")
+    argument_parser.add_argument("design_files", nargs="*", help="design files (.hse) used as corpus")
+    argument_parser.add_argument("--generations", type=int, default=10, help="number of simulated HDL generations")
+    argument_parser.add_argument("--declarations", type=int, default=2000, help="size of the generated corpus")
+    arguments = argument_parser.parse_args()
+    functions = hdl_generate_functions.HdlGenerateFunctions
+    functions.batch_mode = True
+    if arguments.design_files:
+        corpus = read_corpus_from_design_files(arguments.design_files)
+    else:
+        corpus = create_generated_corpus(arguments.declarations // 2)
+    calls = corpus * (CALLS_PER_DECLARATION_AND_GENERATION * arguments.generations)
+    for declaration, language in corpus:
+        assert functions.split_declaration(declaration, language) == functions._split_declaration(
+            declaration, language
+        )
+
+    def run_uncached():
+        for declaration, language in calls:
+            functions._split_declaration(declaration, language)
+
+    def run_cached():
+        functions.split_declaration_cache.clear()  # Each run starts with an empty cache.
+        for declaration, language in calls:
+            functions.split_declaration(declaration, language)
+
+    time_uncached = min(timeit.repeat(run_uncached, number=1, repeat=3))
+    time_cached = min(timeit.repeat(run_cached, number=1, repeat=3))
+    number_of_entries = len(functions.split_declaration_cache)
+    print(f"declarations: {len(corpus)} ({number_of_entries} different), calls: {len(calls)}")
+    print(f"uncached: {time_uncached:.4f} s")
+    print(f"cached:   {time_cached:.4f} s (speedup {time_uncached / time_cached:.1f})")
+    print(
+        f"cache memory: {get_memory_of_cache() / 1024:.0f} KiB for {number_of_entries} entries "
+        f"({get_memory_of_cache() / max(number_of_entries, 1):.0f} bytes per entry, "
+        f"limit {functions.split_declaration_cache_max_entries} entries)"
+    )
+
+
+if __name__ == "__main__":
+    main()
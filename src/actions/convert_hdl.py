@@ -16,7 +16,7 @@ import re
 from tkinter import messagebox
 from tkinter.filedialog import askopenfilename
 
-from hdl_parser import verilog_parsing, vhdl_parsing
+from hdl_parser import parse_cache, verilog_parsing, vhdl_parsing
 
 
 class ConvertHdl:
@@ -35,9 +35,13 @@ class ConvertHdl:
             hdl_file_content = self.__read_hdl_file(hdl_file_name)
             if hdl_file_content != "":
                 if hdl_file_name.endswith(".vhd"):
-                    hdl_parsed = vhdl_parsing.VhdlParser(hdl_file_content, "entity_context")
+                    hdl_parsed = parse_cache.ParseCache.get_parse_result(
+                        vhdl_parsing.VhdlParser, hdl_file_content, "entity_context"
+                    )
                 else:
-                    hdl_parsed = verilog_parsing.VerilogParser(hdl_file_content, "module")
+                    hdl_parsed = parse_cache.ParseCache.get_parse_result(
+                        verilog_parsing.VerilogParser, hdl_file_content, "module"
+                    )
                 design_dictionary = self.__create_design_dictionary(window, hdl_parsed, language)
                 self.__fill_project_file(window, design_dictionary)
 
@@ -17,6 +17,8 @@ class FindReplace:
             return
         FindReplace.search_is_running = True
         number_of_all_hits = 0
+        if search_replace_hier:
+            window.hierarchytree.open_windows_of_all_sub_modules()  # The sub-modules are searched in their windows.
         window_list = schematic_window.SchematicWindow.open_window_dict if search_replace_hier else [window]
         for open_window in window_list:
             number_of_hits = self._search_and_replace(open_window, search_string, replace_string, replace)
@@ -19,7 +19,7 @@ from datetime import datetime
 from threading import Thread
 from tkinter import messagebox
 
-from codegen import hdl_create_file_list, hdl_generate_flipflop_stat, hdl_generate_functions
+from codegen import hdl_create_file_list, hdl_generate, hdl_generate_flipflop_stat, hdl_generate_functions
 from gui import notebook_log_tab, notebook_top
 
 
@@ -79,7 +79,11 @@ class CompileHDL:
                     + ".vhd"
                 )
         return hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
-            self.design.get_path_name(), hdlfilename, hdlfilename_architecture, show_message=True
+            self.design.get_path_name(),
+            hdlfilename,
+            hdlfilename_architecture,
+            show_message=True,
+            architecture_name=self.design.get_architecture_name(),
         )
 
     def __design_changes_are_not_saved(self):
@@ -152,10 +156,14 @@ class CompileHDL:
 
     def __run_commands(self, commands, flipflop_stat):
         self.window.config(cursor="watch")
+        # Files which are changed by a HDL generation during the compile must be compiled by the next compile:
+        changed_files = hdl_generate.GenerateHDL.get_changed_hdl_files()
         for command in commands:
-            success = self.__execute(command, flipflop_stat)
+            success = self.__execute(command, flipflop_stat, changed_files)
             if not success:
                 break
+        else:
+            hdl_generate.GenerateHDL.clear_changed_hdl_files(changed_files)
         end_time = datetime.now()
         self.log_tab.insert_line_in_log(
             "Finished user commands from Control-Tab after " + str(end_time - self.start_time) + ".\n",
@@ -163,9 +171,15 @@ class CompileHDL:
         )
         self.window.config(cursor="arrow")
 
-    def __execute(self, command, flipflop_stat):
+    def __execute(self, command, flipflop_stat, changed_files):
         command_array = shlex.split(command)  # Does not split quoted sub-strings with blanks.
-        self.__replace_variables(command_array)
+        if "$changed-files" in command and not changed_files:
+            self.log_tab.insert_line_in_log(
+                command + "\nis not executed, because no HDL file was changed since the last compile.\n",
+                state_after_insert="disabled",
+            )
+            return True
+        command_array = self.__replace_variables(command_array, changed_files)
         if not command_array:
             return False
         for command_part in command_array:
@@ -213,7 +227,7 @@ class CompileHDL:
             self.__put_table_into_messages_tab(table_for_log)
         return True
 
-    def __replace_variables(self, command_array):
+    def __replace_variables(self, command_array, changed_files):
         module_name = self.design.get_module_name()
         generate_path_value = self.design.get_generate_path_value()
         file_name1 = generate_path_value + "/" + module_name + "_e.vhd"
@@ -241,6 +255,16 @@ class CompileHDL:
             command_array[index] = re.sub(
                 r"\$hdl-file-list", "hdl_file_list_" + module_name + ".txt", command_array[index]
             )
+        # $changed-files is replaced by several arguments, one for each HDL file changed since the last compile:
+        command_array_with_changed_files = []
+        for command_part in command_array:
+            if command_part == "$changed-files":
+                command_array_with_changed_files.extend(changed_files)
+            else:
+                command_array_with_changed_files.append(
+                    command_part.replace("$changed-files", " ".join(changed_files))
+                )
+        return command_array_with_changed_files
 
     def __write_simulator_messages_into_file(self, flipflop_stat_list):
         # The file is written into the current working directory, which is the directory set in the Control-tab or
@@ -0,0 +1,44 @@
+"""
+A grid hashed index of connection points (pins of symbols and ports of the module).
+A connection point is connected to a wire, when both of its coordinates differ by less than a tolerance from the
+coordinates of the start or end point of the wire. The index stores each connection point in a cell of the size of
+the tolerance, so only the 3x3 cells around a wire end point must be checked instead of all connection points.
+"""
+
+import math
+
+
+class ConnectionPointIndex:
+    """This class finds the connection points near a point without checking all connection points."""
+
+    def __init__(self, list_of_coords, tolerance):
+        # list_of_coords contains the coordinates [x, y, ...] of each connection point, only x and y are used.
+        self.tolerance = tolerance
+        self.points = [(coords[0], coords[1]) for coords in list_of_coords]
+        self.cells = {}
+        if tolerance > 0:  # Otherwise no point can be connected.
+            for index, (x, y) in enumerate(self.points):
+                self.cells.setdefault(self._get_cell(x, y), []).append(index)
+
+    def _get_cell(self, x, y):
+        return math.floor(x / self.tolerance), math.floor(y / self.tolerance)
+
+    def get_indices_near_point(self, x, y):
+        """Returns the indices of the connection points, whose coordinates differ by less than tolerance."""
+        if not self.cells:
+            return []
+        cell_x, cell_y = self._get_cell(x, y)
+        indices = []
+        for neighbour_x in (cell_x - 1, cell_x, cell_x + 1):
+            for neighbour_y in (cell_y - 1, cell_y, cell_y + 1):
+                for index in self.cells.get((neighbour_x, neighbour_y), ()):
+                    point_x, point_y = self.points[index]
+                    if abs(point_x - x) < self.tolerance and abs(point_y - y) < self.tolerance:
+                        indices.append(index)
+        return indices
+
+    def get_indices_connected_to_line(self, line_coords):
+        """Returns the indices of the connection points at the start or end point of a line in ascending order."""
+        indices = set(self.get_indices_near_point(line_coords[0], line_coords[1]))
+        indices.update(self.get_indices_near_point(line_coords[-2], line_coords[-1]))
+        return sorted(indices)
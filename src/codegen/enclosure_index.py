@@ -0,0 +1,38 @@
+"""
+An index of the rectangles of the schematic elements (instances, blocks, generate frames).
+A rectangle is enclosed by a generate frame, when it lies completely inside the rectangle of the frame. The index
+keeps the rectangles sorted by their left edge, so only the rectangles whose left edge lies between the left and the
+right edge of the frame must be checked instead of all rectangles.
+"""
+
+import bisect
+
+
+class EnclosureIndex:
+    """This class finds the rectangles enclosed by a rectangle without checking all rectangles."""
+
+    def __init__(self, rectangles):
+        # rectangles is a dictionary {canvas_id: [x1, y1, x2, y2]}, the results keep the order of its keys.
+        self.rectangles = []  # [(left, top, right, bottom, position in rectangles, canvas_id), ...]
+        for position, (canvas_id, coords) in enumerate(rectangles.items()):
+            left, top, right, bottom = self._normalize(coords)
+            self.rectangles.append((left, top, right, bottom, position, canvas_id))
+        self.rectangles.sort()
+        self.left_edges = [rectangle[0] for rectangle in self.rectangles]
+
+    def _normalize(self, coords):
+        left, right = sorted((coords[0], coords[2]))
+        top, bottom = sorted((coords[1], coords[3]))
+        return left, top, right, bottom
+
+    def get_canvas_ids_enclosed_by(self, coords):
+        """Returns the canvas IDs of all rectangles enclosed by coords (also a rectangle identical to coords)."""
+        frame_left, frame_top, frame_right, frame_bottom = self._normalize(coords)
+        first = bisect.bisect_left(self.left_edges, frame_left)
+        last = bisect.bisect_right(self.left_edges, frame_right)
+        enclosed = [
+            (position, canvas_id)
+            for _, top, right, bottom, position, canvas_id in self.rectangles[first:last]
+            if frame_top <= top and right <= frame_right and bottom <= frame_bottom
+        ]
+        return [canvas_id for _, canvas_id in sorted(enclosed)]
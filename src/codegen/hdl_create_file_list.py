@@ -257,7 +257,7 @@ class HdlCreateFileList:
                 hdlfilename = generate_path_name + "/" + module_name + "_e.vhd"
                 hdlfilename_architecture = generate_path_name + "/" + module_name + "_" + architecture_name + ".vhd"
         return hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
-            path_name, hdlfilename, hdlfilename_architecture, show_message=True
+            path_name, hdlfilename, hdlfilename_architecture, show_message=True, architecture_name=architecture_name
         )
 
     def __get_design_dict_from_dict_with_several_architectures(
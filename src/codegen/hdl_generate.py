@@ -6,15 +6,16 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
-from tkinter import messagebox
 
 from codegen import (
+    connection_point_index,
     hdl_generate_architecture,
     hdl_generate_entity,
     hdl_generate_functions,
     hdl_generate_module_content,
     hdl_generate_module_interface,
     hdl_generate_sort_elements,
+    hdl_manifest,
     sensitivity_check_hse,
 )
 from elements import generate_frame
@@ -24,12 +25,16 @@ from gui import notebook_hdl_tab
 class GenerateHDL:
     """This class generates the HDL-code for a design and fills the link-dictionary with the HDL-line-numbers."""
 
+    # All HDL files, which were written with a changed content since the last successful compile.
+    # A dictionary is used as ordered set, the keys are the file names, the values are None.
+    changed_hdl_files = {}
+
     def __init__(
         self,
         parent,
-        notebook,  # : notebook_top.NotebookTop,
+        notebook,  # : notebook_top.NotebookTop, None at batch generation (no window exists then)
         design,  # : design_data.DesignData,
-        hdl_tab: notebook_hdl_tab.NotebookHdlTab,
+        hdl_tab: notebook_hdl_tab.NotebookHdlTab,  # None at batch generation
         write_to_file,  # write_to_file=False, when GenerateHDL is used for building the link-dictionary.
         write_message=False,
         hierarchical_generate=False,
@@ -37,6 +42,7 @@ class GenerateHDL:
         self.notebook = notebook
         self.design = design
         self.hdl_tab = hdl_tab
+        self.changed_files = []
         if write_to_file and self._information_in_control_tab_is_missing_or_wrong():
             parent.generation_failed = True
             return
@@ -45,7 +51,7 @@ class GenerateHDL:
             return
         file_name, file_name_architecture = self.design.get_file_names()
         sorted_canvas_ids_for_hdl = hdl_generate_sort_elements.SortElements(
-            notebook, self.design, write_to_file
+            self.design, write_to_file
         ).get_sorted_list_of_schematic_elements()
         [
             input_decl,
@@ -92,9 +98,12 @@ class GenerateHDL:
                 file_name,
             )
         if write_to_file:
-            self._write_hdl_file(file_name, file_name_architecture, header, entity, architecture)
+            self.changed_files = self._write_hdl_file(file_name, file_name_architecture, header, entity, architecture)
+            GenerateHDL.changed_hdl_files.update(dict.fromkeys(self.changed_files))
+            self._update_manifest(file_name, file_name_architecture)
             hdl_file_name = file_name if file_name_architecture == "" else file_name_architecture
-            self.hdl_tab.update_hdl_tab_from(self.design.create_design_dictionary_of_active_architecture())
+            if self.hdl_tab is not None:
+                self.hdl_tab.update_hdl_tab_from(self.design.create_design_dictionary_of_active_architecture())
             if write_message:
                 notebook.log_tab.log_frame_text.insert_line(
                     "\n+++++++++++++++++++++++++++++++++ "
@@ -116,21 +125,22 @@ class GenerateHDL:
             if messages:
                 for message in messages:
                     message_string += message + "\n"
-                notebook.log_tab.insert_line_in_log(message_string, state_after_insert="disabled")
-                notebook.show_tab("Messages")
+                if notebook is not None:
+                    notebook.log_tab.insert_line_in_log(message_string, state_after_insert="disabled")
+                    notebook.show_tab("Messages")
             parent.sensitivity_message = message_string  # Message for the toplevel window
 
     def _information_in_control_tab_is_missing_or_wrong(self):
         module_name = self.design.get_module_name()
         generate_path_value = self.design.get_generate_path_value()
         if module_name.isspace() or module_name == "":
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation is not possible,\nbecause no module name is specified in the Control-Tab.",
             )
             return True
         if generate_path_value.isspace() or generate_path_value == "":
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation for module "
                 + module_name
@@ -140,7 +150,7 @@ class GenerateHDL:
             return True
         path = Path(generate_path_value)
         if not path.exists():
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation for module "
                 + module_name
@@ -154,7 +164,7 @@ class GenerateHDL:
 
     def _edits_are_running(self):
         if self.design.get_block_edit_list():
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation is not possible,\nbecause a block edit of module "
                 + self.design.get_module_name()
@@ -162,7 +172,7 @@ class GenerateHDL:
             )
             return True
         if self.design.get_signal_name_edit_list():
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation is not possible,\nbecause a signal name edit of module "
                 + self.design.get_module_name()
@@ -170,7 +180,7 @@ class GenerateHDL:
             )
             return True
         if self.design.get_edit_line_edit_list():
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation is not possible,\nbecause an edit dialog of module "
                 + self.design.get_module_name()
@@ -178,7 +188,7 @@ class GenerateHDL:
             )
             return True
         if self.design.get_edit_text_edit_list():
-            messagebox.showerror(
+            hdl_generate_functions.HdlGenerateFunctions.show_error(
                 "Error in HDL-SCHEM-Editor",
                 "HDL-generation is not possible,\nbecause an edit dialog of module "
                 + self.design.get_module_name()
@@ -263,9 +273,13 @@ class GenerateHDL:
                 1 + header.count("\n") + 1
             )  # first "+1": filename of architecture; second "+1": first line for architecture
             file_name = file_name_architecture
+        if self.notebook is None:
+            architecture_name = self.design.get_architecture_name()
+        else:
+            architecture_name = self.notebook.diagram_tab.architecture_name
         architecture = hdl_generate_architecture.GenerateArchitecture(
             self.design,
-            self.notebook.diagram_tab.architecture_name,
+            architecture_name,
             signal_decl,
             instance_connection_definitions,
             block_list,
@@ -313,27 +327,80 @@ class GenerateHDL:
         ).get_content()
         return header, module_interface, module_content
 
-    def _write_hdl_file(self, file_name, file_name_architecture, header, entity, architecture) -> None:
+    def get_changed_files(self):
+        """Returns the names of the HDL files whose content was changed by this HDL generation."""
+        return self.changed_files
+
+    @classmethod
+    def get_changed_hdl_files(cls):
+        """Returns the names of all HDL files whose content was changed since the last successful compile."""
+        return list(cls.changed_hdl_files)
+
+    @classmethod
+    def clear_changed_hdl_files(cls, file_names):
+        """Is called after a successful compile of the given files."""
+        for file_name in file_names:
+            cls.changed_hdl_files.pop(file_name, None)
+
+    def _write_hdl_file(self, file_name, file_name_architecture, header, entity, architecture):
         _, name_of_file = os.path.split(file_name)
         comment_string = "--" if file_name.endswith(".vhd") else "//"
         if file_name_architecture == "":  # VHDL all in 1 file or Verilog
             content = comment_string + " Filename: " + name_of_file + "\n"
             content += header + entity + architecture
-            with open(file_name, "w", encoding="utf-8") as fileobject:
-                fileobject.write(content)
+            file_contents = [(file_name, content)]
         else:
             content1 = "-- Filename: " + name_of_file + "\n"
             content1 += header
             content1 += entity
-            with open(file_name, "w", encoding="utf-8") as fileobject_entity:
-                fileobject_entity.write(content1)
             _, name_of_architecture_file = os.path.split(file_name_architecture)
             content = "-- Filename: " + name_of_architecture_file + "\n"
             content += header
             content += architecture
-            with open(file_name_architecture, "w", encoding="utf-8") as fileobject_architecture:
-                fileobject_architecture.write(content)
-        return
+            file_contents = [(file_name, content1), (file_name_architecture, content)]
+        changed_files = []
+        for hdl_file_name, hdl_content in file_contents:
+            # A file with identical content is not written again, so that its modification time is kept
+            # and tools which check the modification time do not compile it again.
+            if not self._file_content_is_identical(hdl_file_name, hdl_content):
+                with open(hdl_file_name, "w", encoding="utf-8") as fileobject:
+                    fileobject.write(hdl_content)
+                changed_files.append(hdl_file_name)
+            elif not self.design.get_design_is_saved():
+                self._keep_hdl_file_younger_than_design_file(hdl_file_name)
+        return changed_files
+
+    def _keep_hdl_file_younger_than_design_file(self, hdl_file_name):
+        # Only called, when no manifest entry can be written for the design (see _update_manifest). Then
+        # hdl_must_be_generated() compares the modification times, so an unchanged HDL file must not stay older than
+        # the design file, otherwise it is reported as outdated. When the manifest entry is written, the file is not
+        # touched, so tools which check the modification time do not compile it again:
+        try:
+            if os.path.getmtime(hdl_file_name) < os.path.getmtime(self.design.get_path_name()):
+                os.utime(hdl_file_name)
+        except OSError:
+            pass  # The design was not saved into a file yet.
+
+    def _file_content_is_identical(self, file_name, content):
+        try:
+            with open(file_name, encoding="utf-8") as fileobject:
+                old_content = fileobject.read()
+        except (OSError, ValueError):
+            return False
+        # The timestamp in the header changes at each generation, so it is ignored at the comparison:
+        return self._remove_timestamp(old_content) == self._remove_timestamp(content)
+
+    def _remove_timestamp(self, content):
+        return re.sub(r"^(--|//) Created by HDL-SCHEM-Editor.*$", "", content, count=1, flags=re.MULTILINE)
+
+    def _update_manifest(self, file_name, file_name_architecture):
+        hdl_file_names = [file_name] if file_name_architecture == "" else [file_name, file_name_architecture]
+        if self.design.get_design_is_saved():
+            hdl_manifest.HdlManifest.record_generated_hdl(
+                self.design.get_path_name(), self.design.get_architecture_name(), hdl_file_names
+            )
+        else:  # The design file differs from the design the HDL was generated from.
+            hdl_manifest.HdlManifest.forget_generated_hdl(self.design.get_path_name(), hdl_file_names)
 
     def _add_line_numbers(self, text):
         text_lines = text.split("\n")
@@ -360,6 +427,9 @@ class GenerateHDL:
             if pin_and_port_location["type"] == "inout":  # if at least 1 "inout" is present, then fill will be changed.
                 fill = " " * 2
                 break
+        connection_index = connection_point_index.ConnectionPointIndex(
+            [pin_and_port_location["coords"] for pin_and_port_location in pin_and_port_location_list], 0.1 * grid_size
+        )
         for wire_location_list_entry in wire_location_list:
             signal_declaration_is_needed = True
             declaration_with_slices = wire_location_list_entry["declaration"]
@@ -376,84 +446,70 @@ class GenerateHDL:
                 wire_location_list_entry["declaration"] = signal_name + " : " + signal_type + initialization + comment
             else:
                 wire_location_list_entry["declaration"] = signal_type + " " + signal_name + comment
-            for pin_and_port_location in pin_and_port_location_list:
-                pin_is_connected_to_wire = bool(
-                    (
-                        abs(pin_and_port_location["coords"][0] - wire_location_list_entry["coords"][0])
-                        < 0.1 * grid_size
-                        and abs(pin_and_port_location["coords"][1] - wire_location_list_entry["coords"][1])
-                        < 0.1 * grid_size
-                    )
-                    or (
-                        abs(pin_and_port_location["coords"][0] - wire_location_list_entry["coords"][-2])
-                        < 0.1 * grid_size
-                        and abs(pin_and_port_location["coords"][1] - wire_location_list_entry["coords"][-1])
-                        < 0.1 * grid_size
-                    )
-                )
-                if pin_is_connected_to_wire:
-                    if (
-                        pin_and_port_location["type"] == "input"
-                    ):  # Transform the wire declaration into a input port declaration.
-                        if language == "VHDL":
-                            input_declaration = re.sub(
-                                r":[ ]*(.*)", r": in  \1" + fill, wire_location_list_entry["declaration"]
-                            )
-                        else:
-                            input_declaration = re.sub(
-                                "^wire |^reg |^logic ", "input  ", wire_location_list_entry["declaration"]
-                            )  # "reg" should not occur.
-                        input_declarations.append(input_declaration)
-                        wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
-                        signal_declaration_is_needed = False
-                    elif (
-                        pin_and_port_location["type"] == "output"
-                    ):  # Transform the wire declaration into a output port declaration.
-                        if language == "VHDL":
-                            output_declaration = re.sub(
-                                r":[ ]*(.*)", r": out \1" + fill, wire_location_list_entry["declaration"]
-                            )
-                        else:
-                            output_declaration = re.sub("^", "output ", wire_location_list_entry["declaration"])
-                        output_declarations.append(output_declaration)
-                        wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
-                        signal_declaration_is_needed = False
-                    elif (
-                        pin_and_port_location["type"] == "inout"
-                    ):  # Transform the wire declaration into a inout port declaration.
-                        if language == "VHDL":
-                            inout_declaration = re.sub(
-                                r":[ ]*(.*)", r": inout \1", wire_location_list_entry["declaration"]
-                            )
-                        else:
-                            inout_declaration = re.sub("^", "inout  ", wire_location_list_entry["declaration"])
-                        inout_declarations.append(inout_declaration)
-                        wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
-                        signal_declaration_is_needed = False
-                    else:  # pin_and_port_location["type"]==<entity-call>
-                        instance_connection_definition = {}  # Describes the connections to the ports of a instance.
-                        instance_connection_definition["declaration"] = (
-                            declaration_with_slices  # Declaration of the signal connected to a entity-port
+            for pin_index in connection_index.get_indices_connected_to_line(wire_location_list_entry["coords"]):
+                pin_and_port_location = pin_and_port_location_list[pin_index]
+                if (
+                    pin_and_port_location["type"] == "input"
+                ):  # Transform the wire declaration into a input port declaration.
+                    if language == "VHDL":
+                        input_declaration = re.sub(
+                            r":[ ]*(.*)", r": in  \1" + fill, wire_location_list_entry["declaration"]
+                        )
+                    else:
+                        input_declaration = re.sub(
+                            "^wire |^reg |^logic ", "input  ", wire_location_list_entry["declaration"]
+                        )  # "reg" should not occur.
+                    input_declarations.append(input_declaration)
+                    wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
+                    signal_declaration_is_needed = False
+                elif (
+                    pin_and_port_location["type"] == "output"
+                ):  # Transform the wire declaration into a output port declaration.
+                    if language == "VHDL":
+                        output_declaration = re.sub(
+                            r":[ ]*(.*)", r": out \1" + fill, wire_location_list_entry["declaration"]
                         )
-                        instance_connection_definition["entity_name"] = pin_and_port_location[
-                            "type"
-                        ]  # Complete entity call
-                        instance_connection_definition["architecture_name"] = pin_and_port_location[
-                            "architecture_name"
-                        ]  # Used by highlighting through hierarchy.
-                        instance_connection_definition["instance_name"] = pin_and_port_location[
-                            "instance_name"
-                        ]  # Instance-Name of the entity
-                        instance_connection_definition["port_declaration"] = pin_and_port_location[
-                            "port_declaration"
-                        ]  # Declaration of the port, the signal is connected to
-                        instance_connection_definition["canvas_id"] = pin_and_port_location[
-                            "canvas_id"
-                        ]  # Canvas-ID of the rectangle of the symbol,
-                        instance_connection_definitions.append(
-                            instance_connection_definition
-                        )  # used as reference in canvas_dictionary.
-                        # print("instance_connection_definition =", instance_connection_definition)
+                    else:
+                        output_declaration = re.sub("^", "output ", wire_location_list_entry["declaration"])
+                    output_declarations.append(output_declaration)
+                    wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
+                    signal_declaration_is_needed = False
+                elif (
+                    pin_and_port_location["type"] == "inout"
+                ):  # Transform the wire declaration into a inout port declaration.
+                    if language == "VHDL":
+                        inout_declaration = re.sub(
+                            r":[ ]*(.*)", r": inout \1", wire_location_list_entry["declaration"]
+                        )
+                    else:
+                        inout_declaration = re.sub("^", "inout  ", wire_location_list_entry["declaration"])
+                    inout_declarations.append(inout_declaration)
+                    wire_declarations_changed_to_port_declarations.append(wire_location_list_entry["declaration"])
+                    signal_declaration_is_needed = False
+                else:  # pin_and_port_location["type"]==<entity-call>
+                    instance_connection_definition = {}  # Describes the connections to the ports of a instance.
+                    instance_connection_definition["declaration"] = (
+                        declaration_with_slices  # Declaration of the signal connected to a entity-port
+                    )
+                    instance_connection_definition["entity_name"] = pin_and_port_location[
+                        "type"
+                    ]  # Complete entity call
+                    instance_connection_definition["architecture_name"] = pin_and_port_location[
+                        "architecture_name"
+                    ]  # Used by highlighting through hierarchy.
+                    instance_connection_definition["instance_name"] = pin_and_port_location[
+                        "instance_name"
+                    ]  # Instance-Name of the entity
+                    instance_connection_definition["port_declaration"] = pin_and_port_location[
+                        "port_declaration"
+                    ]  # Declaration of the port, the signal is connected to
+                    instance_connection_definition["canvas_id"] = pin_and_port_location[
+                        "canvas_id"
+                    ]  # Canvas-ID of the rectangle of the symbol,
+                    instance_connection_definitions.append(
+                        instance_connection_definition
+                    )  # used as reference in canvas_dictionary.
+                    # print("instance_connection_definition =", instance_connection_definition)
             if signal_declaration_is_needed and wire_location_list_entry["declaration"] not in signal_declarations:
                 signal_declarations.append(wire_location_list_entry["declaration"])
         port_names = []
@@ -3,7 +3,6 @@ Generates the VHDL-Architecture
 """
 
 import re
-from tkinter import messagebox
 
 from codegen import hdl_generate_functions
 from gui import link_dictionary
@@ -267,7 +266,7 @@ class GenerateArchitecture:
             ):  # The string "begin-generate ..." is an entry of sorted_canvas_ids_for_hdl.
                 string_enclosed_canvas_ids = re.sub(r"begin-generate ", "", canvas_id_for_hdl)
                 if not string_enclosed_canvas_ids:
-                    messagebox.showwarning(
+                    hdl_generate_functions.HdlGenerateFunctions.show_warning(
                         "HDl_SCHEM-Editor",
                         "There is an empty generate frame for this generate:\n"
                         + generate_line_for_print
@@ -0,0 +1,220 @@
+"""
+This class creates HDL for a hierachical design through all hierarchies without any window (batch mode).
+It is started from the command line by "--generate-hdl" and does the same as HdlGenerateHierarchy,
+but the designs are read by FileReadBatch and all messages are printed.
+First the module hierarchy is collected from the symbol definitions. As the HDL of a module only depends on its
+own design data, all modules are independent of each other and can be generated in parallel by a process pool.
+The messages of each module are collected and printed in the order of the hierarchy (depth first).
+Limitations:
+- The modules are a flat list and not a dependency graph, because the generation of a module does not read the
+  generated HDL of its sub-modules (the component declarations are taken from the symbol definitions).
+  If a generation step ever needs the result of a sub-module, the list must be replaced by a dependency graph, whose
+  modules are only started when their sub-modules are ready.
+- No Tk root and no window is created, so no X server is needed. But the design model and the codegen modules import
+  tkinter (and the gui modules) at module level, so the tkinter package must be installed.
+"""
+
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import subprocess
+from itertools import repeat
+
+from codegen import hdl_generate, hdl_generate_functions, hdl_manifest
+from data_io import file_read_batch
+from gui import link_dictionary
+
+
+# Module-level function – must be a top-level def to be pickleable for ProcessPoolExecutor.
+def _generate_module(module, force, hfe_cmd):
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        module_generation = ModuleGeneration(force, hfe_cmd)
+        if module["type"] == "hse":
+            module_generation.generate_hdl_for_design(module["design"])
+        else:
+            module_generation.generate_hdl_for_hfe_symbol(module["symbol_definition"])
+    return log.getvalue(), module_generation.get_number_of_errors()
+
+
+class HdlGenerateBatch:
+    """This class creates HDL for a hierachical design through all hierarchies without any window."""
+
+    def __init__(self, filename, force, number_of_jobs=1):
+        self.number_of_errors = 0
+        self.opened_designs_list = []  # Prepare a list to be able to handle recursive hierarchies.
+        self.collected_hfe_files = set()  # An FSM used in several modules must be generated only once.
+        self.module_list = []  # Contains all modules of the hierarchy in depth first order.
+        hfe_cmd = ""
+        design = self._read_design(filename, architecture_name="")
+        if design is not None:
+            hfe_cmd = design.get_hfe_cmd()
+            self.opened_designs_list.append(design.get_module_name())
+            self._collect_modules(design)
+        if number_of_jobs > 1 and len(self.module_list) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=number_of_jobs) as executor:
+                # map() returns the results in the order of module_list, independent of the order of completion:
+                self._print_results(executor.map(_generate_module, self.module_list, repeat(force), repeat(hfe_cmd)))
+        else:
+            self._print_results(map(_generate_module, self.module_list, repeat(force), repeat(hfe_cmd)))
+        print("HDL generation ready.")
+
+    def get_number_of_errors(self):
+        """Returns the number of modules for which HDL could not be generated."""
+        return self.number_of_errors
+
+    def _print_results(self, results):
+        for log, number_of_errors in results:
+            print(log, end="")
+            self.number_of_errors += number_of_errors
+
+    def _read_design(self, filename, architecture_name):
+        try:
+            return file_read_batch.FileReadBatch(filename, architecture_name).get_design()
+        except FileNotFoundError:
+            print("Error in HDL-SCHEM-Editor: File " + filename + " could not be found.")
+        except (json.JSONDecodeError, KeyError) as error:
+            print("Error in HDL-SCHEM-Editor: File " + filename + " could not be read (" + repr(error) + ").")
+        self.number_of_errors += 1
+        return None
+
+    def _collect_modules(self, design):
+        self.module_list.append({"type": "hse", "design": design})
+        symbol_generation_ready = []
+        for symbol_definition in design.get_symbol_definitions():
+            if (
+                symbol_definition["filename"] not in symbol_generation_ready
+            ):  # Avoid multiple generation of the same symbol, when it is used more than once in the schematic.
+                if symbol_definition["filename"].endswith(".hse"):
+                    if (
+                        symbol_definition["entity_name"]["name"] != design.get_module_name()
+                    ):  # Break generation loop at recursive instantiations.
+                        self._collect_hse_symbol(symbol_definition)
+                elif (
+                    symbol_definition["filename"].endswith(".hfe")
+                    and os.path.abspath(symbol_definition["filename"]) not in self.collected_hfe_files
+                ):
+                    self.collected_hfe_files.add(os.path.abspath(symbol_definition["filename"]))
+                    self.module_list.append({"type": "hfe", "symbol_definition": symbol_definition})
+                symbol_generation_ready.append(symbol_definition["filename"])
+
+    def _collect_hse_symbol(self, symbol_definition):
+        sub_design = self._read_design(symbol_definition["filename"], symbol_definition["architecture_name"])
+        if sub_design is None:
+            return
+        sub_module_name = sub_design.get_module_name()
+        if (
+            sub_module_name != ""  # File Read was a success, so HDL can be generated.
+            and sub_module_name not in self.opened_designs_list  # Continue only if no recursive loop exists.
+        ):
+            self.opened_designs_list.append(sub_module_name)
+            self._collect_modules(sub_design)
+
+
+class ModuleGeneration:
+    """This class generates the HDL of one module of the hierarchy, it is the parent object of GenerateHDL."""
+
+    def __init__(self, force, hfe_cmd):
+        self.force = force
+        self.hfe_cmd = hfe_cmd
+        self.generation_failed = False  # Is set by GenerateHDL.
+        self.sensitivity_message = ""  # Is set by GenerateHDL.
+        self.number_of_errors = 0
+        hdl_generate_functions.HdlGenerateFunctions.batch_mode = True
+        if link_dictionary.LinkDictionary.link_dict_reference is None:
+            link_dictionary.LinkDictionary(root=None)  # Is filled by the HDL generation, but not needed here.
+
+    def get_number_of_errors(self):
+        """Returns 1 if the HDL of the module could not be generated, otherwise 0."""
+        return self.number_of_errors
+
+    def generate_hdl_for_design(self, design):
+        """Generates the HDL of a HDL-SCHEM-Editor design, if the HDL is not up to date."""
+        module_name = design.get_module_name()
+        file_name, file_name_architecture = design.get_file_names()
+        if self.force or hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
+            design.get_path_name(),
+            file_name,
+            file_name_architecture if file_name_architecture != "" else None,
+            show_message=False,
+            architecture_name=design.get_architecture_name(),
+        ):
+            hdl_generator = hdl_generate.GenerateHDL(
+                self, None, design, None, write_to_file=True, write_message=False, hierarchical_generate=True
+            )
+            if not self.generation_failed:
+                if hdl_generator.get_changed_files():
+                    print("HDL was generated: " + module_name)
+                else:
+                    print("HDL was generated, the HDL files are unchanged: " + module_name)
+                if self.sensitivity_message != "":
+                    print(self.sensitivity_message, end="")
+            else:
+                print("HDL generation failed: " + module_name)
+                self.number_of_errors += 1
+        else:
+            print("HDL is up to date: " + module_name)
+
+    def generate_hdl_for_hfe_symbol(self, symbol_definition):
+        """Runs HDL-FSM-Editor for a symbol of a HDL-FSM-Editor design, if the HDL is not up to date."""
+        try:
+            with open(symbol_definition["filename"], encoding="utf-8") as fileobject:
+                data_read = fileobject.read()
+            hdl_fsm_editor_design_dictionary_sub = json.loads(data_read)
+            generate_path_value_of_fsm = hdl_fsm_editor_design_dictionary_sub["generate_path"]
+            number_of_files_of_fsm = hdl_fsm_editor_design_dictionary_sub["number_of_files"]
+        except FileNotFoundError:
+            print(
+                "Warning: File " + symbol_definition["filename"] + " could not be found.\n"
+                "Check if HDL already exists may fail."
+            )
+            generate_path_value_of_fsm = symbol_definition["generate_path_value"]
+            number_of_files_of_fsm = symbol_definition["number_of_files"]
+        entity_name = symbol_definition["entity_name"]["name"]
+        if symbol_definition["language"] == "VHDL":
+            if number_of_files_of_fsm == 1:
+                hdlfilename = generate_path_value_of_fsm + "/" + entity_name + ".vhd"
+            else:
+                hdlfilename = generate_path_value_of_fsm + "/" + entity_name + "_e.vhd"
+        else:
+            hdlfilename = generate_path_value_of_fsm + "/" + entity_name + ".v"
+        path_name = symbol_definition["filename"]
+        if not self.force and not hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
+            path_name, hdlfilename, hdlfilename_architecture=None, show_message=False
+        ):
+            print("HDL is up to date: " + entity_name)
+            return
+        command_array = [self.hfe_cmd, "--generate-hdl", "--no-version-check", "--no-message", path_name]
+        print("Run HDL-FSM-Editor ...")
+        try:
+            process = subprocess.run(
+                command_array,
+                text=True,  # Decoding is done by run.
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                check=False,
+            )
+        except (FileNotFoundError, PermissionError) as error:
+            print(
+                "Error in HDL-SCHEM-Editor: "
+                + type(error).__name__
+                + " caused by HDL-FSM-Editor command:\n"
+                + " ".join(command_array)
+            )
+            self.number_of_errors += 1
+            return
+        for line in process.stdout.splitlines(keepends=True):
+            if line != "\n":  # VHDL report-statements cause empty lines which mess up the protocol.
+                print(line, end="")
+        if process.returncode != 0:
+            # The old HDL files must not be recorded as up to date:
+            hdl_manifest.HdlManifest.forget_generated_hdl(path_name, [hdlfilename])
+            print(
+                "HDL generation failed: " + entity_name + " (HDL-FSM-Editor exit code " + str(process.returncode) + ")"
+            )
+            self.number_of_errors += 1
+            return
+        hdl_manifest.HdlManifest.record_generated_hdl(path_name, "", [hdlfilename])
+        print("HDL was generated: " + entity_name)
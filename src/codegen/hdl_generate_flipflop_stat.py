@@ -8,7 +8,7 @@ The hdl-file-list is modified to contain the new HDL file names.
 
 import re
 
-from hdl_parser import verilog_parsing, vhdl_parsing
+from hdl_parser import parse_cache, verilog_parsing, vhdl_parsing
 
 
 class GenerateFlipflopStat:
@@ -31,7 +31,9 @@ class GenerateFlipflopStat:
             if "lib:" not in filename:
                 hdl = self.__get_hdl(filename)
                 if filename.endswith(".vhd") or filename.endswith(".vhdl"):  # external VHDL could use ".vhdl"
-                    vhdl_parser_object = vhdl_parsing.VhdlParser(hdl, "entity_context", parse_big_files=False)
+                    vhdl_parser_object = parse_cache.ParseCache.get_parse_result(
+                        vhdl_parsing.VhdlParser, hdl, "entity_context", parse_big_files=False
+                    )
                     package_name = vhdl_parser_object.get("package_name")
                     entity_name = vhdl_parser_object.get("entity_name")
                     architecture_name = vhdl_parser_object.get("architecture_name")
@@ -74,7 +76,9 @@ class GenerateFlipflopStat:
                         )
                 else:
                     # Verilog file
-                    verilog_parser_object = verilog_parsing.VerilogParser(hdl, "module", parse_big_files=False)
+                    verilog_parser_object = parse_cache.ParseCache.get_parse_result(
+                        verilog_parsing.VerilogParser, hdl, "module", parse_big_files=False
+                    )
                     _, _, _, signals_clocked, signals_clocked_generate_condition_lists = self.__get_signals(
                         verilog_parser_object
                     )
@@ -2,16 +2,43 @@
 Support class
 """
 
+import collections
 import os
 import re
 from tkinter import messagebox
 
+from codegen import hdl_manifest
 from elements import symbol_instance
 
 
 class HdlGenerateFunctions:
     """Contains a collection of methods needed for HDL generation."""
 
+    batch_mode = False  # Set by hdl_generate_batch, then messages are printed instead of being shown in a dialog.
+    # split_declaration is called for the same declarations again and again (for each wire, signal-name and port),
+    # so its results are cached. The result is a tuple of strings, so it cannot be changed by a caller:
+    split_declaration_cache = collections.OrderedDict()  # {(declaration, language): result}, least recently used first
+    # An entry needs about 500 bytes (see benchmarks/bench_split_declaration.py), so the cache needs at most about
+    # 5 MB. A schematic has 1 declaration for each signal name and port, so 10000 entries hold the declarations
+    # of all modules of a big hierarchy, which are split again at each HDL generation through the hierarchy:
+    split_declaration_cache_max_entries = 10000
+
+    @classmethod
+    def show_error(cls, title, message):
+        """Shows an error message in a dialog or prints it, when HDL is generated in batch mode."""
+        if cls.batch_mode:
+            print(title + ": " + message)
+        else:
+            messagebox.showerror(title, message)
+
+    @classmethod
+    def show_warning(cls, title, message):
+        """Shows a warning in a dialog or prints it, when HDL is generated in batch mode."""
+        if cls.batch_mode:
+            print(title + ": " + message)
+        else:
+            messagebox.showwarning(title, message)
+
     @classmethod
     def indent_identically(cls, character, old_list):
         """Moves the part of the string after the character to the same positions in all strings of old_list."""
@@ -32,6 +59,19 @@ class HdlGenerateFunctions:
     @classmethod
     def split_declaration(cls, signal_declaration, language):
         """Splits a signal declaration into sname, sub_range, type, comment, initialization, record_slice."""
+        key = (signal_declaration, language)
+        result = cls.split_declaration_cache.get(key)
+        if result is not None:
+            cls.split_declaration_cache.move_to_end(key)
+            return result
+        result = cls._split_declaration(signal_declaration, language)
+        cls.split_declaration_cache[key] = result
+        if len(cls.split_declaration_cache) > cls.split_declaration_cache_max_entries:
+            cls.split_declaration_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def _split_declaration(cls, signal_declaration, language):
         if language == "VHDL":
             # Examples of VHDL signal declarations at a wire:
             # signal-name                : std_logic_vector(7 downto 0) := X"77" -- complete range is used
@@ -240,47 +280,51 @@ class HdlGenerateFunctions:
         )
 
     @classmethod
-    def hdl_must_be_generated(cls, path_name, hdlfilename, hdlfilename_architecture, show_message):
-        """Checks if HDL must be generated by comparing the modification times of the files."""
+    def hdl_must_be_generated(
+        cls, path_name, hdlfilename, hdlfilename_architecture, show_message, architecture_name=""
+    ):
+        """Checks if HDL must be generated by comparing the content hashes or the modification times of the files."""
         if not os.path.isfile(path_name):
             _, name_of_file = os.path.split(path_name)
             if name_of_file.endswith(".hse"):
-                messagebox.showerror(
+                HdlGenerateFunctions.show_error(
                     "Error in HDL-SCHEM-Editor", "The HDL-SCHEM-Editor project file " + path_name + " is missing."
                 )
             else:
-                messagebox.showerror(
+                HdlGenerateFunctions.show_error(
                     "Error in HDL-SCHEM-Editor", "The HDL-FSM-Editor project file " + path_name + " is missing."
                 )
             return True
         if not os.path.isfile(hdlfilename):
             if show_message:
-                messagebox.showerror("Error in HDL-SCHEM-Editor", "The file " + hdlfilename + " is missing.")
-            return True
-        if os.path.getmtime(hdlfilename) < os.path.getmtime(path_name):
-            if show_message:
-                messagebox.showerror(
-                    "Error in HDL-SCHEM-Editor",
-                    "The file\n" + hdlfilename + "\nis older than\n" + path_name + "\nPlease generate HDL again.",
-                )
+                HdlGenerateFunctions.show_error("Error in HDL-SCHEM-Editor", "The file " + hdlfilename + " is missing.")
             return True
+        hdl_file_names = [hdlfilename]
         if hdlfilename_architecture is not None:
             if not os.path.isfile(hdlfilename_architecture):
                 if show_message:
-                    messagebox.showerror(
+                    HdlGenerateFunctions.show_error(
                         "Error in HDL-SCHEM-Editor",
                         "The architecture file " + hdlfilename_architecture + " is missing.",
                     )
                 return True
-            if os.path.getmtime(hdlfilename_architecture) < os.path.getmtime(path_name):
+            hdl_file_names.append(hdlfilename_architecture)
+        hdl_is_up_to_date = hdl_manifest.HdlManifest.hdl_is_up_to_date(path_name, architecture_name, hdl_file_names)
+        if hdl_is_up_to_date is not None:  # The manifest knows the design, so the modification times are not needed.
+            if not hdl_is_up_to_date and show_message:
+                HdlGenerateFunctions.show_error(
+                    "Error in HDL-SCHEM-Editor",
+                    "The HDL was not generated from the actual version of\n"
+                    + path_name
+                    + "\nPlease generate HDL again.",
+                )
+            return not hdl_is_up_to_date
+        for hdl_file_name in hdl_file_names:
+            if os.path.getmtime(hdl_file_name) < os.path.getmtime(path_name):
                 if show_message:
-                    messagebox.showerror(
+                    HdlGenerateFunctions.show_error(
                         "Error in HDL-SCHEM-Editor",
-                        "The file\n"
-                        + hdlfilename_architecture
-                        + "\nis older than\n"
-                        + path_name
-                        + "\nPlease generate HDL again.",
+                        "The file\n" + hdl_file_name + "\nis older than\n" + path_name + "\nPlease generate HDL again.",
                     )
                 return True
         return False
@@ -3,7 +3,6 @@ Generate the content of a Verilog module
 """
 
 import re
-from tkinter import messagebox
 
 from codegen import hdl_generate_functions
 from gui import link_dictionary
@@ -160,7 +159,7 @@ class GenerateModuleContent:
             if component_language_dict[entity_name] == "VHDL":
                 # Translate into Verilog:
                 if instance_name_def not in generic_mapping_dict:
-                    messagebox.showerror(
+                    hdl_generate_functions.HdlGenerateFunctions.show_error(
                         "Error in HDL-SCHEM-Editor",
                         "The instance name "
                         + instance_name_without_comment
@@ -171,7 +170,7 @@ class GenerateModuleContent:
                 generic_mapping = re.sub("--", "//", generic_mapping)
             else:
                 if instance_name_def not in generic_mapping_dict:
-                    messagebox.showerror(
+                    hdl_generate_functions.HdlGenerateFunctions.show_error(
                         "Error in HDL-SCHEM-Editor",
                         "The instance name "
                         + instance_name_without_comment
@@ -4,13 +4,13 @@ Afterwards the schematic elements are sorted based on the priorities found.
 Sorting takes hierarchical generate-elements into account.
 """
 
-from tkinter import messagebox
+from codegen import enclosure_index, hdl_generate_functions
 
 
 class SortElements:
     """This class looks into the schematic and sorts the elements regarding their priority"""
 
-    def __init__(self, notebook, design, write_to_file):
+    def __init__(self, design, write_to_file):
         self.design = design
         self.sorted_canvas_ids_for_hdl = []
         elements_dictionary = design.create_schematic_elements_dictionary()
@@ -21,7 +21,7 @@ class SortElements:
         # {"prio": <number>, "type": <"Generate"|"Block"|"Instance">, "coords": [n1, n2, n3, n4], "hdl": <code>},
         #  ...
         # }
-        enclosed_dictionary = self.__create_enclosed_dictionary(elements_dictionary, notebook)
+        enclosed_dictionary = self.__create_enclosed_dictionary(elements_dictionary)
         # The enclosed_dictionary describes which Canvas-IDs are enclosed by generate rectangles.
         # Some Canvas-IDs may be element of several lists, when hierarchical generates are used.
         # Structure of enclosed_dictionary:
@@ -32,8 +32,14 @@ class SortElements:
         canvas_ids_of_top_elements = self.__create_list_of_not_enclosed_canvas_ids(
             elements_dictionary, enclosed_dictionary, write_to_file
         )
+        number_of_enclosing_generates = {}
+        for enclosed_elements in enclosed_dictionary.values():
+            for enclosed_element in enclosed_elements:
+                number_of_enclosing_generates[enclosed_element] = (
+                    number_of_enclosing_generates.get(enclosed_element, 0) + 1
+                )
         self.__remove_ambiguity_from_enclosed_dictionary(
-            canvas_ids_of_top_elements, elements_dictionary, enclosed_dictionary
+            canvas_ids_of_top_elements, elements_dictionary, enclosed_dictionary, number_of_enclosing_generates
         )
         self.__sort_enclosed_dictionary(enclosed_dictionary, elements_dictionary, write_to_file)
         self.__expand_generates(canvas_ids_of_top_elements, enclosed_dictionary)
@@ -43,36 +49,50 @@ class SortElements:
 
         return self.sorted_canvas_ids_for_hdl
 
-    def __create_enclosed_dictionary(self, elements_dictionary, notebook):
+    def __create_enclosed_dictionary(self, elements_dictionary):
+        # The enclosed elements are determined from the rectangles stored in the design, so no canvas is needed:
+        index_of_rectangles = None
         enclosed_dictionary = {}
         for schematic_element_canvas_id in elements_dictionary:
             if elements_dictionary[schematic_element_canvas_id]["type"] == "generate_frame":
-                enclosed_elements = notebook.diagram_tab.get_enclosed_elements(
-                    elements_dictionary[schematic_element_canvas_id]["coords"]
-                )
-                enclosed_dictionary[schematic_element_canvas_id] = enclosed_elements
+                if index_of_rectangles is None:
+                    index_of_rectangles = enclosure_index.EnclosureIndex(self.design.get_rectangles_of_hdl_elements())
+                enclosed_dictionary[schematic_element_canvas_id] = [
+                    canvas_id
+                    for canvas_id in index_of_rectangles.get_canvas_ids_enclosed_by(
+                        elements_dictionary[schematic_element_canvas_id]["coords"]
+                    )
+                    if canvas_id != schematic_element_canvas_id
+                ]
         return enclosed_dictionary
 
     def __create_list_of_not_enclosed_canvas_ids(self, elements_dictionary, enclosed_dictionary, write_to_file):
-        canvas_ids_of_top_elements = list(elements_dictionary)
-        # print("canvas_ids_of_top_elements1 =", canvas_ids_of_top_elements)
         # Remove all IDs whose symbol is enclosed in a generate-frame:
-        for _, enclosed_elements in enclosed_dictionary.items():
-            for enclosed_element in enclosed_elements:
-                if enclosed_element in canvas_ids_of_top_elements:
-                    canvas_ids_of_top_elements.remove(enclosed_element)
+        all_enclosed_elements = set()
+        for enclosed_elements in enclosed_dictionary.values():
+            all_enclosed_elements.update(enclosed_elements)
+        canvas_ids_of_top_elements = [
+            canvas_id for canvas_id in elements_dictionary if canvas_id not in all_enclosed_elements
+        ]
         canvas_ids_of_top_elements = self.__sort_canvas_ids(
             canvas_ids_of_top_elements, elements_dictionary, write_to_file
         )
         return canvas_ids_of_top_elements
 
-    def __remove_ambiguity_from_enclosed_dictionary(self, canvas_ids, elements_dictionary, enclosed_dictionary):
+    def __remove_ambiguity_from_enclosed_dictionary(
+        self, canvas_ids, elements_dictionary, enclosed_dictionary, number_of_enclosing_generates
+    ):
         for canvas_id_of_this_generate in canvas_ids:
             if elements_dictionary[canvas_id_of_this_generate]["type"] == "generate_frame":
-                self.__fix_enclosed_dictionary(canvas_id_of_this_generate, enclosed_dictionary)
+                self.__fix_enclosed_dictionary(
+                    canvas_id_of_this_generate, enclosed_dictionary, number_of_enclosing_generates
+                )
                 canvas_ids_of_next_generate_level = enclosed_dictionary[canvas_id_of_this_generate]
                 self.__remove_ambiguity_from_enclosed_dictionary(
-                    canvas_ids_of_next_generate_level, elements_dictionary, enclosed_dictionary
+                    canvas_ids_of_next_generate_level,
+                    elements_dictionary,
+                    enclosed_dictionary,
+                    number_of_enclosing_generates,
                 )
 
     def __sort_enclosed_dictionary(self, enclosed_dictionary, elements_dictionary, write_to_file):
@@ -92,32 +112,32 @@ class SortElements:
                 self.__expand_generates(enclosed_dictionary[canvas_id_top], enclosed_dictionary)
                 self.sorted_canvas_ids_for_hdl.append("end generate " + str(canvas_id_top))
 
-    def __fix_enclosed_dictionary(self, current_generate_canvas_id, enclosed_dictionary):
-        enclosed_of_this_generate = enclosed_dictionary[
-            current_generate_canvas_id
-        ]  # Contains all elements through all included generates.
-        for generate_canvas_id, enclosed_elements_of_other_generate in enclosed_dictionary.items():
-            if generate_canvas_id != current_generate_canvas_id:  # Look only into all other generates.
-                for enclosed_element in enclosed_elements_of_other_generate:
-                    if enclosed_element in enclosed_of_this_generate:
-                        enclosed_of_this_generate.remove(
-                            enclosed_element
-                        )  # Remove all the enclosed elements which are enclosed by other generates.
+    def __fix_enclosed_dictionary(self, current_generate_canvas_id, enclosed_dictionary, number_of_enclosing_generates):
+        # The list of this generate contains all elements through all included generates.
+        # Remove all the enclosed elements which are also enclosed by other generates.
+        # number_of_enclosing_generates tells for each element in how many lists it still is, so the other lists
+        # must not be searched:
+        enclosed_of_this_generate = []
+        for enclosed_element in enclosed_dictionary[current_generate_canvas_id]:
+            if number_of_enclosing_generates[enclosed_element] > 1:
+                number_of_enclosing_generates[enclosed_element] -= 1
+            else:
+                enclosed_of_this_generate.append(enclosed_element)
         enclosed_dictionary[current_generate_canvas_id] = enclosed_of_this_generate
 
     def __sort_canvas_ids(self, list_of_canvas_ids, elements_dictionary, write_to_file):
         canvas_id_dict_with_prio = {}
         canvas_id_list_without_prio = []
-        prio_check_list = []
+        prio_check_list = set()
         prio_check_failed = False
         for canvas_id in list_of_canvas_ids:
             if elements_dictionary[canvas_id]["prio"] != -1:
                 if elements_dictionary[canvas_id]["prio"] not in prio_check_list:
-                    prio_check_list.append(elements_dictionary[canvas_id]["prio"])
+                    prio_check_list.add(elements_dictionary[canvas_id]["prio"])
                 else:
                     prio_check_failed = True
                     if write_to_file:
-                        messagebox.showerror(
+                        hdl_generate_functions.HdlGenerateFunctions.show_error(
                             "Error in HDL-SCHEM-Editor",
                             "There are 2 elements in the schematic "
                             + self.design.get_module_name()
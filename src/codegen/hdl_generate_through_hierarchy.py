@@ -1,5 +1,8 @@
 """
 This class creates HDL for a hierachical design through all hierarchies.
+Sub-modules which are not opened in a window are read by design_metadata. A withdrawn window is only opened for such
+a sub-module, when HDL must be generated for it. When only the link-dictionary is filled (write_to_file=False),
+the HDL files of such a sub-module are registered at the link-dictionary, which opens the window when a link is needed.
 """
 
 import json
@@ -7,9 +10,9 @@ import subprocess
 from datetime import datetime
 from tkinter import messagebox
 
-from codegen import hdl_generate, hdl_generate_functions
-from data_io import file_write
-from gui import schematic_window
+from codegen import hdl_generate, hdl_generate_functions, hdl_manifest
+from data_io import design_metadata, file_write
+from gui import link_dictionary, schematic_window
 
 
 class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by update_hdl_tab_from().
@@ -33,7 +36,7 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
             self.window.update_idletasks()  # Update to show the messages-tab before the generation starts.
 
         self.opened_designs_list = []  # Prepare a list to be able to handle recursive hierarchies.
-        self._generate_for_window(window)
+        self._generate_for_design(window.design, window)
 
         if write_to_file:
             self.window.notebook_top.log_tab.log_frame_text.insert_line(
@@ -41,17 +44,21 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
             )
             self.window.lift()  # Keeps the correct window at top
 
-    def _generate_for_window(self, sub_window):
-        self._generate_hdl_for_this_schematic(sub_window)
-        self._generate_hdl_for_all_symbols_in_this_schematic(sub_window)
+    def _generate_for_design(self, design, sub_window):
+        # sub_window is None, when the design is not opened in a window and was read by design_metadata.
+        self._generate_hdl_for_this_schematic(design, sub_window)
+        self._generate_hdl_for_all_symbols_in_this_schematic(design, sub_window)
 
-    def _generate_hdl_for_this_schematic(self, sub_window):
-        generate_path_value = sub_window.design.get_generate_path_value()
-        module_name = sub_window.design.get_module_name()
-        architecture_name = sub_window.design.get_architecture_name()
-        path_name = sub_window.design.get_path_name()
-        if sub_window.design.get_language() == "VHDL":
-            if sub_window.design.get_number_of_files() == 1:
+    def _design_is_changed(self, sub_window):
+        return sub_window is not None and sub_window.title().endswith("*")
+
+    def _generate_hdl_for_this_schematic(self, design, sub_window):
+        generate_path_value = design.get_generate_path_value()
+        module_name = design.get_module_name()
+        architecture_name = design.get_architecture_name()
+        path_name = design.get_path_name()
+        if design.get_language() == "VHDL":
+            if design.get_number_of_files() == 1:
                 hdlfilename = generate_path_value + "/" + module_name + ".vhd"
                 hdlfilename_architecture = None
             else:
@@ -60,15 +67,27 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
         else:
             hdlfilename = generate_path_value + "/" + module_name + ".v"
             hdlfilename_architecture = None
+        if sub_window is None:
+            link_dictionary.LinkDictionary.link_dict_reference.add_design_without_window(
+                [hdlfilename, hdlfilename_architecture], path_name, architecture_name
+            )
+            if not self.write_to_file:
+                return
         if (
             self.force
             or not self.write_to_file  # independent from the following check in the next line
             or hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
-                path_name, hdlfilename, hdlfilename_architecture, show_message=False
+                path_name,
+                hdlfilename,
+                hdlfilename_architecture,
+                show_message=False,
+                architecture_name=architecture_name,
             )
-            or sub_window.title().endswith("*")
+            or self._design_is_changed(sub_window)
         ):
-            hdl_generate.GenerateHDL(
+            if sub_window is None:
+                sub_window = schematic_window.SchematicWindow.open_subwindow(self.root, path_name, architecture_name)
+            hdl_generator = hdl_generate.GenerateHDL(
                 self,
                 sub_window.notebook_top,
                 sub_window.design,
@@ -78,9 +97,11 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
                 hierarchical_generate=True,
             )
             if not self.generation_failed and self.write_to_file:
-                self.window.notebook_top.log_tab.log_frame_text.insert_line(
-                    "HDL was generated: " + module_name + "\n", state_after_insert="disabled"
-                )
+                if hdl_generator.get_changed_files():
+                    message = "HDL was generated: " + module_name + "\n"
+                else:
+                    message = "HDL was generated, the HDL files are unchanged: " + module_name + "\n"
+                self.window.notebook_top.log_tab.log_frame_text.insert_line(message, state_after_insert="disabled")
                 self.window.notebook_top.log_tab.insert_line_in_log(
                     self.sensitivity_message, state_after_insert="disabled"
                 )
@@ -91,8 +112,8 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
                 "HDL is up to date: " + module_name + "\n", state_after_insert="disabled"
             )
 
-    def _generate_hdl_for_all_symbols_in_this_schematic(self, sub_window):
-        symbol_definitions = sub_window.design.get_symbol_definitions()
+    def _generate_hdl_for_all_symbols_in_this_schematic(self, design, sub_window):
+        symbol_definitions = design.get_symbol_definitions()
         symbol_generation_ready = []
         for symbol_definition in symbol_definitions:
             if (
@@ -100,7 +121,7 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
             ):  # Avoid multiple generation of the same symbol, when it is used more than once in the schematic.
                 if symbol_definition["filename"].endswith(".hse"):
                     if (
-                        symbol_definition["entity_name"]["name"] != sub_window.design.get_module_name()
+                        symbol_definition["entity_name"]["name"] != design.get_module_name()
                     ):  # Break generation loop at recursive instantiations.
                         self._generate_hdl_for_hse_symbol(symbol_definition)
                 elif symbol_definition["filename"].endswith(".hfe") and self.write_to_file:
@@ -123,18 +144,21 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
                     file_write.FileWrite(
                         sub_window, sub_window.design, "save"
                     )  # Write to guarantee consistency between source and HDL.
-        if not sub_window:  # will happen when link-dictionary is filled the first time.
-            architecture_name = symbol_definition["architecture_name"]
-            sub_window = schematic_window.SchematicWindow.open_subwindow(
-                self.root, symbol_definition["filename"], architecture_name
+        if sub_window is None:  # will happen when link-dictionary is filled the first time.
+            design = design_metadata.DesignMetadata.get_design(
+                symbol_definition["filename"], symbol_definition["architecture_name"]
             )
-        sub_module_name = sub_window.design.get_module_name()
+            if design is None:  # The design file could not be read.
+                return
+        else:
+            design = sub_window.design
+        sub_module_name = design.get_module_name()
         if (
             sub_module_name != ""  # File Read was a success, so HDL can be generated.
             and sub_module_name not in self.opened_designs_list  # Continue only if no recursive loop exists.
         ):
             self.opened_designs_list.append(sub_module_name)
-            self._generate_for_window(sub_window)
+            self._generate_for_design(design, sub_window)
 
     def _generate_hdl_for_hfe_symbol(self, sub_window, symbol_definition):
         # Update parameters which might have been changed since instantiation of the symbol:
@@ -164,7 +188,7 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
             or hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
                 path_name, hdlfilename, hdlfilename_architecture=None, show_message=False
             )
-            or sub_window.title().endswith("*")
+            or self._design_is_changed(sub_window)
         ):
             command_array = [
                 self.window.design.get_hfe_cmd(),
@@ -206,6 +230,20 @@ class HdlGenerateHierarchy:  # Called by menu_bar (for generate HDL) or by updat
                     "Error in HDL-SCHEM-Editor", "PermissionError caused by compile command:\n" + command_string
                 )
                 return
+            returncode = process.wait()  # The HDL files are complete, when HDL-FSM-Editor has terminated.
+            if returncode != 0:
+                # The old HDL files must not be recorded as up to date:
+                hdl_manifest.HdlManifest.forget_generated_hdl(path_name, [hdlfilename])
+                self.window.notebook_top.log_tab.log_frame_text.insert_line(
+                    "HDL generation failed: "
+                    + symbol_definition["entity_name"]["name"]
+                    + " (HDL-FSM-Editor exit code "
+                    + str(returncode)
+                    + ")\n",
+                    state_after_insert="disabled",
+                )
+                return
+            hdl_manifest.HdlManifest.record_generated_hdl(path_name, "", [hdlfilename])
             self.window.notebook_top.log_tab.log_frame_text.insert_line(
                 "HDL was generated: " + symbol_definition["entity_name"]["name"] + "\n", state_after_insert="disabled"
             )
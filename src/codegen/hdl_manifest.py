@@ -0,0 +1,136 @@
+"""
+The HDL manifest stores for each module a hash of its normalized design dictionary and the hashes of its
+generated HDL files. There is one manifest per project, it is stored as JSON file in the directory of the
+generated HDL files. It is used to decide if HDL must be generated again:
+When the design file was only written again (save without changes, git checkout, ...), its modification time
+is newer than the modification time of the HDL files, but the hash of its content did not change.
+So HDL generation and compile can be skipped in this case.
+The manifest is only an optimization: When it has no entry for a design, the modification times are used.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_FILE_NAME = "hdl_schem_editor_manifest.json"
+
+# These keys of the design dictionary only configure the GUI or the compile and have no influence on the HDL:
+_KEYS_WITHOUT_INFLUENCE_ON_HDL = (
+    "visible_center_point",
+    "sash_positions",
+    "edit_cmd",
+    "edit_jmp",
+    "hfe_cmd",
+    "working_directory",
+    "compile_cmd",
+    "compile_hierarchy_cmd",
+    "regex_message_find",
+    "regex_file_name_quote",
+    "regex_file_line_number_quote",
+)
+
+
+class HdlManifest:
+    """Stores and checks the hashes of design files and of the HDL files generated from them."""
+
+    @classmethod
+    def record_generated_hdl(cls, path_name, architecture_name, hdl_file_names):
+        """Stores the hashes of the design file and of the HDL files after HDL was generated from the design file."""
+        architecture_name, design_hash = cls._get_design_hash(path_name, architecture_name)
+        if design_hash is None:
+            cls.forget_generated_hdl(path_name, hdl_file_names)
+            return
+        hdl_hashes = {}
+        for hdl_file_name in hdl_file_names:
+            hdl_hash = cls._get_file_hash(hdl_file_name)
+            if hdl_hash is None:
+                cls.forget_generated_hdl(path_name, hdl_file_names)
+                return
+            hdl_hashes[os.path.basename(hdl_file_name)] = hdl_hash
+        manifest_file_name = cls._get_manifest_file_name(hdl_file_names[0])
+        manifest = cls._read_manifest(manifest_file_name)
+        manifest[os.path.abspath(path_name)] = {
+            "architecture_name": architecture_name,
+            "design_hash": design_hash,
+            "hdl_hashes": hdl_hashes,
+        }
+        cls._write_manifest(manifest_file_name, manifest)
+
+    @classmethod
+    def forget_generated_hdl(cls, path_name, hdl_file_names):
+        """Removes the entry of a design file, used when HDL was generated from a design which is not saved."""
+        manifest_file_name = cls._get_manifest_file_name(hdl_file_names[0])
+        manifest = cls._read_manifest(manifest_file_name)
+        if manifest.pop(os.path.abspath(path_name), None) is not None:
+            cls._write_manifest(manifest_file_name, manifest)
+
+    @classmethod
+    def hdl_is_up_to_date(cls, path_name, architecture_name, hdl_file_names):
+        """Returns True or False, when the manifest has an entry for the design file, otherwise None.
+        Only if the design file and all HDL files still have the stored hashes, the HDL is up to date.
+        """
+        entry = cls._read_manifest(cls._get_manifest_file_name(hdl_file_names[0])).get(os.path.abspath(path_name))
+        if entry is None:
+            return None
+        architecture_name, design_hash = cls._get_design_hash(path_name, architecture_name)
+        if architecture_name != entry["architecture_name"] or design_hash != entry["design_hash"]:
+            return False  # design_hash is None, when the design file could not be read.
+        for hdl_file_name in hdl_file_names:
+            if cls._get_file_hash(hdl_file_name) != entry["hdl_hashes"].get(os.path.basename(hdl_file_name)):
+                return False
+        return True
+
+    @classmethod
+    def _get_design_hash(cls, path_name, architecture_name):
+        # The dictionary is normalized by selecting one architecture, by removing the keys without influence
+        # on the HDL and by sorting the keys, so that the formatting of the file has no influence on the hash.
+        # HDL-FSM-Editor files (.hfe) do not have architectures, their complete dictionary is used.
+        try:
+            with open(path_name, encoding="utf-8") as fileobject:
+                design_dictionary = json.load(fileobject)
+        except (OSError, ValueError):
+            return architecture_name, None
+        if "active__architecture" in design_dictionary:
+            if architecture_name == "" or architecture_name not in design_dictionary:
+                architecture_name = design_dictionary["active__architecture"]
+            design_dictionary = design_dictionary[architecture_name]
+        else:
+            architecture_name = design_dictionary.get("architecture_name", "")
+        normalized_dictionary = {
+            key: value for key, value in design_dictionary.items() if key not in _KEYS_WITHOUT_INFLUENCE_ON_HDL
+        }
+        normalized_text = json.dumps(normalized_dictionary, sort_keys=True, separators=(",", ":"), default=str)
+        return architecture_name, hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _get_file_hash(cls, file_name):
+        try:
+            with open(file_name, "rb") as fileobject:
+                return hashlib.sha256(fileobject.read()).hexdigest()
+        except OSError:
+            return None
+
+    @classmethod
+    def _get_manifest_file_name(cls, hdl_file_name):
+        return os.path.join(os.path.dirname(hdl_file_name), MANIFEST_FILE_NAME)
+
+    @classmethod
+    def _read_manifest(cls, manifest_file_name):
+        try:
+            with open(manifest_file_name, encoding="utf-8") as fileobject:
+                manifest = json.load(fileobject)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    @classmethod
+    def _write_manifest(cls, manifest_file_name, manifest):
+        # The manifest is written into a temporary file first and then renamed, so that a parallel batch run
+        # never reads a partly written manifest. An entry lost by parallel writes only causes a new generation.
+        temporary_file_name = manifest_file_name + "." + str(os.getpid()) + ".tmp"
+        try:
+            with open(temporary_file_name, "w", encoding="utf-8") as fileobject:
+                fileobject.write(json.dumps(manifest, indent=4))
+            os.replace(temporary_file_name, manifest_file_name)
+        except OSError:
+            pass
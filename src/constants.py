@@ -6,3 +6,6 @@ VERSION = "Version 5.3"
 HEADER_STRING = "HDL-SCHEM-Editor\n" + VERSION + "\nCreated by Matthias Schweikart\nContact: matthias.schweikart@gmx.de"
 SYMBOL_DEFAULT_COLOR = "green2"
 BLOCK_DEFAULT_COLOR = "lemon chiffon"
+UNDO_STACK_DEPTH = 1000  # Maximum number of entries in the undo/redo stack of a schematic window.
+UNDO_STACK_MEMORY_MB = 200  # Maximum memory of the undo/redo stack of a schematic window.
+BACKUP_INTERVAL = 5  # Seconds between 2 writes of the backup file of a changed design.
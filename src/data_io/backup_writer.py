@@ -0,0 +1,87 @@
+"""
+Write the backup file (<design-file>.tmp) of a schematic window, which is used to recover the changes after a crash.
+A backup is requested at each change of the design, but the backup is written only once in BACKUP_INTERVAL seconds,
+so that many changes in a short time (for example when a selection is dragged) cause only 1 write.
+In the tkinter thread only a snapshot of immutable data is taken (the strings of the current undo stack entry).
+The design dictionary is created from the snapshot, converted into JSON and written by a worker thread.
+The worker writes into a temporary file, which is renamed afterwards, so the backup file is never incomplete.
+The backup file is always written in the compact format, as it is only read back after a crash.
+"""
+
+import os
+import threading
+
+import constants
+from data_io import design_data_selector, design_file_format
+
+
+class BackupWriter:
+    """This class writes the backup file of a schematic window at most once in BACKUP_INTERVAL seconds."""
+
+    def __init__(self, window):
+        self.window = window
+        self.after_id = None  # Identifier of the scheduled backup, None if no backup is scheduled.
+        self.worker = None
+        self.lock = threading.Lock()  # Is held by the worker while it writes the backup file.
+        self.backup_number = 0  # Is incremented by cancel(), so that a running worker does not write anymore.
+
+    def request_backup(self):
+        """Schedules a backup, if there is not yet a scheduled one. Called at each change of the design."""
+        if self.after_id is None:
+            self.after_id = self.window.after(constants.BACKUP_INTERVAL * 1000, self._write_backup)
+
+    def flush(self):
+        """Writes a scheduled backup immediately and waits until the backup file is written. Called at close."""
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+            path_name_backup, backup_snapshot = self._get_backup_data()
+            if path_name_backup != "":
+                self._wait_for_worker()
+                self._write_to_file(path_name_backup, backup_snapshot, self.backup_number)
+        self._wait_for_worker()
+
+    def cancel(self):
+        """Drops a scheduled or running backup. Must be called before the backup file is removed."""
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+        with self.lock:  # When the lock is acquired, a running worker has renamed its file or will not rename it.
+            self.backup_number += 1
+
+    def _write_backup(self):
+        self.after_id = None
+        path_name_backup, backup_snapshot = self._get_backup_data()
+        if path_name_backup == "":
+            return
+        self._wait_for_worker()  # Only 1 worker at a time, so that an older backup never overwrites a newer one.
+        self.worker = threading.Thread(
+            target=self._write_to_file, args=(path_name_backup, backup_snapshot, self.backup_number), daemon=True
+        )
+        self.worker.start()
+
+    def _get_backup_data(self):
+        path_name = self.window.design.get_path_name()
+        if path_name.startswith("unnamed") or not self.window.title().endswith("*"):
+            return "", None  # No ".tmp"-file shall be created, or the changes were already saved.
+        return path_name + ".tmp", self.window.design.get_backup_snapshot()
+
+    def _wait_for_worker(self):
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+
+    def _write_to_file(self, path_name_backup, backup_snapshot, backup_number):
+        design_dictionary = design_data_selector.DesignDataSelector.create_design_dictionary_from_backup_snapshot(
+            backup_snapshot
+        )
+        data = design_file_format.DesignFileFormat.dumps(design_dictionary, compact=True)
+        with self.lock:
+            if backup_number != self.backup_number:
+                return  # The backup was canceled, because the design was saved or the changes were discarded.
+            try:
+                with open(path_name_backup + ".part", "w", encoding="utf-8") as fileobject:
+                    fileobject.write(data)
+                os.replace(path_name_backup + ".part", path_name_backup)
+            except OSError as error:
+                print("HDL-SCHEM-Editor-Warning: Could not write backup file " + path_name_backup + ".", error)
@@ -1,12 +1,10 @@
 """Stores all data of one schematic window"""
 
-import copy
 import json
 import os
 
 import constants
-from codegen import hdl_generate
-from data_io import file_write
+from codegen import hdl_generate, hdl_generate_functions
 from elements import (
     block_insertion,
     generate_frame,
@@ -21,10 +19,24 @@ from gui import notebook_diagram_tab
 
 # import inspect
 
+# Only elements of these types have an influence on the port declarations:
+_TYPES_OF_CONNECTIVITY_ELEMENTS = ("input", "output", "inout", "wire", "signal-name")
+_TYPES_OF_NET_ELEMENTS = ("wire", "signal-name", "instance")
+# The ports are stored in one entry of the type index, so the port list keeps the order of the canvas dictionary:
+_PORT_TYPES = ("input", "output", "inout")
+
+
+def _get_index_type(element_type):
+    return "port" if element_type in _PORT_TYPES else element_type
+
 
 class DesignData:
     """This class stores all data of one schematic window"""
 
+    # Limits of the undo/redo stack, which can be changed in the configuration file .hdl-schem-editor.rc:
+    change_stack_max_depth = constants.UNDO_STACK_DEPTH
+    change_stack_max_memory = constants.UNDO_STACK_MEMORY_MB * 1024 * 1024  # in bytes (approximately)
+
     def __init__(self, root, schematic_window):
         """Initialize DesignData with the given root widget and schematic window."""
         self.root = root
@@ -65,10 +77,30 @@ class DesignData:
             "architecture_last_declarations": "",
         }
         self.canvas_dictionary = {}
+        # Indexes into canvas_dictionary, which are maintained together with canvas_dictionary:
+        # {<element type>: {canvas_id: None, ...}}, a dictionary is used as ordered set (ports have the type "port"):
+        self.canvas_ids_by_type = {}
+        self.signal_name_canvas_id_by_wire_tag = {}  # {<wire tag>: <canvas_id of the signal-name of the wire>}
+        self.wire_canvas_ids_by_wire_tag = {}  # {<wire tag>: {canvas_id: None, ...}}
+        # The net index is updated at each store or remove of a signal-name. The declaration of a stored signal-name
+        # is only split, when the next net is looked up, because highlighting is rare compared to editing:
+        self.signal_names_to_index = {}  # {canvas_id: None, ...} of the stored signal-names, which are not indexed yet.
+        self.net_of_signal_name = {}  # {<canvas_id of signal-name>: (<signal name>, <wire tag>)}
+        self.wire_tags_by_net = {}  # {<signal name>: {<wire tag>: <number of signal-names>, ...}}
+        # Which instance port is connected to which net is determined geometrically by create_declarations() for the
+        # complete design. So it is cached until a wire, signal-name or instance is changed. None means "must be
+        # determined":
+        self.instance_connections_by_net = None  # {<signal name>: [instance_connection_definition, ...]}
+        # The port declarations are determined by a connectivity analysis of the ports, wires and signal-names.
+        # They are cached, so that the analysis is not done at each stack push. None means "must be determined":
+        self.port_declarations = None
+        self.window_title_updates_are_suppressed = False  # True while all elements are deleted at Undo/Redo.
         self.sash_positions = {}
         self.change_stack = []
+        self.change_stack_memory = 0  # Sum of the memory of all stack entries (see _create_change_stack_entry).
+        self.change_stack_was_truncated = False  # True, when the oldest entries were removed because of the limits.
         self.change_stack.append(
-            self.create_design_dictionary()
+            self._create_change_stack_entry()
         )  # Put an empty design at the stack (needed for the undo of the first action).
         self.change_stack_pointer = 0
         self.last_stack_entry_was_caused_by_zoom = False
@@ -108,6 +140,8 @@ class DesignData:
     def store_new_language(self, var_name, signal_design_change):
         """Store the HDL language from var_name and optionally mark the design as changed."""
         self.language = var_name.get()
+        self.port_declarations = None
+        self._reset_net_index()
         if signal_design_change:
             if self.debug_stack:
                 print("store_new_language: update_window_title(written=False)")
@@ -213,6 +247,8 @@ class DesignData:
     def store_grid_size(self, grid_size, signal_design_change):
         """Store the grid size and optionally mark the design as changed."""
         self.grid_size = grid_size
+        self.port_declarations = None
+        self.instance_connections_by_net = None
         if signal_design_change:
             if self.debug_stack:
                 print("store_grid_size: update_window_title(written=False)")
@@ -247,7 +283,7 @@ class DesignData:
         self, canvas_id, reference, connector_type, location, orientation, push_design_to_stack, signal_design_change
     ):
         """Store an interface connector in the canvas dictionary."""
-        self.canvas_dictionary[canvas_id] = [reference, connector_type, location, orientation]
+        self._store_in_canvas_dictionary(canvas_id, [reference, connector_type, location, orientation])
         if signal_design_change:
             if self.debug_stack:
                 print("store_interface_in_canvas_dictionary: update_window_title(written=False)")
@@ -295,7 +331,7 @@ class DesignData:
                 fixed_tags.append(tag)
         tags = fixed_tags
 
-        self.canvas_dictionary[canvas_id] = [reference, "wire", coords, tags, arrow, width]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "wire", coords, tags, arrow, width])
         if signal_design_change:
             if self.debug_stack:
                 print("store_wire_in_canvas_dictionary: update_window_title(written=False)")
@@ -308,7 +344,7 @@ class DesignData:
 
     def store_dot_in_canvas_dictionary(self, canvas_id, reference, coords, push_design_to_stack):
         """Store a connection dot in the canvas dictionary."""
-        self.canvas_dictionary[canvas_id] = [reference, "dot", coords]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "dot", coords])
         self.add_change_to_stack(push_design_to_stack)
         if self.debug_stack:
             print("debug_stack: store_dot_in_canvas_dictionary")
@@ -317,7 +353,7 @@ class DesignData:
         self, canvas_id, reference, coords, angle, text, wire_tag, push_design_to_stack, signal_design_change
     ):
         """Store a signal name label in the canvas dictionary."""
-        self.canvas_dictionary[canvas_id] = [reference, "signal-name", coords, angle, text, wire_tag]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "signal-name", coords, angle, text, wire_tag])
         if signal_design_change:
             if self.debug_stack:
                 print("store_signal_name_in_canvas_dictionary: update_window_title(written=False)")
@@ -342,16 +378,10 @@ class DesignData:
         signal_design_change,
     ):
         """Store a block (comment/code block) in the canvas dictionary."""
-        self.canvas_dictionary[canvas_id] = [
-            reference,
-            "block",
-            rect_coords,
-            text_coords,
-            text,
-            object_tag,
-            rect_color,
-            number_of_lines_to_show,
-        ]
+        self._store_in_canvas_dictionary(
+            canvas_id,
+            [reference, "block", rect_coords, text_coords, text, object_tag, rect_color, number_of_lines_to_show],
+        )
         if signal_design_change:
             if self.debug_stack:
                 print("store_block_in_canvas_dictionary: update_window_title(written=False)")
@@ -364,7 +394,7 @@ class DesignData:
 
     def store_block_rectangle_in_canvas_dictionary(self, canvas_id, reference, push_design_to_stack):
         """Store the rectangle border of a block in the canvas dictionary."""
-        self.canvas_dictionary[canvas_id] = [reference, "block-rectangle"]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "block-rectangle"])
         self.add_change_to_stack(push_design_to_stack)
         if self.debug_stack:
             print("debug_stack: store_block_rectangle_in_canvas_dictionary")
@@ -374,7 +404,7 @@ class DesignData:
     ):
         """Store a symbol instance in the canvas dictionary (deep-copies the symbol definition)."""
         symbol_definition_copy = json.loads(json.dumps(symbol_definition))
-        self.canvas_dictionary[canvas_id] = [reference, "instance", symbol_definition_copy]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "instance", symbol_definition_copy])
         if signal_design_change:
             if self.debug_stack:
                 print("store_instance_in_canvas_dictionary: update_window_title(written=False)")
@@ -390,7 +420,7 @@ class DesignData:
     ):
         """Store a generate frame in the canvas dictionary (deep-copies the generate definition)."""
         generate_definition_copy = json.loads(json.dumps(generate_definition))
-        self.canvas_dictionary[canvas_id] = [reference, "generate_frame", generate_definition_copy]
+        self._store_in_canvas_dictionary(canvas_id, [reference, "generate_frame", generate_definition_copy])
         if signal_design_change:
             if self.debug_stack:
                 print("store_generate_frame_in_canvas_dictionary: update_window_title(written=False)")
@@ -426,9 +456,143 @@ class DesignData:
             print("store_regex_file_line_number_quote: update_window_title(written=False)")
         self.update_window_title(written=False)
 
+    def _store_in_canvas_dictionary(self, canvas_id, element_description_list):
+        """Store an element in the canvas dictionary and in the indexes into the canvas dictionary."""
+        if canvas_id in self.canvas_dictionary:
+            # An element which is stored again keeps its position in canvas_dictionary and in the type index:
+            self._remove_from_indexes(
+                canvas_id,
+                self.canvas_dictionary[canvas_id],
+                keep_type_index=_get_index_type(self.canvas_dictionary[canvas_id][1])
+                == _get_index_type(element_description_list[1]),
+            )
+        self.canvas_dictionary[canvas_id] = element_description_list
+        if element_description_list[1] in _TYPES_OF_CONNECTIVITY_ELEMENTS:
+            self.port_declarations = None
+        if element_description_list[1] in _TYPES_OF_NET_ELEMENTS:
+            self.instance_connections_by_net = None
+        self.canvas_ids_by_type.setdefault(_get_index_type(element_description_list[1]), {})[canvas_id] = None
+        if element_description_list[1] == "signal-name":
+            self.signal_name_canvas_id_by_wire_tag[element_description_list[5]] = canvas_id
+            self.signal_names_to_index[canvas_id] = None
+        elif element_description_list[1] == "wire":
+            for tag in element_description_list[3]:
+                if tag.startswith("wire_"):
+                    self.wire_canvas_ids_by_wire_tag.setdefault(tag, {})[canvas_id] = None
+
+    def _remove_from_indexes(self, canvas_id, element_description_list, keep_type_index=False):
+        if element_description_list[1] in _TYPES_OF_CONNECTIVITY_ELEMENTS:
+            self.port_declarations = None
+        if element_description_list[1] in _TYPES_OF_NET_ELEMENTS:
+            self.instance_connections_by_net = None
+        if not keep_type_index:
+            del self.canvas_ids_by_type[_get_index_type(element_description_list[1])][canvas_id]
+        if element_description_list[1] == "signal-name":
+            if self.signal_name_canvas_id_by_wire_tag.get(element_description_list[5]) == canvas_id:
+                del self.signal_name_canvas_id_by_wire_tag[element_description_list[5]]
+            self._remove_signal_name_from_net_index(canvas_id)
+        elif element_description_list[1] == "wire":
+            for tag in element_description_list[3]:
+                if tag.startswith("wire_") and canvas_id in self.wire_canvas_ids_by_wire_tag.get(tag, {}):
+                    del self.wire_canvas_ids_by_wire_tag[tag][canvas_id]
+                    if not self.wire_canvas_ids_by_wire_tag[tag]:
+                        del self.wire_canvas_ids_by_wire_tag[tag]
+
+    def get_signal_name_canvas_id(self, wire_tag):
+        """Return the canvas id of the signal-name of the wire with the given wire tag, None if there is none."""
+        return self.signal_name_canvas_id_by_wire_tag.get(wire_tag)
+
+    def get_wire_canvas_ids_of_net(self, signal_name):
+        """Return the canvas ids of all wires of the net with the given signal name."""
+        for canvas_id in self.signal_names_to_index:
+            signal_name_of_canvas_id, _, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.split_declaration(
+                self.canvas_dictionary[canvas_id][4], self.language
+            )
+            wire_tag = self.canvas_dictionary[canvas_id][5]
+            self.net_of_signal_name[canvas_id] = (signal_name_of_canvas_id, wire_tag)
+            wire_tags = self.wire_tags_by_net.setdefault(signal_name_of_canvas_id, {})
+            wire_tags[wire_tag] = wire_tags.get(wire_tag, 0) + 1
+        self.signal_names_to_index = {}
+        return [
+            canvas_id
+            for wire_tag in self.wire_tags_by_net.get(signal_name, {})
+            for canvas_id in self.wire_canvas_ids_by_wire_tag.get(wire_tag, {})
+        ]
+
+    def get_instance_connections_of_net(self, signal_name):
+        """Return the instance_connection_definitions of all instance ports, which are connected to the net."""
+        if self.instance_connections_by_net is None:
+            self.instance_connections_by_net = self._create_instance_connection_index()
+        return self.instance_connections_by_net.get(signal_name, [])
+
+    def _remove_signal_name_from_net_index(self, canvas_id):
+        if canvas_id in self.signal_names_to_index:
+            del self.signal_names_to_index[canvas_id]
+        elif canvas_id in self.net_of_signal_name:
+            signal_name, wire_tag = self.net_of_signal_name.pop(canvas_id)
+            wire_tags = self.wire_tags_by_net[signal_name]
+            wire_tags[wire_tag] -= 1
+            if wire_tags[wire_tag] == 0:
+                del wire_tags[wire_tag]
+                if not wire_tags:
+                    del self.wire_tags_by_net[signal_name]
+
+    def _reset_net_index(self):
+        # All signal-names must be indexed again, because their declarations are split in another way now:
+        self.signal_names_to_index = dict.fromkeys(self.get_canvas_ids_of_type("signal-name"))
+        self.net_of_signal_name = {}
+        self.wire_tags_by_net = {}
+        self.instance_connections_by_net = None
+
+    def _create_instance_connection_index(self):
+        instance_connections_by_net = {}
+        _, wire_location_list, _, symbol_definition_list, _ = self.get_connection_data()
+        all_pins_definition_list, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.extract_data_from_symbols(
+            symbol_definition_list
+        )
+        # Each instance_connection_definition describes the signal ("declaration"), which is connected to a port
+        # ("port_declaration") of an instance ("canvas_id" of its rectangle):
+        _, _, _, _, instance_connection_definitions = hdl_generate.GenerateHDL.create_declarations(
+            self.language, self.grid_size, all_pins_definition_list, wire_location_list
+        )
+        for instance_connection_definition in instance_connection_definitions:
+            signal_name, _, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.split_declaration(
+                instance_connection_definition["declaration"], self.language
+            )
+            instance_connections_by_net.setdefault(signal_name, []).append(instance_connection_definition)
+        return instance_connections_by_net
+
+    def get_cached_port_declarations(self):
+        """Return the cached port declarations, None if they must be determined again."""
+        return self.port_declarations
+
+    def restore_cached_port_declarations(self, port_declarations):
+        """Restore the cached port declarations after a change which cannot modify them (used at zoom)."""
+        self.port_declarations = port_declarations
+
+    def _get_port_declarations(self):
+        if self.port_declarations is None:
+            (
+                connector_location_list,  # List of dicts {"type" : "input"|"output"|"inout", "coords" : [x1, ...]}
+                wire_location_list,  # List of dictionaries {"declaration" : <string>, "coords" : [x1, y1, ...]}
+                _,  # Dictionary {"Canvas-ID": <Text of block>, "Canvas-ID": <Text of block>, ...}
+                _,  # List: [symbol_definition1, symbol_definition2, ...]
+                _,  # List: [generate_definition1, generate_definition2, ...]
+            ) = self.get_connection_data()
+            input_decl, output_decl, inout_decl, _, _ = hdl_generate.GenerateHDL.create_declarations(
+                self.language, self.grid_size, connector_location_list, wire_location_list
+            )
+            self.port_declarations = input_decl + output_decl + inout_decl
+        return list(self.port_declarations)
+
+    def get_canvas_ids_of_type(self, element_type):
+        """Return the canvas IDs of all elements of the given type in the order they were stored first.
+        The element type "port" returns the canvas IDs of all inputs, outputs and inouts."""
+        return self.canvas_ids_by_type.get(element_type, {}).keys()
+
     def remove_canvas_item_from_dictionary(self, canvas_id, push_design_to_stack):
         """Remove a canvas item from the canvas dictionary and mark the design as changed."""
-        del self.canvas_dictionary[canvas_id]
+        self._remove_from_indexes(canvas_id, self.canvas_dictionary.pop(canvas_id))
         self.update_window_title(written=False)
         self.add_change_to_stack(
             push_design_to_stack
@@ -436,8 +600,14 @@ class DesignData:
         if self.debug_stack:
             print("debug_stack: remove_canvas_item_from_dictionary: update_window_title(written=False)")
 
+    def suppress_window_title_updates(self, suppress):
+        """Suppress the window title update of each single element change during a bulk update."""
+        self.window_title_updates_are_suppressed = suppress
+
     def update_window_title(self, written):
         """Update the window title to show the file name and whether unsaved changes exist."""
+        if self.window_title_updates_are_suppressed:
+            return
         name_of_dir, name_of_file = os.path.split(self.path_name)
         if not written:
             self.window.title(name_of_file + " (" + name_of_dir + ") *")
@@ -446,20 +616,16 @@ class DesignData:
 
     def create_design_dictionary(self):
         """Create and return a serializable snapshot of the entire current design state."""
-        (
-            connector_location_list,  # List of dicts {"type" : "input"|"output"|"inout", "coords" : [x1, y1, ...]}
-            wire_location_list,  # List of dictionaries {"declaration" : <string>, "coords" : [x1, y1, ...]}
-            _,  # Dictionary {"Canvas-ID": <Text of block>, "Canvas-ID": <Text of block>, ...}
-            _,  # List: [symbol_definition1, symbol_definition2, ...]
-            _,  # List: [generate_definition1, generate_definition2, ...]
-        ) = self.get_connection_data()
-        input_decl, output_decl, inout_decl, _, _ = hdl_generate.GenerateHDL.create_declarations(
-            self.language, self.grid_size, connector_location_list, wire_location_list
-        )
+        # The JSON round trip creates a copy, which shares no objects with the design data,
+        # which is necessary because for example generate_frame is stored as reference.
+        return json.loads(json.dumps(self._collect_design_dictionary()))
+
+    def _collect_design_dictionary(self):
+        # The returned dictionary still contains references to the objects stored in the design data.
         design_dictionary = {}
         design_dictionary["module_name"] = self.module_name
         design_dictionary["architecture_name"] = self.architecture_name
-        design_dictionary["port_declarations"] = input_decl + output_decl + inout_decl
+        design_dictionary["port_declarations"] = self._get_port_declarations()
         design_dictionary["generate_path_value"] = self.generate_path_value
         design_dictionary["language"] = self.language
         design_dictionary["number_of_files"] = self.number_of_files
@@ -508,11 +674,134 @@ class DesignData:
                     design_dictionary["canvas_dictionary"][item_number].append("empty")  # remove the reference.
                 else:
                     design_dictionary["canvas_dictionary"][item_number].append(attribute)
-        design_dictionary = json.loads(
-            json.dumps(design_dictionary)
-        )  # Got necessary, because generate_frame is stored as reference.
         return design_dictionary
 
+    def _create_change_stack_entry(self):
+        # A stack entry stores the design dictionary as JSON strings, one string for each element of
+        # the canvas dictionary. When the string of an element is identical to a string of the previous
+        # stack entry, then the string object of the previous entry is used. So all unchanged elements
+        # are stored only once for all stack entries and each entry needs only memory for the changed elements.
+        design_dictionary = self._collect_design_dictionary()
+        canvas_dictionary = design_dictionary.pop("canvas_dictionary")
+        previous_element_strings = {}
+        if self.change_stack:
+            previous_element_strings = {string: string for string in self.change_stack[-1]["elements"]}
+        memory = 0
+        element_strings = []
+        for element_description_list in canvas_dictionary.values():
+            element_string = json.dumps(element_description_list)
+            if element_string in previous_element_strings:
+                element_string = previous_element_strings[element_string]
+            else:
+                memory += len(element_string)
+            element_strings.append(element_string)
+        design_string = json.dumps(design_dictionary)
+        memory += len(design_string) + 8 * len(element_strings)  # 8 bytes for each reference in the tuple.
+        return {"design": design_string, "elements": tuple(element_strings), "memory": memory}
+
+    def _get_memory_of_change_stack_entry_without_sharing(self, change_stack_entry):
+        # The memory of the entry, when no string is shared with a previous entry:
+        element_strings = change_stack_entry["elements"]
+        return len(change_stack_entry["design"]) + sum(map(len, element_strings)) + 8 * len(element_strings)
+
+    def get_current_change_stack_entry(self):  # Used by backup_writer
+        """Return the undo stack entry of the current design, which consists only of immutable strings."""
+        return self.change_stack[self.change_stack_pointer]
+
+    @staticmethod
+    def get_design_dictionary_from_change_stack_entry(change_stack_entry):  # Also used by the backup_writer thread
+        """Return a new design dictionary (as create_design_dictionary() does) created from an undo stack entry."""
+        design_dictionary = json.loads(change_stack_entry["design"])
+        design_dictionary["canvas_dictionary"] = {
+            str(item_number): json.loads(element_string)
+            for item_number, element_string in enumerate(change_stack_entry["elements"])
+        }
+        return design_dictionary
+
+    def _push_change_stack_entry(self):
+        if self.change_stack_pointer != len(self.change_stack) - 1:
+            for change_stack_entry in self.change_stack[self.change_stack_pointer + 1 :]:
+                self.change_stack_memory -= change_stack_entry["memory"]
+            del self.change_stack[self.change_stack_pointer + 1 :]
+            self.window.notebook_top.diagram_tab.redo_button.config(state="disabled")
+        change_stack_entry = self._create_change_stack_entry()
+        self.change_stack.append(change_stack_entry)
+        self.change_stack_memory += change_stack_entry["memory"]
+        self.change_stack_pointer += 1  # Points to the entry which was yet appended.
+        # Remove the oldest entries, but always keep the entry the stack pointer points to:
+        while self.change_stack_pointer > 0 and (
+            len(self.change_stack) > DesignData.change_stack_max_depth
+            or self.change_stack_memory > DesignData.change_stack_max_memory
+        ):
+            self.change_stack_memory -= self.change_stack.pop(0)["memory"]
+            # The strings which the new oldest entry shared with the removed entry were only counted by the removed
+            # entry, so they must be counted by the new oldest entry now:
+            oldest_entry = self.change_stack[0]
+            self.change_stack_memory -= oldest_entry["memory"]
+            oldest_entry["memory"] = self._get_memory_of_change_stack_entry_without_sharing(oldest_entry)
+            self.change_stack_memory += oldest_entry["memory"]
+            self.change_stack_pointer -= 1
+            self.change_stack_was_truncated = True
+
+    def load_design_dictionary(self, design_dictionary):  # Used by file_read_batch
+        """Fill the design data from a design dictionary read from file, without creating any canvas items."""
+        # There is no canvas, so the item numbers of the file are used as canvas IDs.
+        # The IDs of the symbol rectangles and generate rectangles, which were stored in the file,
+        # are replaced by these numbers, because the HDL generation uses them as keys into canvas_dictionary.
+        self.module_name = design_dictionary["module_name"]
+        self.architecture_name = design_dictionary.get("architecture_name", "struct")
+        self.language = design_dictionary["language"]
+        self.generate_path_value = design_dictionary["generate_path_value"]
+        self.number_of_files = design_dictionary["number_of_files"]
+        self.include_timestamp_in_hdl = design_dictionary.get("include_timestamp_in_hdl", True)
+        self.edit_cmd = design_dictionary["edit_cmd"]
+        self.edit_jmp = design_dictionary.get("edit_jmp", "")
+        self.hfe_cmd = design_dictionary["hfe_cmd"]
+        self.module_library = design_dictionary["module_library"]
+        self.additional_sources = design_dictionary["additional_sources"]
+        self.working_directory = design_dictionary.get("working_directory", "")
+        self.compile_cmd = design_dictionary["compile_cmd"]
+        self.compile_hierarchy_cmd = design_dictionary["compile_hierarchy_cmd"]
+        self.signal_name_font = design_dictionary["signal_name_font"]
+        self.font_size = design_dictionary["font_size"]
+        self.grid_size = design_dictionary["grid_size"]
+        self.connector_size = design_dictionary["connector_size"]
+        self.wire_id = design_dictionary["wire_id"]
+        self.block_id = design_dictionary["block_id"]
+        self.generate_frame_id = design_dictionary.get("generate_frame_id", 0)
+        self.instance_id = design_dictionary["instance_id"]
+        self.text_dictionary.update(design_dictionary["text_dictionary"])
+        self.canvas_dictionary = {}
+        self.canvas_ids_by_type = {}
+        self.signal_name_canvas_id_by_wire_tag = {}
+        self.wire_canvas_ids_by_wire_tag = {}
+        self.port_declarations = None
+        self._reset_net_index()
+        for canvas_id, (_, element_description) in enumerate(design_dictionary["canvas_dictionary"].items(), start=1):
+            element_description_list = ["empty"] + element_description[1:]
+            if element_description_list[1] == "instance":
+                symbol_definition = element_description_list[2]
+                if "architecture_filename" not in symbol_definition:
+                    symbol_definition["architecture_filename"] = ""  # Designs created with old versions.
+                symbol_definition["rectangle"]["canvas_id"] = canvas_id
+            elif element_description_list[1] == "generate_frame":
+                element_description_list[2]["generate_rectangle_id"] = canvas_id
+            self._store_in_canvas_dictionary(canvas_id, element_description_list)
+
+    def get_rectangles_of_hdl_elements(self):  # Used by hdl_generate_sort_elements.SortElements
+        """Return {canvas_id: [x1, y1, x2, y2]} of the rectangles of all blocks, instances and generate frames."""
+        rectangles = {}
+        for canvas_id, element_description_list in self.canvas_dictionary.items():
+            if element_description_list[1] == "block":
+                rectangles[canvas_id] = element_description_list[2]
+            elif element_description_list[1] == "instance":
+                rectangles[canvas_id] = element_description_list[2]["rectangle"]["coords"]
+            elif element_description_list[1] == "generate_frame":
+                rectangles[canvas_id] = generate_frame.GenerateFrame.get_rectangle_coords_from_generate_definition(
+                    element_description_list[2]
+                )
+        return rectangles
+
     def create_schematic_elements_dictionary(self):  # Used by hdl_generate_sort_elements.SortElements
         """Return a dictionary of HDL elements (instances, blocks, generate frames) with type, priority, and coords."""
         # [<ID1>: ["prio": <number>, "type": <"generate_frame"|"block"|"instance">, "coords": [n1, n2, n3, n4]],
@@ -584,6 +873,8 @@ class DesignData:
     def set_language(self, language):
         """Set the HDL language."""
         self.language = language
+        self.port_declarations = None
+        self._reset_net_index()
 
     def get_language(self):
         """Return the HDL language."""
@@ -612,6 +903,8 @@ class DesignData:
     def set_grid_size(self, value):
         """Set the grid size."""
         self.grid_size = value
+        self.port_declarations = None
+        self.instance_connections_by_net = None
 
     def get_font_size(self):
         """Return the font size."""
@@ -665,6 +958,14 @@ class DesignData:
         """Return the element type stored for the given canvas ID."""
         return self.canvas_dictionary[canvas_id][1]
 
+    def get_schematic_element_type_or_none(self, canvas_id):
+        """Return the element type stored for the given canvas ID or None if the canvas ID is not stored."""
+        # Replaces "canvas_id in get_canvas_ids_of_elements() and get_schematic_element_type_of(canvas_id)" by 1 lookup.
+        element_description_list = self.canvas_dictionary.get(canvas_id)
+        if element_description_list is None:
+            return None
+        return element_description_list[1]
+
     def get_stored_tags_of(self, canvas_id):
         """Return the stored tags for the given canvas ID."""
         return self.canvas_dictionary[canvas_id][3]
@@ -806,6 +1107,10 @@ class DesignData:
         """Return the architecture name."""
         return self.architecture_name
 
+    def get_design_is_saved(self):
+        """Return True if the design has no unsaved changes (always True in batch mode, where no window exists)."""
+        return self.window is None or not self.window.title().endswith("*")
+
     def get_visible_center_point(self):
         """Return the visible center point of the canvas as a tuple of integer coordinates."""
         return int(self.visible_center_point[0]), int(self.visible_center_point[1])
@@ -848,89 +1153,57 @@ class DesignData:
 
     def get_symbol_definitions(self):
         """Return a list of all symbol definitions for instances in the canvas."""
-        symbol_definition_list = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "instance":
-                symbol_definition_list.append(element_description_list[2])
-        return symbol_definition_list
+        return [self.canvas_dictionary[canvas_id][2] for canvas_id in self.get_canvas_ids_of_type("instance")]
 
     def get_connection_data(self):  # Used by design_data itself and by hdl_generate.
         """Return port list, wire list, block list, symbol definition list, and generate definition list."""
-        port_list = []
+        port_list = [
+            {"type": self.canvas_dictionary[canvas_id][1], "coords": self.canvas_dictionary[canvas_id][2]}
+            for canvas_id in self.get_canvas_ids_of_type("port")
+        ]
         wire_list = []
-        block_list = {}
-        symbol_definition_list = []
-        generate_definition_list = []
-        tag_to_declaration_dictionary = {}
-        for canvas_id, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] in ["input", "output", "inout"]:
-                port_list.append({"type": element_description_list[1], "coords": element_description_list[2]})
-            elif element_description_list[1] == "wire":
-                tag_list = element_description_list[3]
-                for tag in tag_list:
-                    if tag.startswith("wire_"):
-                        wire_tag = tag
-                wire_list.append({"declaration": wire_tag, "coords": element_description_list[2]})
-            elif element_description_list[1] == "signal-name":
-                tag_to_declaration_dictionary[element_description_list[5]] = element_description_list[4]
-            elif element_description_list[1] == "block":
-                block_list[canvas_id] = element_description_list[4]
-            elif element_description_list[1] == "instance":
-                symbol_definition_list.append(element_description_list[2])  # add symbol_definition
-            elif element_description_list[1] == "generate_frame":
-                generate_definition_list.append(element_description_list[2])  # add generate_definition (a dictionary)
-        for index, entry in enumerate(wire_list):
-            wire_tag = entry["declaration"]
+        for canvas_id in self.get_canvas_ids_of_type("wire"):
+            element_description_list = self.canvas_dictionary[canvas_id]
+            for tag in element_description_list[3]:
+                if tag.startswith("wire_"):
+                    wire_tag = tag
             # When a rotated Connector is copied, it is rotated to the correct position in the clipboard window.
             # At each rotation an (never needed) entry is made in the stack of design_data of the clipboard window.
             # For creating the stack-element get_connection_data() is called, but as the copy is not complete,
-            # a wire may exist, but its signal not yet. Then a crash happens here, because tag_to_declaration_dictionary
-            # is empty or wire_tag is not a key. Checking for emptiness and key-existence is a workaround:
-            if tag_to_declaration_dictionary and wire_tag in tag_to_declaration_dictionary:
-                wire_list[index]["declaration"] = tag_to_declaration_dictionary[wire_tag]
+            # a wire may exist, but its signal not yet. So the wire_tag may not be a key of the index:
+            if wire_tag in self.signal_name_canvas_id_by_wire_tag:
+                declaration = self.canvas_dictionary[self.signal_name_canvas_id_by_wire_tag[wire_tag]][4]
             else:
-                wire_list[index]["declaration"] = ""
+                declaration = ""
+            wire_list.append({"declaration": declaration, "coords": element_description_list[2]})
+        block_list = {
+            canvas_id: self.canvas_dictionary[canvas_id][4] for canvas_id in self.get_canvas_ids_of_type("block")
+        }
+        symbol_definition_list = self.get_symbol_definitions()
+        generate_definition_list = [  # generate_definitions are dictionaries
+            self.canvas_dictionary[canvas_id][2] for canvas_id in self.get_canvas_ids_of_type("generate_frame")
+        ]
         return port_list, wire_list, block_list, symbol_definition_list, generate_definition_list
 
     def get_all_instance_names(self):
         """Return a list of all instance names currently placed in the canvas."""
-        all_instance_names = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "instance":
-                all_instance_names.append(element_description_list[2]["instance_name"]["name"])
-        return all_instance_names
+        return [symbol_definition["instance_name"]["name"] for symbol_definition in self.get_symbol_definitions()]
 
     def get_numbers_of_wires(self):
         """Return the total number of wires in the canvas."""
-        number_of_wires = 0
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "wire":
-                number_of_wires += 1
-        return number_of_wires
+        return len(self.get_canvas_ids_of_type("wire"))
 
     def get_list_of_canvas_block_references(self):
         """Return a list of references for all block canvas items."""
-        list_of_canvas_block_references = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "block":
-                list_of_canvas_block_references.append(element_description_list[0])
-        return list_of_canvas_block_references
+        return [self.canvas_dictionary[canvas_id][0] for canvas_id in self.get_canvas_ids_of_type("block")]
 
     def get_list_of_canvas_wire_references(self):
         """Return a list of references for all wire canvas items."""
-        list_of_canvas_wires_references = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "wire":
-                list_of_canvas_wires_references.append(element_description_list[0])
-        return list_of_canvas_wires_references
+        return [self.canvas_dictionary[canvas_id][0] for canvas_id in self.get_canvas_ids_of_type("wire")]
 
     def get_list_of_canvas_signal_name_references(self):
         """Return a list of references for all signal name canvas items."""
-        list_of_canvas_signal_name_references = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "signal-name":
-                list_of_canvas_signal_name_references.append(element_description_list[0])
-        return list_of_canvas_signal_name_references
+        return [self.canvas_dictionary[canvas_id][0] for canvas_id in self.get_canvas_ids_of_type("signal-name")]
 
     # def get_list_of_canvas_wire_ids(self):
     #     list_of_canvas_wires_ids = []
@@ -978,11 +1251,9 @@ class DesignData:
 
     def get_stored_language_of_entity(self, entity_name):
         """Return the HDL language of the first instance matching entity_name, or None if not found."""
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "instance":
-                symbol_definition = element_description_list[2]
-                if symbol_definition["entity_name"]["name"] == entity_name:
-                    return symbol_definition["language"]
+        for symbol_definition in self.get_symbol_definitions():
+            if symbol_definition["entity_name"]["name"] == entity_name:
+                return symbol_definition["language"]
         return None
 
     def add_change_to_stack(self, push_design_to_stack):
@@ -1026,18 +1297,11 @@ class DesignData:
                 )
                 / 2,
             ]
-            if self.change_stack_pointer != len(self.change_stack) - 1:
-                del self.change_stack[self.change_stack_pointer + 1 :]
-                self.window.notebook_top.diagram_tab.redo_button.config(state="disabled")
-            design = self.create_design_dictionary()
-            self.change_stack.append(design)
-            self.change_stack_pointer += (
-                1  # After executing this line, self.change_stack_pointer points to the entry which was yet appended.
-            )
+            self._push_change_stack_entry()
             if self.change_stack_pointer > 0:
                 self.window.notebook_top.diagram_tab.undo_button.config(state="enabled")
             if self.window.title().endswith("*"):
-                file_write.FileWrite(self.window, self.window.design, "backup")
+                self.window.backup_writer.request_backup()
         else:
             # print("add_change_to_stack called with False")
             pass
@@ -1047,15 +1311,9 @@ class DesignData:
         if self.last_stack_entry_was_caused_by_zoom:
             # print("add_change_to_stack_after_zoom: Overwrite the last zoom stack entry")
             # Overwrite the last zoom stack entry:
-            del self.change_stack[self.change_stack_pointer]
+            self.change_stack_memory -= self.change_stack.pop(self.change_stack_pointer)["memory"]
             self.change_stack_pointer -= 1
-        if self.change_stack_pointer != len(self.change_stack) - 1:
-            del self.change_stack[self.change_stack_pointer + 1 :]
-            # print("add_change_to_stack_after_zoom: Stack upper entries cleared by zoom")
-            self.window.notebook_top.diagram_tab.redo_button.config(state="disabled")
-        design = self.create_design_dictionary()
-        self.change_stack.append(design)
-        self.change_stack_pointer += 1  # Points to the entry which was yet appended.
+        self._push_change_stack_entry()
         # print("stack-pointer after zoom =", self.change_stack_pointer)
         if self.change_stack_pointer > 0:
             self.window.notebook_top.diagram_tab.undo_button.config(state="enabled")
@@ -1065,6 +1323,8 @@ class DesignData:
         """Clear the entire undo/redo stack and disable the undo/redo buttons."""
         # print("clear_stack called")
         self.change_stack = []
+        self.change_stack_memory = 0
+        self.change_stack_was_truncated = False
         self.change_stack_pointer = -1
         self.window.notebook_top.diagram_tab.undo_button.config(state="disabled")
         self.window.notebook_top.diagram_tab.redo_button.config(state="disabled")
@@ -1076,11 +1336,13 @@ class DesignData:
             if self.change_stack_pointer == 0:
                 self.window.notebook_top.diagram_tab.undo_button.config(state="disabled")
                 # print("get_previous_design_dictionary: self.path_name =", self.path_name + ".tmp")
-                if os.path.isfile(self.path_name + ".tmp"):
-                    os.remove(self.path_name + ".tmp")
+                # When the oldest entries were removed, the first entry is not the design stored in the file:
+                if not self.change_stack_was_truncated:
+                    self.window.backup_writer.cancel()
+                    if os.path.isfile(self.path_name + ".tmp"):
+                        os.remove(self.path_name + ".tmp")
             self.window.notebook_top.diagram_tab.redo_button.config(state="enabled")
-            deep_copy = copy.deepcopy(self.change_stack[self.change_stack_pointer])
-            return deep_copy
+            return self.get_design_dictionary_from_change_stack_entry(self.change_stack[self.change_stack_pointer])
         return None
 
     def get_later_design_dictionary(self):
@@ -1091,7 +1353,7 @@ class DesignData:
             if self.change_stack_pointer == len(self.change_stack) - 1:
                 self.window.notebook_top.diagram_tab.redo_button.config(state="disabled")
             self.window.notebook_top.diagram_tab.undo_button.config(state="enabled")
-            return copy.deepcopy(self.change_stack[self.change_stack_pointer])
+            return self.get_design_dictionary_from_change_stack_entry(self.change_stack[self.change_stack_pointer])
         return None
 
     # def get_change_stack_pointer(self):
@@ -1103,8 +1365,9 @@ class DesignData:
         references_of_copies = []
         object_tag_dict = self.__create_dict_for_replacing_old_wire_tags_by_new_wire_tags(canvas_ids, window)
         for canvas_id in canvas_ids:
-            if canvas_id in window.design.get_canvas_ids_of_elements():
-                if window.design.get_schematic_element_type_of(canvas_id) == "input":
+            element_type = window.design.get_schematic_element_type_or_none(canvas_id)
+            if element_type is not None:
+                if element_type == "input":
                     ref = interface_input.Input(
                         self.window,
                         self.window.notebook_top.diagram_tab,
@@ -1114,7 +1377,7 @@ class DesignData:
                         orientation=window.design.get_orientation_of_interface(canvas_id),
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "output":
+                elif element_type == "output":
                     ref = interface_output.Output(
                         self.window,
                         self.window.notebook_top.diagram_tab,
@@ -1124,7 +1387,7 @@ class DesignData:
                         orientation=window.design.get_orientation_of_interface(canvas_id),
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "inout":
+                elif element_type == "inout":
                     ref = interface_inout.Inout(
                         self.window,
                         self.window.notebook_top.diagram_tab,
@@ -1134,7 +1397,7 @@ class DesignData:
                         orientation=window.design.get_orientation_of_interface(canvas_id),
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "wire":
+                elif element_type == "wire":
                     tags = list(window.design.get_stored_tags_of_wire(canvas_id))  # example: ('wire_0', 'current')
                     for index, tag in enumerate(tags):
                         if tag in object_tag_dict:
@@ -1149,7 +1412,7 @@ class DesignData:
                         width=window.design.get_width_of_wire(canvas_id),
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "signal-name":
+                elif element_type == "signal-name":
                     wire_tag = window.design.get_tag_of_signal_name(canvas_id)
                     if (
                         wire_tag in object_tag_dict
@@ -1164,11 +1427,11 @@ class DesignData:
                             wire_tag=tag,
                         )
                         references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "block-rectangle":
+                elif element_type == "block-rectangle":
                     pass
                     # The block-rectangle is stored in canvas_dictionary for delete_item(), store_item() and
                     # select_item(), but is not an object, for which a copy must be generated.
-                elif window.design.get_schematic_element_type_of(canvas_id) == "block":
+                elif element_type == "block":
                     tag = "block_" + str(self.block_id)
                     self.block_id += 1
                     ref = block_insertion.Block(
@@ -1182,7 +1445,7 @@ class DesignData:
                     )
                     references_of_copies.append(ref)  # block text
                     references_of_copies.append(ref.rectangle_reference)  # block rectangle
-                elif window.design.get_schematic_element_type_of(canvas_id) == "instance":
+                elif element_type == "instance":
                     symbol_definition_copy = json.loads(json.dumps(window.design.get_symbol_definition_of(canvas_id)))
                     symbol_definition_copy["object_tag"] = "instance_" + str(self.instance_id)
                     symbol_definition_copy["instance_name"]["name"] += str(self.instance_id)
@@ -1194,7 +1457,7 @@ class DesignData:
                         symbol_definition=symbol_definition_copy,
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "generate_frame":
+                elif element_type == "generate_frame":
                     generate_definition_copy = json.loads(
                         json.dumps(window.design.get_generate_definition_of(canvas_id))
                     )
@@ -1204,7 +1467,7 @@ class DesignData:
                         self.root, self.window, self.window.notebook_top.diagram_tab, generate_definition_copy
                     )
                     references_of_copies.append(ref)
-                elif window.design.get_schematic_element_type_of(canvas_id) == "dot":
+                elif element_type == "dot":
                     pass  # Dots are inserted by a method of wire_insertion
                 else:
                     pass
@@ -1225,10 +1488,7 @@ class DesignData:
         # When wires are copied, then the old wire_tag must be replaced by a new wire_tag.
         object_tag_dict = {}
         for canvas_id in canvas_ids:
-            if (
-                canvas_id in window.design.get_canvas_ids_of_elements()
-                and window.design.get_schematic_element_type_of(canvas_id) == "wire"
-            ):
+            if window.design.get_schematic_element_type_or_none(canvas_id) == "wire":
                 old_tags = window.design.get_stored_tags_of(canvas_id)  # example: ('wire_0', 'current')
                 for tag in old_tags:
                     if tag.startswith("wire_"):
@@ -1272,32 +1532,31 @@ class DesignData:
 
     def update_hierarchy(self):
         """Rebuild the sorted instance dictionary list and refresh the hierarchy tree views."""
+        if self.window is None:  # The design was read without window (batch mode or design_metadata).
+            env_language = self.get_language()
+        else:
+            env_language = self.window.notebook_top.control_tab.language.get()
         list_of_instance_dictionaries = []
-        for _, element_description_list in self.canvas_dictionary.items():
-            if element_description_list[1] == "instance":
-                symbol_definition = element_description_list[2]
-                instance_dict = {
-                    "configuration_library": symbol_definition["configuration"]["library"],
-                    "instance_name": symbol_definition["instance_name"]["name"],
-                    "module_name": symbol_definition["entity_name"]["name"],
-                    "architecture_name": symbol_definition["architecture_name"],
-                    "number_of_files": symbol_definition["number_of_files"],
-                    "generate_path_value": symbol_definition["generate_path_value"],
-                    "language": symbol_definition["language"],
-                    "additional_files": symbol_definition["additional_files"],
-                    "env_language": self.window.notebook_top.control_tab.language.get(),
-                    "filename": symbol_definition["filename"],
-                    "architecture_filename": symbol_definition["architecture_filename"],
-                }
-                list_of_instance_dictionaries.append(instance_dict)
+        for symbol_definition in self.get_symbol_definitions():
+            instance_dict = {
+                "configuration_library": symbol_definition["configuration"]["library"],
+                "instance_name": symbol_definition["instance_name"]["name"],
+                "module_name": symbol_definition["entity_name"]["name"],
+                "architecture_name": symbol_definition["architecture_name"],
+                "number_of_files": symbol_definition["number_of_files"],
+                "generate_path_value": symbol_definition["generate_path_value"],
+                "language": symbol_definition["language"],
+                "additional_files": symbol_definition["additional_files"],
+                "env_language": env_language,
+                "filename": symbol_definition["filename"],
+                "architecture_filename": symbol_definition["architecture_filename"],
+            }
+            list_of_instance_dictionaries.append(instance_dict)
         sorted_list_of_instance_dictionaries = sorted(list_of_instance_dictionaries, key=lambda d: d["instance_name"])
         self.sorted_list_of_instance_dictionaries = sorted_list_of_instance_dictionaries
+        if self.window is None:
+            return
         # Even if self.sorted_list_of_instance_dictionaries was not changed by the line before,
-        # the treeviews must be updated, because there might have been changes in the additional HDL-files.
-        # So each change in the database (even it only a symbol is moved) updates the hierarchy view:
-        self.window.hierarchytree.refresh_treeviews()
-        # Old solution which did not check all possible design changes:
-        # if (sorted_list_of_instance_dictionaries!=self.sorted_list_of_instance_dictionaries or # A change happened.
-        #     not sorted_list_of_instance_dictionaries):                          # This is the bottom of the design.
-        #     self.sorted_list_of_instance_dictionaries = sorted_list_of_instance_dictionaries
-        #     self.window.hierarchytree.refresh_treeviews()
+        # the treeviews must be updated, when there were changes in the additional HDL-files.
+        # This is checked by the hierarchy tree, so a change which only moves a symbol does not refresh:
+        self.window.hierarchytree.refresh_treeviews_if_hierarchy_changed()
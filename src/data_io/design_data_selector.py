@@ -106,6 +106,39 @@ class DesignDataSelector:
             ]  # Remove entry with empty key, was created by old version of HDL-SCHEM-Editor
         return self.return_dictionaries
 
+    def get_backup_snapshot(self):  # used by backup_writer
+        """Returns immutable data, from which create_design_dictionary_from_backup_snapshot() creates the design
+        dictionary of all architectures (as get_design_dictionary_for_all_architectures() does) in another thread."""
+        # The active architecture is taken from its current undo stack entry, which consists only of strings.
+        # The other architectures may be changed by the tkinter thread (for example the module name), so they are
+        # converted into JSON here. They only exist in designs with several architectures.
+        active_architecture = self.window.notebook_top.diagram_tab.architecture_name
+        architecture_strings = {}
+        for architecture, design_dictionary in self.return_dictionaries.items():
+            if architecture == active_architecture:
+                architecture_strings[architecture] = None  # Keeps the order of the architectures.
+            elif architecture not in ("", "active__architecture"):
+                architecture_strings[architecture] = json.dumps(design_dictionary)
+        if self.return_dictionaries:
+            architecture_strings.setdefault(active_architecture, None)
+        return active_architecture, self.active_data.get_current_change_stack_entry(), architecture_strings
+
+    @classmethod
+    def create_design_dictionary_from_backup_snapshot(cls, backup_snapshot):
+        """Returns the design dictionary of all architectures. Does not access any object of the tkinter thread."""
+        active_architecture, change_stack_entry, architecture_strings = backup_snapshot
+        save_dict = design_data.DesignData.get_design_dictionary_from_change_stack_entry(change_stack_entry)
+        if not architecture_strings:  # The design has only 1 architecture and was not read from a file.
+            return save_dict
+        design_dictionary = {}
+        for architecture, architecture_string in architecture_strings.items():
+            if architecture_string is None:
+                design_dictionary[architecture] = save_dict
+            else:
+                design_dictionary[architecture] = json.loads(architecture_string)
+        design_dictionary["active__architecture"] = active_architecture
+        return design_dictionary
+
     def extract_design_dictionary_of_active_architecture(self, new_dict, architecture_name):  # used by file_read
         """Returns the design dictionary of the active architecture."""
         # When a design is read in, then the architecture_name is "".
@@ -392,10 +425,18 @@ class DesignDataSelector:
         """Removes a canvas item from the dictionary."""
         self.active_data.remove_canvas_item_from_dictionary(canvas_id, push_design_to_stack)
 
+    def suppress_window_title_updates(self, suppress):
+        """Suppresses the window title updates during a bulk update."""
+        self.active_data.suppress_window_title_updates(suppress)
+
     def update_window_title(self, written):
         """Updates the window title."""
         self.active_data.update_window_title(written)
 
+    def get_rectangles_of_hdl_elements(self):
+        """Returns the rectangles of all blocks, instances and generate frames."""
+        return self.active_data.get_rectangles_of_hdl_elements()
+
     def create_schematic_elements_dictionary(self):
         """Creates a dictionary of schematic elements."""
         return self.active_data.create_schematic_elements_dictionary()
@@ -464,6 +505,26 @@ class DesignDataSelector:
         """Sets the current grid size."""
         self.active_data.set_grid_size(value)
 
+    def get_signal_name_canvas_id(self, wire_tag):
+        """Returns the canvas id of the signal-name of a wire."""
+        return self.active_data.get_signal_name_canvas_id(wire_tag)
+
+    def get_wire_canvas_ids_of_net(self, signal_name):
+        """Returns the canvas ids of the wires of a net."""
+        return self.active_data.get_wire_canvas_ids_of_net(signal_name)
+
+    def get_instance_connections_of_net(self, signal_name):
+        """Returns the instance connections of a net."""
+        return self.active_data.get_instance_connections_of_net(signal_name)
+
+    def get_cached_port_declarations(self):
+        """Returns the cached port declarations of the current architecture."""
+        return self.active_data.get_cached_port_declarations()
+
+    def restore_cached_port_declarations(self, port_declarations):
+        """Restores the cached port declarations of the current architecture."""
+        self.active_data.restore_cached_port_declarations(port_declarations)
+
     def get_font_size(self):
         """Returns the current font size."""
         return self.active_data.get_font_size()
@@ -516,6 +577,10 @@ class DesignDataSelector:
         """Returns the schematic element type of a canvas item."""
         return self.active_data.get_schematic_element_type_of(canvas_id)
 
+    def get_schematic_element_type_or_none(self, canvas_id):
+        """Returns the schematic element type of a canvas item or None if the canvas item is no schematic element."""
+        return self.active_data.get_schematic_element_type_or_none(canvas_id)
+
     def get_stored_tags_of(self, canvas_id):
         """Returns the stored tags of a canvas item."""
         return self.active_data.get_stored_tags_of(canvas_id)
@@ -572,6 +637,10 @@ class DesignDataSelector:
         """Returns the canvas IDs of elements."""
         return self.active_data.get_canvas_ids_of_elements()
 
+    def get_canvas_ids_of_type(self, element_type):
+        """Returns the canvas IDs of all elements of the given type."""
+        return self.active_data.get_canvas_ids_of_type(element_type)
+
     def get_symbol_definition_of(self, canvas_id):
         """Returns the symbol definition of a canvas item."""
         return self.active_data.get_symbol_definition_of(canvas_id)
@@ -0,0 +1,47 @@
+"""
+Convert a design dictionary into the text of a design file (.hse) and convert design files between the 2 formats:
+The "indented" format is the default, it is readable and gives small differences in a version control system.
+The "compact" format is minified JSON without any whitespace. It is written much faster, because the json module
+uses its C-encoder only when no indentation is requested, and it is much smaller, because most of the indented
+file consists of the indentation of the coordinate lists of the canvas_dictionary.
+Both formats are JSON, so each reader of design files reads both formats without any change and the conversion
+is lossless (the json module writes each float by its shortest representation, which is read back unchanged).
+The backup file (<design-file>.tmp) is always written in the compact format.
+"""
+
+import json
+import os
+
+
+class DesignFileFormat:
+    """This class converts a design dictionary into the text of a design file."""
+
+    compact = False  # Is configured by the key "compact_file_format" of the configuration file.
+
+    @classmethod
+    def dumps(cls, design_dictionary, compact=None):
+        """Returns the text of a design file, in the configured format if compact is None."""
+        if compact is None:
+            compact = cls.compact
+        if compact:
+            return json.dumps(design_dictionary, separators=(",", ":"), default=str)
+        return json.dumps(design_dictionary, indent=4, default=str)
+
+    @classmethod
+    def convert_file(cls, path_name, compact):
+        """Rewrites a design file in the compact or in the indented format, returns an error message or ""."""
+        try:
+            with open(path_name, encoding="utf-8") as fileobject:
+                design_dictionary = json.loads(fileobject.read())
+        except OSError as error:
+            return "File " + path_name + " could not be read (" + repr(error) + ")."
+        except json.JSONDecodeError as error:
+            return "File " + path_name + " is not a design file (" + repr(error) + ")."
+        # The file is written into a temporary file first and then renamed, so the design file is never incomplete.
+        try:
+            with open(path_name + ".part", "w", encoding="utf-8") as fileobject:
+                fileobject.write(cls.dumps(design_dictionary, compact))
+            os.replace(path_name + ".part", path_name)
+        except OSError as error:
+            return "File " + path_name + " could not be written (" + repr(error) + ")."
+        return ""
@@ -0,0 +1,75 @@
+"""
+Read the design files of sub-modules without creating any window.
+When a toplevel is opened, the hierarchy tree and the link-dictionary need the sub-modules of each module of the
+hierarchy. The design file of a sub-module is read into a DesignData object without window (as in batch mode),
+a (withdrawn) SchematicWindow is only created when the user opens the sub-module or when its canvas is needed.
+The designs are cached and read again, when the modification time or the size of the design file has changed.
+"""
+
+import json
+import os
+
+from data_io import file_read_batch
+
+
+class DesignMetadata:
+    """This class reads and caches the design files of sub-modules, which are not opened in a window."""
+
+    design_cache = {}  # {(path_name, architecture_name): ((modification time, size), DesignData object or None)}
+    architecture_list_cache = {}  # {path_name: ((modification time, size), list of architecture names or None)}
+
+    @classmethod
+    def get_design(cls, path_name, architecture_name):
+        """Returns a DesignData object without window, None when the design file could not be read."""
+        key = (path_name, architecture_name)
+        try:
+            stat_result = os.stat(path_name)
+        except OSError:
+            cls.design_cache.pop(key, None)
+            return None
+        file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cache_entry = cls.design_cache.get(key)
+        if cache_entry is not None and cache_entry[0] == file_signature:
+            return cache_entry[1]
+        try:
+            design = file_read_batch.FileReadBatch(path_name, architecture_name).get_design()
+            design.update_hierarchy()  # Without window only the sorted list of instance dictionaries is created.
+        except (OSError, json.JSONDecodeError, KeyError):
+            design = None
+        cls.design_cache[key] = (file_signature, design)
+        return design
+
+    @classmethod
+    def get_sorted_list_of_instance_dictionaries(cls, path_name, architecture_name):
+        """Returns the instances of the design file in the same form as DesignData.update_hierarchy() creates them."""
+        design = cls.get_design(path_name, architecture_name)
+        if design is None:
+            return []
+        return design.get_sorted_list_of_instance_dictionaries()
+
+    @classmethod
+    def get_architecture_list(cls, path_name):
+        """Returns the names of all architectures stored in the design file, None when the file could not be read."""
+        try:
+            stat_result = os.stat(path_name)
+        except OSError:
+            cls.architecture_list_cache.pop(path_name, None)
+            return None
+        file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cache_entry = cls.architecture_list_cache.get(path_name)
+        if cache_entry is not None and cache_entry[0] == file_signature:
+            return cache_entry[1]
+        try:
+            with open(path_name, encoding="utf-8") as fileobject:
+                design_dictionary = json.loads(fileobject.read())
+            if "active__architecture" in design_dictionary:
+                architecture_list = [key for key in design_dictionary if key != "active__architecture"]
+            elif design_dictionary["language"] == "VHDL":
+                # Old versions of HDL-SCHEM-Editor do not support different architecture names:
+                architecture_list = [design_dictionary.get("architecture_name", "struct")]
+            else:
+                architecture_list = []  # Verilog designs have no architecture.
+        except (OSError, json.JSONDecodeError, KeyError):
+            architecture_list = None
+        cls.architecture_list_cache[path_name] = (file_signature, architecture_list)
+        return architecture_list
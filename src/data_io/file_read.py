@@ -32,7 +32,7 @@ class FileRead:
             filename = askopenfilename(filetypes=(("HDL-SCHEM-Editor files", "*.hse"), ("all files", "*.*")))
             for open_window, open_file in window.__class__.open_window_dict.items():
                 if filename == open_file:
-                    self.__remove_backup_file(window.design.get_path_name() + ".tmp")
+                    self.__remove_backup_file(window, window.design.get_path_name() + ".tmp")
                     # The file is open, may be because it was automatically read in when only the toplevel was read in.
                     open_window.open_this_window()
                     # To be sure to get the latest content, update the window:
@@ -66,7 +66,7 @@ class FileRead:
             try:
                 with open(replaced_read_filename, encoding="utf-8") as fileobject:
                     data = fileobject.read()
-                self.__remove_backup_file(window.design.get_path_name() + ".tmp")
+                self.__remove_backup_file(window, window.design.get_path_name() + ".tmp")
                 for block_edit in window.design.get_block_edit_list():
                     block_edit.close_edit_window()
                 for signal_name in window.design.get_signal_name_edit_list():
@@ -94,6 +94,7 @@ class FileRead:
                 # So there is no need for this message here:
                 pass  # messagebox.showerror("Error ", "File " + filename + " could not be found at read.")
 
-    def __remove_backup_file(self, path_name_backup):
+    def __remove_backup_file(self, window, path_name_backup):
+        window.backup_writer.cancel()
         if os.path.isfile(path_name_backup):
             os.remove(path_name_backup)
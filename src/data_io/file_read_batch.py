@@ -0,0 +1,41 @@
+"""Read the schematic from a JSON file into a DesignData object without creating any window (used for batch mode)"""
+
+import json
+
+from data_io import design_data
+
+
+class FileReadBatch:
+    """This class reads the schematic of one architecture from a JSON file into a DesignData object."""
+
+    def __init__(self, filename, architecture_name=""):
+        self.design = None
+        with open(filename, encoding="utf-8") as fileobject:
+            data = fileobject.read()
+        new_dict = json.loads(data)
+        design_dictionary = self._extract_design_dictionary_of_architecture(new_dict, architecture_name)
+        self.design = design_data.DesignData(root=None, schematic_window=None)
+        self.design.set_path_name(filename)
+        self.design.load_design_dictionary(design_dictionary)
+
+    def get_design(self):
+        """Returns the DesignData object filled from the file."""
+        return self.design
+
+    def _extract_design_dictionary_of_architecture(self, new_dict, architecture_name):
+        # The same selection as in design_data_selector.extract_design_dictionary_of_active_architecture:
+        if "active__architecture" not in new_dict:
+            return new_dict  # Old versions of HDL-SCHEM-Editor and Verilog designs store only 1 architecture.
+        if architecture_name == "" or architecture_name not in new_dict:
+            if architecture_name != "":
+                print(
+                    'Did not find the architecture "'
+                    + architecture_name
+                    + '" of the module '
+                    + new_dict[new_dict["active__architecture"]]["module_name"]
+                    + ', "'
+                    + new_dict["active__architecture"]
+                    + '" is used instead.'
+                )
+            architecture_name = new_dict["active__architecture"]
+        return new_dict[architecture_name]
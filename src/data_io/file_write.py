@@ -1,14 +1,17 @@
 """
 Write the schematic into a JSON file:
-command can be: "save", "save_as", "backup"
+command can be: "save", "save_as"
+The format of the file (indented or compact) is determined by design_file_format.DesignFileFormat.
+The backup file (<design-file>.tmp) is written by backup_writer.BackupWriter.
 The attribute "success" is used by close_this_window(): Without success the window stays opened.
 """
 
-import json
 import os
 from tkinter import messagebox
 from tkinter.filedialog import asksaveasfilename
 
+from data_io import design_file_format
+
 
 class FileWrite:
     """This class writes the schematic into a JSON file."""
@@ -19,12 +22,11 @@ class FileWrite:
         path_name = self._determine_path_name(design, command, actual_path_name)
         if path_name == "":
             return
-        design_dictionary = self._get_design_dictionary(window, design, command)
+        design_dictionary = self._get_design_dictionary(window, design)
         window.config(cursor="watch")
         try:
             self.success = self._write_to_file(path_name, design_dictionary)
-            if command != "backup":
-                self._update_data_base(window, design, actual_path_name, path_name)
+            self._update_data_base(window, design, actual_path_name, path_name)
         except FileNotFoundError:
             messagebox.showerror("Error in HDL-SCHEM-Editor", "File " + path_name + " could not be found at write.")
         except PermissionError:
@@ -34,10 +36,6 @@ class FileWrite:
         window.config(cursor="arrow")
 
     def _determine_path_name(self, design, command, actual_path_name):
-        if command == "backup":
-            if actual_path_name.startswith("unnamed"):
-                return ""  # No ".tmp"-file shall be created.
-            return actual_path_name + ".tmp"
         if command == "save_as" or actual_path_name.startswith("unnamed"):
             new_path_name = asksaveasfilename(
                 defaultextension=".hse",
@@ -49,9 +47,7 @@ class FileWrite:
             return new_path_name  # new_path_name is "", if the user aborted the dialog
         return actual_path_name
 
-    def _get_design_dictionary(self, window, design, command):
-        if command == "backup":
-            return design.get_design_dictionary_for_all_architectures()
+    def _get_design_dictionary(self, window, design):
         zoom_factor = window.write_data_creator_ref.zoom_graphic_to_standard_size(window, design.get_font_size())
         design_dictionary = design.get_design_dictionary_for_all_architectures()
         design_dictionary = window.write_data_creator_ref.round_numbers(design_dictionary)
@@ -60,13 +56,14 @@ class FileWrite:
 
     def _write_to_file(self, path_name, design_dictionary):
         with open(path_name, "w", encoding="utf-8") as fileobject:
-            fileobject.write(json.dumps(design_dictionary, indent=4, default=str))
+            fileobject.write(design_file_format.DesignFileFormat.dumps(design_dictionary))
         return True
 
     def _update_data_base(self, window, design, actual_path_name, path_name):
         window.__class__.open_window_dict[window] = path_name
         if path_name != actual_path_name:
             window.quick_access_object.path_name_changed(actual_path_name, path_name)
+        window.backup_writer.cancel()
         if os.path.isfile(actual_path_name + ".tmp"):
             os.remove(actual_path_name + ".tmp")
         design.update_window_title(written=True)
@@ -0,0 +1,155 @@
+"""
+Summaries of the HDL files (entity, architecture, instances, labels, configurations), which are needed for extracting
+the hierarchy of VHDL or Verilog modules.
+The hierarchy tree is refreshed at each design change, so without this cache all HDL files of the hierarchy, also big
+vendor IP files, would be read and parsed at each change. A summary is valid as long as the modification time and the
+size of its file are unchanged. The summaries are stored in a file in the working directory of the project, so they
+survive a restart of the HDL-SCHEM-Editor.
+When a file was changed, its summary can be revalidated in a background thread, then the old summary is returned
+until the new summary is ready. The hierarchy tree polls revalidation_is_running() and is refreshed again, when
+take_revalidated_changes() reports new summaries.
+"""
+
+import concurrent.futures
+import copy
+import json
+import os
+import threading
+
+from hdl_parser import parse_cache, verilog_parsing, vhdl_parsing
+
+_SUMMARY_KEYS = (
+    "entity_name",
+    "architecture_name",
+    "instance_types",
+    "label_names",
+    "configuration_instance_names",
+    "configuration_module_names",
+    "configuration_target_libraries",
+    "configuration_target_modules",
+    "configuration_target_architectures",
+)
+
+
+class HdlFileSummary:
+    """This class returns the summary of a HDL file, the file is only parsed when it has changed."""
+
+    cache_file_name = ".hdl-schem-editor-hierarchy-cache.json"
+    cache_version = 1
+    project_directory = ""
+    summaries = {}  # {language + "|" + absolute file name: [[modification time, size], summary dictionary]}
+    summaries_are_changed = False  # Not stored in the cache file yet.
+    revalidated_summaries_are_changed = False  # Not shown in the hierarchy tree yet.
+    files_in_revalidation = set()
+    lock = threading.Lock()
+    executor = None
+
+    @classmethod
+    def set_project_directory(cls, project_directory):
+        """Reads the cache file of the project directory, when the project directory has changed."""
+        if project_directory == cls.project_directory:
+            return
+        cls.save()  # Keep the summaries of the old project directory.
+        cls.project_directory = project_directory
+        if project_directory == "":
+            return
+        try:
+            with open(os.path.join(project_directory, cls.cache_file_name), encoding="utf-8") as fileobject:
+                cache_file_content = json.loads(fileobject.read())
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(cache_file_content, dict) and cache_file_content.get("version") == cls.cache_version:
+            with cls.lock:
+                for key, entry in cache_file_content["summaries"].items():
+                    cls.summaries.setdefault(key, entry)
+
+    @classmethod
+    def get_summary(cls, file_name, language, revalidate_in_background=False):
+        """Returns the summary of the HDL file, raises FileNotFoundError if the file does not exist."""
+        key = language + "|" + os.path.abspath(file_name)
+        stat_result = os.stat(file_name)
+        file_signature = [stat_result.st_mtime_ns, stat_result.st_size]
+        with cls.lock:
+            entry = cls.summaries.get(key)
+            if entry is not None and (entry[0] == file_signature or key in cls.files_in_revalidation):
+                return copy.deepcopy(entry[1])
+            if entry is not None and revalidate_in_background:
+                cls.files_in_revalidation.add(key)
+                if cls.executor is None:
+                    cls.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                cls.executor.submit(cls._revalidate, key, file_name, language)
+                return copy.deepcopy(entry[1])
+        with open(file_name, encoding="utf-8") as fileobject:
+            data_read = fileobject.read()
+        if language == "VHDL":
+            parser = parse_cache.ParseCache.get_parse_result(vhdl_parsing.VhdlParser, data_read, "entity_context")
+        else:
+            parser = parse_cache.ParseCache.get_parse_result(verilog_parsing.VerilogParser, data_read, "module")
+        summary = cls._create_summary(parser, language)
+        with cls.lock:
+            cls.summaries[key] = [file_signature, summary]
+            cls.summaries_are_changed = True
+        return copy.deepcopy(summary)
+
+    @classmethod
+    def revalidation_is_running(cls):
+        """Returns True, when summaries of changed files are created in the background."""
+        with cls.lock:
+            return bool(cls.files_in_revalidation)
+
+    @classmethod
+    def take_revalidated_changes(cls):
+        """Returns True, when summaries were changed in the background since the last call."""
+        with cls.lock:
+            revalidated_summaries_are_changed = cls.revalidated_summaries_are_changed
+            cls.revalidated_summaries_are_changed = False
+        return revalidated_summaries_are_changed
+
+    @classmethod
+    def save(cls):
+        """Writes all summaries into the cache file of the project directory, when summaries have changed."""
+        if cls.project_directory == "" or not cls.summaries_are_changed:
+            return
+        with cls.lock:
+            cache_file_text = json.dumps({"version": cls.cache_version, "summaries": cls.summaries})
+            cls.summaries_are_changed = False
+        path_name = os.path.join(cls.project_directory, cls.cache_file_name)
+        try:
+            with open(path_name + ".part", "w", encoding="utf-8") as fileobject:
+                fileobject.write(cache_file_text)
+            os.replace(path_name + ".part", path_name)
+        except OSError as error:
+            print("HDL-SCHEM-Editor-Warning: Could not write to file " + path_name, error)
+
+    @classmethod
+    def _revalidate(cls, key, file_name, language):
+        # Runs in the background thread, so the parse cache (which is not thread safe) is not used here.
+        try:
+            stat_result = os.stat(file_name)
+            with open(file_name, encoding="utf-8") as fileobject:
+                data_read = fileobject.read()
+            if language == "VHDL":
+                parser = vhdl_parsing.VhdlParser(data_read, "entity_context")
+            else:
+                parser = verilog_parsing.VerilogParser(data_read, "module")
+            entry = [[stat_result.st_mtime_ns, stat_result.st_size], cls._create_summary(parser, language)]
+        except Exception:  # pylint: disable=broad-except
+            entry = None  # The file is read again in the foreground, which reports the problem.
+        with cls.lock:
+            old_entry = cls.summaries.pop(key, None)
+            if entry is not None:
+                cls.summaries[key] = entry
+            cls.summaries_are_changed = True
+            if old_entry is None or entry is None or old_entry[1] != entry[1]:
+                cls.revalidated_summaries_are_changed = True
+            cls.files_in_revalidation.discard(key)
+
+    @classmethod
+    def _create_summary(cls, parser, language):
+        summary = {summary_key: parser.get(summary_key) for summary_key in _SUMMARY_KEYS}
+        if language == "VHDL":
+            summary["entity_name_used_in_architecture"] = parser.get("entity_name_used_in_architecture")
+        else:  # A Verilog module contains always "entity" and "architecture".
+            summary["entity_name_used_in_architecture"] = parser.get("entity_name")
+        # Tuples are converted into lists, so a summary read from the cache file is equal to a new summary:
+        return json.loads(json.dumps(summary))
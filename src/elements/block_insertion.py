@@ -43,16 +43,7 @@ class Block:
         self.func_id_leave = None
         self.func_id_escape = None
         self.func_id_button_release = None
-        self.sym_bind_funcid_button = None
-        self.sym_bind_funcid_dbutton = None
-        self.sym_bind_funcid_enter1 = None
-        self.sym_bind_funcid_leave1 = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
-        self.sym_bind_funcid_edit_ex = None
-        self.sym_bind_funcid_edit_er = None
-        self.sym_bind_funcid_showmen1 = None
-        self.sym_bind_funcid_showmen2 = None
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         if block_tag is None:
             self.object_tag = "block_" + str(self.window.design.get_block_id())
             self.window.design.inc_block_id()
@@ -400,53 +391,27 @@ class Block:
         self.store_item(push_design_to_stack=False, signal_design_change=False)
 
     def _add_bindings_to_block(self):
-        self.sym_bind_funcid_button = self.diagram_tab.canvas.tag_bind(
-            self.rectangle_canvas_id, "<Button-1>", self._move_start
-        )
-        self.sym_bind_funcid_enter1 = self.diagram_tab.canvas.tag_bind(
-            self.rectangle_canvas_id, "<Enter>", lambda event: self._at_enter()
-        )
-        self.sym_bind_funcid_leave1 = self.diagram_tab.canvas.tag_bind(
-            self.rectangle_canvas_id, "<Leave>", lambda event: self._at_leave()
-        )
-        self.sym_bind_funcid_showmen1 = self.diagram_tab.canvas.tag_bind(
-            self.rectangle_canvas_id, "<Button-3>", self._show_menu
-        )
-        self.sym_bind_funcid_enter = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Enter>", lambda event: self._at_enter()
-        )
-        self.sym_bind_funcid_leave = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Leave>", lambda event: self._at_leave()
-        )
-        self.sym_bind_funcid_dbutton = self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Double-Button-1>", self._edit)
-        self.sym_bind_funcid_edit_ex = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Control-e>", lambda event: self._edit_ext()
-        )
-        self.sym_bind_funcid_edit_er = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Control-E>", lambda event: self._create_capslock_warning("E")
-        )
-        self.sym_bind_funcid_showmen2 = self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Button-3>", self._show_menu)
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        # In the canvas dictionary the rectangle belongs to a BlockRectangle object, but it is handled here:
+        dispatcher.add_sub_item(self, self.rectangle_canvas_id)
+        dispatcher.bind(self, self.rectangle_canvas_id, "<Button-1>", self._move_start)
+        dispatcher.bind(self, self.rectangle_canvas_id, "<Enter>", lambda event: self._at_enter())
+        dispatcher.bind(self, self.rectangle_canvas_id, "<Leave>", lambda event: self._at_leave())
+        dispatcher.bind(self, self.rectangle_canvas_id, "<Button-3>", self._show_menu)
+        dispatcher.bind(self, self.canvas_id, "<Enter>", lambda event: self._at_enter())
+        dispatcher.bind(self, self.canvas_id, "<Leave>", lambda event: self._at_leave())
+        dispatcher.bind(self, self.canvas_id, "<Double-Button-1>", self._edit)
+        dispatcher.bind(self, self.canvas_id, "<Control-e>", lambda event: self._edit_ext())
+        dispatcher.bind(self, self.canvas_id, "<Control-E>", lambda event: self._create_capslock_warning("E"))
+        dispatcher.bind(self, self.canvas_id, "<Button-3>", self._show_menu)
 
     def _remove_bindings_from_block(self):
-        if self.sym_bind_funcid_button is not None:
-            self.diagram_tab.canvas.tag_unbind(self.rectangle_canvas_id, "<Button-1>", self.sym_bind_funcid_button)
-            self.diagram_tab.canvas.tag_unbind(self.rectangle_canvas_id, "<Enter>", self.sym_bind_funcid_enter1)
-            self.diagram_tab.canvas.tag_unbind(self.rectangle_canvas_id, "<Leave>", self.sym_bind_funcid_leave1)
-            self.diagram_tab.canvas.tag_unbind(self.rectangle_canvas_id, "<Button-3>", self.sym_bind_funcid_showmen1)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Double-Button-1>", self.sym_bind_funcid_dbutton)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Control-e>", self.sym_bind_funcid_edit_ex)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Control-E>", self.sym_bind_funcid_edit_er)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Enter>", self.sym_bind_funcid_enter)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Leave>", self.sym_bind_funcid_leave)
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Button-3>", self.sym_bind_funcid_showmen2)
-            self.sym_bind_funcid_button = None
-            self.sym_bind_funcid_dbutton = None
-            self.sym_bind_funcid_enter = None
-            self.sym_bind_funcid_leave = None
-            self.sym_bind_funcid_edit_ex = None
-            self.sym_bind_funcid_edit_er = None
-            self.sym_bind_funcid_showmen1 = None
-            self.sym_bind_funcid_showmen2 = None
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        for event in ("<Button-1>", "<Enter>", "<Leave>", "<Button-3>"):
+            dispatcher.unbind(self, self.rectangle_canvas_id, event)
+        for event in ("<Double-Button-1>", "<Control-e>", "<Control-E>", "<Enter>", "<Leave>", "<Button-3>"):
+            dispatcher.unbind(self, self.canvas_id, event)
+        dispatcher.remove_sub_item(self.rectangle_canvas_id)
 
     def _create_bindings_for_insertion_at_canvas(self, rect_color):
         self.func_id_motion = self.diagram_tab.canvas.bind(
@@ -557,6 +522,7 @@ class Block:
     def delete_item(self, push_design_to_stack):
         """Deletes the block"""
         self._restore_delete_binding()
+        self._remove_bindings_from_block()
         self.diagram_tab.canvas.delete(self.canvas_id)
         if self.block_edit_ref is not None:
             self.block_edit_ref.close_edit_window()
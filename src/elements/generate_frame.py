@@ -19,13 +19,7 @@ class GenerateFrame:
         self.window = window
         self.diagram_tab = diagram_tab
         self.generate_definition = generate_definition
-        self.funcid_button1_rectangle = None
-        self.funcid_button1_condition = None
-        self.funcid_enter_rectangle = None
-        self.funcid_enter_condition = None
-        self.funcid_leave_rectangle = None
-        self.funcid_leave_condition = None
-        self.funcid_button1_double = None
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         self.funcid_delete = None
         self.event_x = None
         self.event_y = None
@@ -209,50 +203,27 @@ class GenerateFrame:
         )
 
     def _add_bindings_for_generate_frame_handling(self):
-        self.funcid_button1_rectangle = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_rectangle_id"], "<Button-1>", self._move_start
-        )
-        self.funcid_button1_condition = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_condition_id"], "<Button-1>", self._move_start_from_condition
-        )
-        self.funcid_enter_rectangle = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_rectangle_id"], "<Enter>", lambda event: self._at_enter()
-        )
-        self.funcid_enter_condition = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_condition_id"], "<Enter>", lambda event: self._at_enter()
-        )
-        self.funcid_leave_rectangle = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_rectangle_id"], "<Leave>", lambda event: self._at_leave()
-        )
-        self.funcid_leave_condition = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_condition_id"], "<Leave>", lambda event: self._at_leave()
-        )
-        self.funcid_button1_double = self.diagram_tab.canvas.tag_bind(
-            self.generate_definition["generate_condition_id"], "<Double-Button-1>", lambda event: self.edit()
-        )
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        rectangle_id = self.generate_definition["generate_rectangle_id"]
+        condition_id = self.generate_definition["generate_condition_id"]
+        dispatcher.add_sub_item(self, condition_id)
+        dispatcher.bind(self, rectangle_id, "<Button-1>", self._move_start)
+        dispatcher.bind(self, condition_id, "<Button-1>", self._move_start_from_condition)
+        dispatcher.bind(self, rectangle_id, "<Enter>", lambda event: self._at_enter())
+        dispatcher.bind(self, condition_id, "<Enter>", lambda event: self._at_enter())
+        dispatcher.bind(self, rectangle_id, "<Leave>", lambda event: self._at_leave())
+        dispatcher.bind(self, condition_id, "<Leave>", lambda event: self._at_leave())
+        dispatcher.bind(self, condition_id, "<Double-Button-1>", lambda event: self.edit())
 
     def _remove_bindings_from_generate_frame(self):
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_rectangle_id"], "<Button-1>", self.funcid_button1_rectangle
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_condition_id"], "<Button-1>", self.funcid_button1_condition
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_rectangle_id"], "<Enter>", self.funcid_enter_rectangle
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_condition_id"], "<Enter>", self.funcid_enter_condition
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_rectangle_id"], "<Leave>", self.funcid_leave_rectangle
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_condition_id"], "<Leave>", self.funcid_leave_condition
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.generate_definition["generate_condition_id"], "<Double-Button-1>", self.funcid_button1_double
-        )
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        for canvas_id in (
+            self.generate_definition["generate_rectangle_id"],
+            self.generate_definition["generate_condition_id"],
+        ):
+            for event in ("<Button-1>", "<Double-Button-1>", "<Enter>", "<Leave>"):
+                dispatcher.unbind(self, canvas_id, event)
+        dispatcher.remove_sub_item(self.generate_definition["generate_condition_id"])
 
     def _at_enter(self):
         if not self.diagram_tab.canvas.find_withtag("selected"):
@@ -273,6 +244,7 @@ class GenerateFrame:
     def delete_item(self, push_design_to_stack):
         """Deletes the generate frame."""
         self._restore_delete_binding()
+        self._remove_bindings_from_generate_frame()
         self.window.design.remove_canvas_item_from_dictionary(
             self.generate_definition["generate_rectangle_id"], push_design_to_stack
         )
@@ -25,11 +25,7 @@ class InterfaceInsertion:
         self.func_id_leave = None
         self.func_id_escape = None
         self.func_id_button_release = None
-        self.sym_bind_funcid_button = None
-        self.sym_bind_funcid_dbutton = None
-        self.sym_bind_funcid_rbutton = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         self.type = ""  # Will be overwritten by the child class.
         self.symbol_coords = []
         if follow_mouse:
@@ -234,31 +230,16 @@ class InterfaceInsertion:
         self.store_item(push_design_to_stack=False, signal_design_change=False)
 
     def __add_bindings_to_symbol(self):
-        self.sym_bind_funcid_button = self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Button-1>", self.__move_start)
-        self.sym_bind_funcid_dbutton = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Double-Button-1>", lambda event: self.__rotate(by_mouse=True)
-        )
-        self.sym_bind_funcid_rbutton = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<ButtonRelease-3>", lambda event: self.__rotate_after_idle()
-        )
-        self.sym_bind_funcid_enter = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Enter>", lambda event: self.__at_enter()
-        )
-        self.sym_bind_funcid_leave = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Leave>", lambda event: self.__at_leave()
-        )
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        dispatcher.bind(self, self.canvas_id, "<Button-1>", self.__move_start)
+        dispatcher.bind(self, self.canvas_id, "<Double-Button-1>", lambda event: self.__rotate(by_mouse=True))
+        dispatcher.bind(self, self.canvas_id, "<ButtonRelease-3>", lambda event: self.__rotate_after_idle())
+        dispatcher.bind(self, self.canvas_id, "<Enter>", lambda event: self.__at_enter())
+        dispatcher.bind(self, self.canvas_id, "<Leave>", lambda event: self.__at_leave())
 
     def __remove_bindings_from_symbol(self):
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Button-1>", self.sym_bind_funcid_button)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Double-Button-1>", self.sym_bind_funcid_dbutton)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<ButtonRelease-3>", self.sym_bind_funcid_rbutton)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Enter>", self.sym_bind_funcid_enter)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Leave>", self.sym_bind_funcid_leave)
-        self.sym_bind_funcid_button = None
-        self.sym_bind_funcid_dbutton = None
-        self.sym_bind_funcid_rbutton = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
+        for event in ("<Button-1>", "<Double-Button-1>", "<ButtonRelease-3>", "<Enter>", "<Leave>"):
+            self.diagram_tab.canvas_event_dispatcher.unbind(self, self.canvas_id, event)
 
     def __create_bindings_for_interface_insertion_at_canvas(self, points):
         self.func_id_motion = self.diagram_tab.canvas.bind(
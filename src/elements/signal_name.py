@@ -44,11 +44,7 @@ class SignalName:
         self.func_id_leave = None
         self.func_id_escape = None
         self.func_id_button_release = None
-        self.sym_bind_funcid_button1 = None
-        self.sym_bind_funcid_dbutton1 = None
-        self.sym_bind_funcid_button3 = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         self.background_rectangle = None
         self.old_signal_name_coords = None
         self.after_identifier = None
@@ -110,21 +106,12 @@ class SignalName:
         )
 
     def _add_bindings_to_signal_name(self):
-        self.sym_bind_funcid_button1 = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Button-1>", self._move_start_signal_name
-        )
-        self.sym_bind_funcid_dbutton1 = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Double-Button-1>", lambda event: self._edit_signal_name()
-        )
-        self.sym_bind_funcid_button3 = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<ButtonRelease-3>", lambda event: self._rotate_after_idle()
-        )
-        self.sym_bind_funcid_enter = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Enter>", lambda event: self._at_enter()
-        )
-        self.sym_bind_funcid_leave = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Leave>", lambda event: self._at_leave()
-        )
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        dispatcher.bind(self, self.canvas_id, "<Button-1>", self._move_start_signal_name)
+        dispatcher.bind(self, self.canvas_id, "<Double-Button-1>", lambda event: self._edit_signal_name())
+        dispatcher.bind(self, self.canvas_id, "<ButtonRelease-3>", lambda event: self._rotate_after_idle())
+        dispatcher.bind(self, self.canvas_id, "<Enter>", lambda event: self._at_enter())
+        dispatcher.bind(self, self.canvas_id, "<Leave>", lambda event: self._at_leave())
 
     def _rotate_after_idle(self):
         # "After" got necessary because ButtonRelease-3 is bound to 2 actions:
@@ -147,16 +134,8 @@ class SignalName:
         self.store_item(push_design_to_stack=True, signal_design_change=True)
 
     def _remove_bindings_from_signal_name(self):
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Button-1>", self.sym_bind_funcid_button1)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Double-Button-1>", self.sym_bind_funcid_dbutton1)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Button-3>", self.sym_bind_funcid_button3)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Enter>", self.sym_bind_funcid_enter)
-        self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Leave>", self.sym_bind_funcid_leave)
-        self.sym_bind_funcid_button1 = None
-        self.sym_bind_funcid_dbutton1 = None
-        self.sym_bind_funcid_button3 = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
+        for event in ("<Button-1>", "<Double-Button-1>", "<ButtonRelease-3>", "<Enter>", "<Leave>"):
+            self.diagram_tab.canvas_event_dispatcher.unbind(self, self.canvas_id, event)
 
     def _move_start_signal_name(self, event):
         self.func_id_motion = self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Motion>", self._move_to)
@@ -11,7 +11,7 @@ from tkinter import messagebox
 
 from codegen import list_separation_check
 from elements import symbol_insertion
-from hdl_parser import verilog_parsing, vhdl_parsing
+from hdl_parser import parse_cache, verilog_parsing, vhdl_parsing
 
 
 class SymbolDefine:
@@ -43,7 +43,9 @@ class SymbolDefine:
                 additional_sources = []
                 name_of_dir, _ = os.path.split(filename)
                 generate_path_value = name_of_dir
-                hdl_parsed = vhdl_parsing.VhdlParser(data_read, "entity_context")
+                hdl_parsed = parse_cache.ParseCache.get_parse_result(
+                    vhdl_parsing.VhdlParser, data_read, "entity_context"
+                )
                 library_names = hdl_parsed.get("entity_library_name")
                 package_names = hdl_parsed.get("package_name")
                 entity_name = hdl_parsed.get("entity_name")
@@ -76,7 +78,8 @@ class SymbolDefine:
                 )  # Conversion from comma-separated string into list
                 port_list = hdl_schem_editor_design_dictionary["port_declarations"]
                 if language_of_instance == "VHDL":
-                    interface_package_parsed = vhdl_parsing.VhdlParser(
+                    interface_package_parsed = parse_cache.ParseCache.get_parse_result(
+                        vhdl_parsing.VhdlParser,
                         window.design.get_interface_packages_from_design_dictionary(hdl_schem_editor_design_dictionary),
                         "entity_context",
                     )
@@ -85,8 +88,11 @@ class SymbolDefine:
                         port = re.sub(r"--.*", "", port)  # Remove any comment, before ';' is added
                         entity_dummy += port + ";"
                     entity_dummy = entity_dummy[:-1] + "); end entity;"
-                    interface_ports_parsed = vhdl_parsing.VhdlParser(entity_dummy, "entity_context")
-                    interface_generics_parsed = vhdl_parsing.VhdlParser(
+                    interface_ports_parsed = parse_cache.ParseCache.get_parse_result(
+                        vhdl_parsing.VhdlParser, entity_dummy, "entity_context"
+                    )
+                    interface_generics_parsed = parse_cache.ParseCache.get_parse_result(
+                        vhdl_parsing.VhdlParser,
                         window.design.get_generics_from_design_dictionary(hdl_schem_editor_design_dictionary),
                         "generics",
                     )
@@ -112,8 +118,11 @@ class SymbolDefine:
                         port = re.sub(r"//.*", "", port)  # Remove any comment, before ';' is added
                         module_dummy += port + ","
                     module_dummy = module_dummy[:-1] + ");"
-                    interface_ports_parsed = verilog_parsing.VerilogParser(module_dummy, "module")
-                    interface_generics_parsed = verilog_parsing.VerilogParser(
+                    interface_ports_parsed = parse_cache.ParseCache.get_parse_result(
+                        verilog_parsing.VerilogParser, module_dummy, "module"
+                    )
+                    interface_generics_parsed = parse_cache.ParseCache.get_parse_result(
+                        verilog_parsing.VerilogParser,
                         window.design.get_generics_from_design_dictionary(hdl_schem_editor_design_dictionary),
                         "parameter_list",
                     )
@@ -141,13 +150,16 @@ class SymbolDefine:
                     else:
                         additional_sources = []
                     if language_of_instance == "VHDL":
-                        interface_package_parsed = vhdl_parsing.VhdlParser(
+                        interface_package_parsed = parse_cache.ParseCache.get_parse_result(
+                            vhdl_parsing.VhdlParser,
                             hdl_fsm_editor_design_dictionary["interface_package"], "entity_context"
                         )
-                        interface_ports_parsed = vhdl_parsing.VhdlParser(
+                        interface_ports_parsed = parse_cache.ParseCache.get_parse_result(
+                            vhdl_parsing.VhdlParser,
                             hdl_fsm_editor_design_dictionary["interface_ports"], "ports"
                         )
-                        interface_generics_parsed = vhdl_parsing.VhdlParser(
+                        interface_generics_parsed = parse_cache.ParseCache.get_parse_result(
+                            vhdl_parsing.VhdlParser,
                             hdl_fsm_editor_design_dictionary["interface_generics"], "generics"
                         )
                         library_names = interface_package_parsed.get("entity_library_name")
@@ -163,10 +175,12 @@ class SymbolDefine:
                         generic_definition = interface_generics_parsed.get("generic_definition")
                         generic_types = interface_generics_parsed.get("generics_interface_types")
                     else:  # Verilog
-                        interface_ports_parsed = verilog_parsing.VerilogParser(
+                        interface_ports_parsed = parse_cache.ParseCache.get_parse_result(
+                            verilog_parsing.VerilogParser,
                             hdl_fsm_editor_design_dictionary["interface_ports"], "port_region"
                         )
-                        interface_generics_parsed = verilog_parsing.VerilogParser(
+                        interface_generics_parsed = parse_cache.ParseCache.get_parse_result(
+                            verilog_parsing.VerilogParser,
                             hdl_fsm_editor_design_dictionary["interface_generics"], "parameter_list"
                         )
                         library_names = ""
@@ -197,7 +211,7 @@ class SymbolDefine:
                 number_of_files = 1
                 module_library = ""
                 additional_sources = []
-                hdl_parsed = verilog_parsing.VerilogParser(data_read, "module")
+                hdl_parsed = parse_cache.ParseCache.get_parse_result(verilog_parsing.VerilogParser, data_read, "module")
                 library_names = ""
                 package_names = ""
                 entity_name = hdl_parsed.get("entity_name")
@@ -217,7 +231,7 @@ class SymbolDefine:
                 number_of_files = 1
                 module_library = ""
                 additional_sources = []
-                hdl_parsed = verilog_parsing.VerilogParser(data_read, "module")
+                hdl_parsed = parse_cache.ParseCache.get_parse_result(verilog_parsing.VerilogParser, data_read, "module")
                 library_names = ""
                 package_names = ""
                 entity_name = hdl_parsed.get("entity_name")
@@ -45,7 +45,7 @@ from tkinter import messagebox
 import constants
 from actions import edit_line, edit_text
 from codegen import hdl_generate_through_hierarchy
-from data_io import file_read
+from data_io import design_metadata, file_read
 from elements import (
     interface_inout,
     interface_input,
@@ -82,23 +82,10 @@ class Symbol:
         self.funcid_delete = None
         self.func_id_motion = None
         self.func_id_button_release = None
-        self.sym_bind_funcid_button = None
-        self.sym_bind_funcid_dbutton = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
-        self.sym_bind_funcid_menu = None
-        self.sym_bind_funcid_edit_in = None
-        self.sym_bind_funcid_edit_gb = None
-        self.sym_bind_funcid_polygons = {}
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         self.original_text = None
         self.background_rectangle = None
         self.after_identifier = None
-        self.sym_bind_funcid_port_show = {}
-        self.sym_bind_funcid_port_hide = {}
-        self.sym_bind_funcid_show1 = None
-        self.sym_bind_funcid_hide1 = None
-        self.sym_bind_funcid_show2 = None
-        self.sym_bind_funcid_hide2 = None
         rectangle_coords = self.symbol_definition["rectangle"]["coords"]
         if "symbol_color" in self.symbol_definition["rectangle"]:
             symbol_color = self.symbol_definition["rectangle"]["symbol_color"]
@@ -357,6 +344,7 @@ class Symbol:
             self.symbol_definition["rectangle"]["canvas_id"], push_design_to_stack
         )
         self.diagram_tab.canvas.delete(self.symbol_definition["object_tag"])
+        self.__remove_bindings_from_symbol()
         # create_canvas_bindings() is needed because when "self" is deleted after
         # entering the symbol, no __at_leave will take place:
         self.diagram_tab.create_canvas_bindings()
@@ -371,76 +359,35 @@ class Symbol:
             self.diagram_tab.canvas.bind("<Delete>", lambda event: self.diagram_tab.delete_selection())
 
     def __add_bindings_to_symbol(self):
-        self.sym_bind_funcid_button = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["rectangle"]["canvas_id"],
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        rectangle_canvas_id = self.symbol_definition["rectangle"]["canvas_id"]
+        dispatcher.bind(
+            self,
+            rectangle_canvas_id,
             "<Button-1>",
             lambda event: symbol_rectangle_move.RectangleMove(
                 event, self.window, self.diagram_tab, self, self.symbol_definition
             ),
         )
-        self.sym_bind_funcid_dbutton = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["rectangle"]["canvas_id"],
-            "<Double-Button-1>",
-            lambda event: self.__open_source_code_after_idle(),
-        )
-        self.sym_bind_funcid_enter = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Enter>", lambda event: self.__at_enter()
-        )
-        self.sym_bind_funcid_leave = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Leave>", lambda event: self.__at_leave()
-        )
-        self.sym_bind_funcid_menu = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Button-3>", self.__show_menu
+        dispatcher.bind(
+            self, rectangle_canvas_id, "<Double-Button-1>", lambda event: self.__open_source_code_after_idle()
         )
+        dispatcher.bind(self, rectangle_canvas_id, "<Enter>", lambda event: self.__at_enter())
+        dispatcher.bind(self, rectangle_canvas_id, "<Leave>", lambda event: self.__at_leave())
+        dispatcher.bind(self, rectangle_canvas_id, "<Button-3>", self.__show_menu)
         for port_definition in self.symbol_definition["port_list"]:
-            self.sym_bind_funcid_polygons[port_definition["canvas_id"]] = self.diagram_tab.canvas.tag_bind(
-                port_definition["canvas_id"],
-                "<Button-1>",
-                lambda evt, canv_id=port_definition["canvas_id"], portname_canv_id=port_definition["canvas_id_text"]: (
-                    symbol_polygon_move.PolygonMove(
-                        evt, self.window, self.diagram_tab, self, canv_id, portname_canv_id, True
-                    )
-                ),
-            )
-            self.sym_bind_funcid_port_show[port_definition["canvas_id_text"]] = self.diagram_tab.canvas.tag_bind(
-                port_definition["canvas_id_text"],
-                "<Enter>",
-                lambda event, canvas_id_text=port_definition["canvas_id_text"]: self.show_port_type(canvas_id_text),
+            self.add_bindings_to_port(port_definition)
+        for key in ("entity_name", "instance_name"):
+            canvas_id = self.symbol_definition[key]["canvas_id"]
+            dispatcher.add_sub_item(self, canvas_id)
+            dispatcher.bind(
+                self, canvas_id, "<Enter>", lambda event, canvas_id=canvas_id: self.__show_symbol_info_start(canvas_id)
             )
-            self.sym_bind_funcid_port_hide[port_definition["canvas_id_text"]] = self.diagram_tab.canvas.tag_bind(
-                port_definition["canvas_id_text"],
-                "<Leave>",
-                lambda event, canvas_id_text=port_definition["canvas_id_text"]: self.hide_port_type(canvas_id_text),
+            dispatcher.bind(
+                self, canvas_id, "<Leave>", lambda event, canvas_id=canvas_id: self.__hide_symbol_info(canvas_id)
             )
-        self.sym_bind_funcid_show1 = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["entity_name"]["canvas_id"],
-            "<Enter>",
-            lambda event, canvas_id=self.symbol_definition["entity_name"]["canvas_id"]: self.__show_symbol_info_start(
-                canvas_id
-            ),
-        )
-        self.sym_bind_funcid_hide1 = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["entity_name"]["canvas_id"],
-            "<Leave>",
-            lambda event, canvas_id=self.symbol_definition["entity_name"]["canvas_id"]: self.__hide_symbol_info(
-                canvas_id
-            ),
-        )
-        self.sym_bind_funcid_show2 = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["instance_name"]["canvas_id"],
-            "<Enter>",
-            lambda event, canvas_id=self.symbol_definition["instance_name"]["canvas_id"]: self.__show_symbol_info_start(
-                canvas_id
-            ),
-        )
-        self.sym_bind_funcid_hide2 = self.diagram_tab.canvas.tag_bind(
-            self.symbol_definition["instance_name"]["canvas_id"],
-            "<Leave>",
-            lambda event, canvas_id=self.symbol_definition["instance_name"]["canvas_id"]: self.__hide_symbol_info(
-                canvas_id
-            ),
-        )
-        self.sym_bind_funcid_edit_in = self.diagram_tab.canvas.tag_bind(
+        dispatcher.bind(
+            self,
             self.symbol_definition["instance_name"]["canvas_id"],
             "<Double-Button-1>",
             lambda event: edit_line.EditLine(
@@ -448,7 +395,9 @@ class Symbol:
             ),
         )
         if "generic_block" in self.symbol_definition:
-            self.sym_bind_funcid_edit_gb = self.diagram_tab.canvas.tag_bind(
+            dispatcher.add_sub_item(self, self.symbol_definition["generic_block"]["canvas_id"])
+            dispatcher.bind(
+                self,
                 self.symbol_definition["generic_block"]["canvas_id"],
                 "<Double-Button-1>",
                 lambda event: edit_text.EditText(
@@ -460,6 +409,43 @@ class Symbol:
                 ),
             )
 
+    def add_bindings_to_port(self, port_definition):
+        """Adds the bindings to the polygon and to the name of a port, also used for new ports at a symbol update."""
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        dispatcher.add_sub_item(self, port_definition["canvas_id"])
+        dispatcher.add_sub_item(self, port_definition["canvas_id_text"])
+        dispatcher.bind(
+            self,
+            port_definition["canvas_id"],
+            "<Button-1>",
+            lambda evt, canv_id=port_definition["canvas_id"], portname_canv_id=port_definition["canvas_id_text"]: (
+                symbol_polygon_move.PolygonMove(
+                    evt, self.window, self.diagram_tab, self, canv_id, portname_canv_id, True
+                )
+            ),
+        )
+        dispatcher.bind(
+            self,
+            port_definition["canvas_id_text"],
+            "<Enter>",
+            lambda event, canvas_id_text=port_definition["canvas_id_text"]: self.show_port_type(canvas_id_text),
+        )
+        dispatcher.bind(
+            self,
+            port_definition["canvas_id_text"],
+            "<Leave>",
+            lambda event, canvas_id_text=port_definition["canvas_id_text"]: self.hide_port_type(canvas_id_text),
+        )
+
+    def remove_bindings_from_port(self, port_definition):
+        """Removes the bindings from the polygon and from the name of a port, also used for removed ports."""
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        dispatcher.unbind(self, port_definition["canvas_id"], "<Button-1>")
+        dispatcher.unbind(self, port_definition["canvas_id_text"], "<Enter>")
+        dispatcher.unbind(self, port_definition["canvas_id_text"], "<Leave>")
+        dispatcher.remove_sub_item(port_definition["canvas_id"])
+        dispatcher.remove_sub_item(port_definition["canvas_id_text"])
+
     def show_port_type(self, canvas_id_text):
         """Shows the port type of a port after a delay of 1 second, when the mouse is hovering over the port name."""
         self.after_identifier = self.diagram_tab.canvas.after(
@@ -521,66 +507,16 @@ class Symbol:
             )
 
     def __remove_bindings_from_symbol(self):
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Button-1>", self.sym_bind_funcid_button
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Double-Button-1>", self.sym_bind_funcid_dbutton
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Enter>", self.sym_bind_funcid_enter
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Leave>", self.sym_bind_funcid_leave
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["entity_name"]["canvas_id"], "<Enter>", self.sym_bind_funcid_show1
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["entity_name"]["canvas_id"], "<Leave>", self.sym_bind_funcid_hide1
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["rectangle"]["canvas_id"], "<Button-3>", self.sym_bind_funcid_menu
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["instance_name"]["canvas_id"], "<Double-Button-1>", self.sym_bind_funcid_edit_in
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["instance_name"]["canvas_id"], "<Enter>", self.sym_bind_funcid_show2
-        )
-        self.diagram_tab.canvas.tag_unbind(
-            self.symbol_definition["instance_name"]["canvas_id"], "<Leave>", self.sym_bind_funcid_hide2
-        )
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        for event in ("<Button-1>", "<Double-Button-1>", "<Enter>", "<Leave>", "<Button-3>"):
+            dispatcher.unbind(self, self.symbol_definition["rectangle"]["canvas_id"], event)
         for port_definition in self.symbol_definition["port_list"]:
-            self.diagram_tab.canvas.tag_unbind(
-                port_definition["canvas_id"], "<Button-1>", self.sym_bind_funcid_polygons[port_definition["canvas_id"]]
-            )
-            self.diagram_tab.canvas.tag_unbind(
-                port_definition["canvas_id_text"],
-                "<Enter>",
-                self.sym_bind_funcid_port_show[port_definition["canvas_id_text"]],
-            )
-            self.diagram_tab.canvas.tag_unbind(
-                port_definition["canvas_id_text"],
-                "<Leave>",
-                self.sym_bind_funcid_port_hide[port_definition["canvas_id_text"]],
-            )
-        if "generic_block" in self.symbol_definition:
-            self.diagram_tab.canvas.tag_unbind(
-                self.symbol_definition["generic_block"]["canvas_id"], "<Double-Button-1>", self.sym_bind_funcid_edit_gb
-            )
-        self.sym_bind_funcid_button = None
-        self.sym_bind_funcid_dbutton = None
-        self.sym_bind_funcid_enter = None
-        self.sym_bind_funcid_leave = None
-        self.sym_bind_funcid_menu = None
-        self.sym_bind_funcid_edit_in = None
-        self.sym_bind_funcid_edit_gb = None
-        self.sym_bind_funcid_polygons = {}
-        self.sym_bind_funcid_show1 = None
-        self.sym_bind_funcid_hide1 = None
-        self.sym_bind_funcid_show2 = None
-        self.sym_bind_funcid_hide2 = None
+            self.remove_bindings_from_port(port_definition)
+        for key in ("entity_name", "instance_name", "generic_block"):
+            if key in self.symbol_definition:
+                for event in ("<Double-Button-1>", "<Enter>", "<Leave>"):
+                    dispatcher.unbind(self, self.symbol_definition[key]["canvas_id"], event)
+                dispatcher.remove_sub_item(self.symbol_definition[key]["canvas_id"])
 
     def __at_enter(self):
         if not self.diagram_tab.canvas.find_withtag("selected"):
@@ -664,11 +600,20 @@ class Symbol:
                 self.store_item(push_design_to_stack=True, signal_design_change=True)
         self.__close_menu(menue_window, menu)
 
-    def update_symbol_from_source_without_generics(self, show_ranges):
+    def update_symbol_from_source_without_generics(self, show_ranges, symbol_define_refs=None):
         """Updates the symbol from the source code, without updating the generics"""
+        # symbol_define_refs = {filename: SymbolDefine-object} can be shared by the updates of several instances,
+        # so that each source file is read (and the user is asked about a backup file) only once.
         if show_ranges is True:
             self.symbol_definition["port_range_visibility"] = "Show"
-        symbol_define_ref = symbol_define.SymbolDefine(self.root, self.window, self.diagram_tab, self.get_filename())
+        if symbol_define_refs is None:
+            symbol_define_refs = {}
+        filename = self.get_filename()
+        if filename not in symbol_define_refs:
+            symbol_define_refs[filename] = symbol_define.SymbolDefine(
+                self.root, self.window, self.diagram_tab, filename
+            )
+        symbol_define_ref = symbol_define_refs[filename]
         symbol_update_ports.SymbolUpdatePorts(self.root, self.window, self.diagram_tab, self, symbol_define_ref)
         symbol_update_infos.SymbolUpdateInfos(
             self.root,
@@ -1117,26 +1062,30 @@ class Symbol:
         for opened_subwindow in schematic_window.SchematicWindow.open_window_dict:
             if opened_subwindow.design.get_path_name() == self.symbol_definition["filename"]:
                 submodule_window = opened_subwindow
-        if submodule_window is not None:  # is None for HFE- or HDL- instances
-            if new_architecture_name in submodule_window.notebook_top.diagram_tab.architecture_list:
+        if submodule_window is not None:
+            architecture_list = submodule_window.notebook_top.diagram_tab.architecture_list
+        elif self.symbol_definition["filename"].endswith(".hse"):
+            # Sub-modules are read without window (see design_metadata), so the architectures are read from the file:
+            architecture_list = design_metadata.DesignMetadata.get_architecture_list(self.symbol_definition["filename"])
+        else:
+            architecture_list = None  # HFE- or HDL- instances
+        if architecture_list is None:
+            # The architectures of the module are not known, because it is no HDL-SCHEM-Editor design or
+            # its design file could not be read.
+            self.symbol_definition["architecture_name"] = new_architecture_name
+            self.__change_architecture_string_at_symbol()
+        elif new_architecture_name in architecture_list:
+            if submodule_window is not None:
                 old_architecture_name = self.symbol_definition["architecture_name"]
                 if submodule_window.design.get_architecture_name() != new_architecture_name:
                     submodule_window.design.open_existing_schematic(old_architecture_name, new_architecture_name)
                     submodule_window.notebook_top.diagram_tab.architecture_combobox.set(new_architecture_name)
-                self.symbol_definition["architecture_name"] = new_architecture_name
-                self.__change_architecture_string_at_symbol()
-            elif new_architecture_name != "":  # Equal "" in Verilog designs.
-                messagebox.showerror(
-                    "Error by switching architectures:", "Architecture " + new_architecture_name + " does not exist."
-                )
-        else:
-            # No opened_window was found for the design with this filename: self.symbol_definition["filename"]
-            # This happens, when during link-dictionary generation no valid HDL was found for an instance.
-            # Then linking is not possible as HDL and source file have different versions of the module.
-            # Because no link-generation for this module was possible, no read of the module design file to
-            # the open_window_dict was started.
             self.symbol_definition["architecture_name"] = new_architecture_name
             self.__change_architecture_string_at_symbol()
+        elif new_architecture_name != "":  # Equal "" in Verilog designs.
+            messagebox.showerror(
+                "Error by switching architectures:", "Architecture " + new_architecture_name + " does not exist."
+            )
 
     def __change_architecture_string_at_symbol(self):
         if self.symbol_definition["architecture_name"] != "":
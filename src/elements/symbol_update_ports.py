@@ -3,7 +3,6 @@ When a symbol is updated, this class removes obsolete ports, adds new ports and
 """
 
 import constants
-from elements import symbol_polygon_move
 
 
 class SymbolUpdatePorts:
@@ -55,31 +54,7 @@ class SymbolUpdatePorts:
                 tag=(symbol.symbol_definition["object_tag"], "instance-text", "schematic-element"),
             )
             symbol.symbol_definition["port_list"].append(new_port_entry)
-
-            symbol.sym_bind_funcid_port_show[new_port_entry["canvas_id_text"]] = self.diagram_tab.canvas.tag_bind(
-                new_port_entry["canvas_id_text"],
-                "<Enter>",
-                lambda event, canvas_id_text=new_port_entry["canvas_id_text"]: self.symbol.show_port_type(
-                    canvas_id_text
-                ),
-            )
-            symbol.sym_bind_funcid_port_hide[new_port_entry["canvas_id_text"]] = self.diagram_tab.canvas.tag_bind(
-                new_port_entry["canvas_id_text"],
-                "<Leave>",
-                lambda event, canvas_id_text=new_port_entry["canvas_id_text"]: self.symbol.hide_port_type(
-                    canvas_id_text
-                ),
-            )
-
-            symbol.sym_bind_funcid_polygons[new_port_entry["canvas_id"]] = self.diagram_tab.canvas.tag_bind(
-                new_port_entry["canvas_id"],
-                "<Button-1>",
-                lambda event, canv_id=new_port_entry["canvas_id"], portname_canv_id=new_port_entry["canvas_id_text"]: (
-                    symbol_polygon_move.PolygonMove(
-                        event, self.window, self.diagram_tab, symbol, canv_id, portname_canv_id, True
-                    )
-                ),
-            )
+            symbol.add_bindings_to_port(new_port_entry)
         for change_entry in ports_type_change:
             # change_entry ={"index_in_port_list": index_in_port_list, "index_in_port_list_upd": index_in_port_list_upd,
             #                "direction_change": direction_has_changed, "declaration": port_declaration}
@@ -98,6 +73,7 @@ class SymbolUpdatePorts:
                 self.__update_polygon_in_symbol_definition(change_entry, polygon_coords_new)
                 self.__update_polygon_in_graphics(change_entry, polygon_coords_new)
         for port_to_remove in ports_to_remove:
+            symbol.remove_bindings_from_port(symbol.symbol_definition["port_list"][port_to_remove])
             self.diagram_tab.canvas.delete(symbol.symbol_definition["port_list"][port_to_remove]["canvas_id"])
             self.diagram_tab.canvas.delete(symbol.symbol_definition["port_list"][port_to_remove]["canvas_id_text"])
             symbol_definition_port_list_entries_to_remove.append(
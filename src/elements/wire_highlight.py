@@ -6,7 +6,7 @@ This object carries all information of all highlighted canvas lines in the compl
 import re
 from tkinter import messagebox
 
-from codegen import hdl_generate, hdl_generate_functions
+from codegen import hdl_generate_functions
 from gui import schematic_window
 
 
@@ -71,26 +71,21 @@ class WireHighlight:
             window, signal_name, list_of_canvas_ids_to_highlight, color, old_wire_width
         )
         if depth == "hierarchical":
-            instance_connection_definitions = self._get_connection_info_for_all_instances(window)
-            for instance_connection_definition in instance_connection_definitions:
-                if self._signal_is_connected_to_instance(window, instance_connection_definition, signal_name):
-                    filename = self._get_filename_of_instance(window, instance_connection_definition)
-                    if filename.endswith(".hse"):
-                        sub_window = self._load_design(filename)
-                        if sub_window.design.get_module_name() != "":  # File Read was a success.
-                            if window.design.get_language() == "VHDL":
-                                port_name = re.sub(r"\s*:.*", "", instance_connection_definition["port_declaration"])
-                            else:
-                                port_name = instance_connection_definition["port_declaration"].split()[-1]
-                            self._fill_highlight_dict_for_this_window(
-                                sub_window, port_name, old_wire_width, color, depth
-                            )
+            # The net index of each design is cached, so the traversal of the hierarchy only follows its edges:
+            for instance_connection_definition in window.design.get_instance_connections_of_net(signal_name):
+                filename = self._get_filename_of_instance(window, instance_connection_definition)
+                if filename.endswith(".hse"):
+                    sub_window = self._load_design(window, filename, instance_connection_definition)
+                    if sub_window.design.get_module_name() != "":  # File Read was a success.
+                        if window.design.get_language() == "VHDL":
+                            port_name = re.sub(r"\s*:.*", "", instance_connection_definition["port_declaration"])
+                        else:
+                            port_name = instance_connection_definition["port_declaration"].split()[-1]
+                        self._fill_highlight_dict_for_this_window(sub_window, port_name, old_wire_width, color, depth)
 
     def _get_signal_name(self, window, canvas_id):
         wire_reference = window.design.get_references([canvas_id])[0]
-        canvas_id_of_signal_name = window.notebook_top.diagram_tab.canvas.find_withtag(
-            wire_reference.wire_tag + "_signal_name"
-        )[0]
+        canvas_id_of_signal_name = window.design.get_signal_name_canvas_id(wire_reference.wire_tag)
         signal_declaration = window.design.get_signal_declaration(canvas_id_of_signal_name)
         signal_name, _, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.split_declaration(
             signal_declaration, window.design.get_language()
@@ -98,22 +93,7 @@ class WireHighlight:
         return signal_name
 
     def _get_list_of_canvas_ids_to_highlight(self, window, signal_name):
-        signal_name_references = window.design.get_list_of_canvas_signal_name_references()
-        list_of_canvas_ids_to_highlight = []
-        for signal_name_reference in signal_name_references:
-            other_signal_name, _, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.split_declaration(
-                signal_name_reference.declaration, window.design.get_language()
-            )
-            if other_signal_name == signal_name:
-                canvas_ids_of_wire_and_name = window.notebook_top.diagram_tab.canvas.find_withtag(
-                    signal_name_reference.wire_tag
-                )
-                for canvas_id in canvas_ids_of_wire_and_name:
-                    if window.notebook_top.diagram_tab.canvas.type(
-                        canvas_id
-                    ) == "line" and "grid_line" not in window.notebook_top.diagram_tab.canvas.gettags(canvas_id):
-                        list_of_canvas_ids_to_highlight.append(canvas_id)
-        return list_of_canvas_ids_to_highlight
+        return window.design.get_wire_canvas_ids_of_net(signal_name)
 
     def _create_entry_in_highlight_dict(
         self, window, signal_name, list_of_canvas_ids_to_highlight, color, old_wire_width
@@ -127,38 +107,15 @@ class WireHighlight:
         self.highlight_dict[hse_filename][signal_name]["width"] = old_wire_width
         self.highlight_dict[hse_filename][signal_name]["highlight_id"] = self.highlight_id
 
-    def _get_connection_info_for_all_instances(self, window):
-        (
-            _,  # List of dictionaries {"type" : "input"|"output"|"inout", "coords" : [x1, y1, ...]}
-            wire_location_list,  # List of dictionaries {"declaration" : <string>, "coords" : [x1, y1, ...]}
-            _,  # Dictionary of {<Canvas-ID>: "HDL", <Canvas-ID>: "HDL", ...]
-            symbol_definition_list,  # List: [symbol_definition1, symbol_definition2, ...]
-            _,  # List: [generate_definition1, generate_definition2, ...]
-        ) = window.design.get_connection_data()
-        all_pins_definition_list, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.extract_data_from_symbols(
-            symbol_definition_list
-        )
-        _, _, _, _, instance_connection_definitions = hdl_generate.GenerateHDL.create_declarations(
-            window.design.get_language(), window.design.get_grid_size(), all_pins_definition_list, wire_location_list
-        )
-        return instance_connection_definitions
-
-    def _signal_is_connected_to_instance(self, window, instance_connection_definition, signal_name):
-        connected_signal, _, _, _, _, _ = hdl_generate_functions.HdlGenerateFunctions.split_declaration(
-            instance_connection_definition["declaration"], window.design.get_language()
-        )
-        return signal_name == connected_signal
-
     def _get_filename_of_instance(self, window, instance_connection_definition):
         reference_to_instance = window.design.get_references([instance_connection_definition["canvas_id"]])[0]
         return reference_to_instance.get_filename()
 
-    def _load_design(self, filename):
-        sub_window = None
-        for open_window in schematic_window.SchematicWindow.open_window_dict:
-            if open_window.design.get_path_name() == filename:
-                sub_window = open_window
-        return sub_window
+    def _load_design(self, window, filename, instance_connection_definition):
+        reference_to_instance = window.design.get_references([instance_connection_definition["canvas_id"]])[0]
+        return schematic_window.SchematicWindow.get_subwindow(
+            window.root, filename, reference_to_instance.symbol_definition["architecture_name"]
+        )
 
     def unhighlight_all_and_delete_object(self):
         """Unhighlight all highlighted nets in the complete schematic and delete the highlight object."""
@@ -171,8 +128,9 @@ class WireHighlight:
 
     def _unhighlight_wire_in_open_schematic(self, open_window, filename, signal_name):
         """Unhighlight a specific wire in an open schematic."""
+        all_canvas_ids = set(open_window.notebook_top.diagram_tab.canvas.find_all())
         for canvas_id in self.highlight_dict[filename][signal_name]["canvas_ids"]:
-            if canvas_id in open_window.notebook_top.diagram_tab.canvas.find_all():
+            if canvas_id in all_canvas_ids:
                 open_window.notebook_top.diagram_tab.canvas.itemconfigure(
                     canvas_id, fill="black", width=self.highlight_dict[filename][signal_name]["width"]
                 )
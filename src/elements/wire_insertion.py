@@ -63,11 +63,7 @@ class Wire:
         self.endpoints_connected_at_symbol_move = None
         self.segment_direction_at_symbol_move = {"first": None, "last": None}
         self.signal_name_showed_at_enter = 0
-        self.wire_bind_funcid_button = None
-        self.wire_bind_funcid_cbutton = None
-        self.wire_bind_funcid_sbutton = None
-        self.wire_bind_funcid_enter = None
-        self.wire_bind_funcid_leave = None
+        self.event_handlers = {}  # Used by the canvas event dispatcher.
         self.funcid_delete = None
         self.funcid_button = None
         self.funcid_motion = None
@@ -673,45 +669,32 @@ class Wire:
         # When shift_was_pressed=True:
         # 1. Wires can be disconnected from symbol pins.
         # 2. A new segment can be added to an open wire end.
-        self.wire_bind_funcid_button = self.diagram_tab.canvas.tag_bind(
+        dispatcher = self.diagram_tab.canvas_event_dispatcher
+        dispatcher.bind(
+            self,
             self.canvas_id,
             "<Button-1>",
             lambda event: wire_move.WireMove(
                 event, self.window, self.diagram_tab, self, self.canvas_id, self.wire_tag, shift_was_pressed=False
             ),
         )
-        self.wire_bind_funcid_cbutton = self.diagram_tab.canvas.tag_bind(
+        dispatcher.bind(
+            self,
             self.canvas_id,
             "<Shift-Button-1>",
             lambda event: wire_move.WireMove(
                 event, self.window, self.diagram_tab, self, self.canvas_id, self.wire_tag, shift_was_pressed=True
             ),
         )
-        self.wire_bind_funcid_sbutton = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Shift-Button-3>", lambda event: self._add_arrow()
-        )
-        self.wire_bind_funcid_enter = self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Enter>", self._at_enter)
-        self.wire_bind_funcid_leave = self.diagram_tab.canvas.tag_bind(
-            self.canvas_id, "<Leave>", lambda event: self._at_leave()
-        )
-        self.diagram_tab.canvas.tag_bind(self.canvas_id, "<Button-3>", self._show_menu)
+        dispatcher.bind(self, self.canvas_id, "<Shift-Button-3>", lambda event: self._add_arrow())
+        dispatcher.bind(self, self.canvas_id, "<Enter>", self._at_enter)
+        dispatcher.bind(self, self.canvas_id, "<Leave>", lambda event: self._at_leave())
+        dispatcher.bind(self, self.canvas_id, "<Button-3>", self._show_menu)
 
     def _remove_bindings_from_wire(self):
-        if self.wire_bind_funcid_button is not None:
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Button-1>", self.wire_bind_funcid_button)
-        if self.wire_bind_funcid_sbutton is not None:
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Control-Button-1>", self.wire_bind_funcid_cbutton)
-        if self.wire_bind_funcid_enter is not None:
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Shift-Button-1>", self.wire_bind_funcid_sbutton)
-        if self.wire_bind_funcid_enter is not None:
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Enter>", self.wire_bind_funcid_enter)
-        if self.wire_bind_funcid_leave is not None:
-            self.diagram_tab.canvas.tag_unbind(self.canvas_id, "<Leave>", self.wire_bind_funcid_leave)
-        self.wire_bind_funcid_button = None
-        self.wire_bind_funcid_sbutton = None
-        self.wire_bind_funcid_enter = None
-        self.wire_bind_funcid_enter = None
-        self.wire_bind_funcid_leave = None
+        # The menu stays available at a selected wire.
+        for event in ("<Button-1>", "<Shift-Button-1>", "<Shift-Button-3>", "<Enter>", "<Leave>"):
+            self.diagram_tab.canvas_event_dispatcher.unbind(self, self.canvas_id, event)
 
     def _at_enter(self, event):
         if not self.diagram_tab.canvas.find_withtag("selected"):
@@ -760,7 +743,7 @@ class Wire:
     def delete_item(self, push_design_to_stack):
         """This method is used for deleting the wire."""
         self._restore_delete_binding()
-        canvas_id_signal_name = self.diagram_tab.canvas.find_withtag(self.wire_tag + "_signal_name")[0]
+        canvas_id_signal_name = self.window.design.get_signal_name_canvas_id(self.wire_tag)
         reference_signal_name = self.window.design.get_references([canvas_id_signal_name])[0]
         reference_signal_name.delete_item(push_design_to_stack=False)
         self.window.design.remove_canvas_item_from_dictionary(self.canvas_id, push_design_to_stack)
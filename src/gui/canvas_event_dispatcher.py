@@ -0,0 +1,73 @@
+"""
+The mouse and key bindings of the schematic elements (wires, signal names, ports, instances, blocks, generate frames).
+Binding each canvas item separately creates a Tcl binding and a Python callback for each item and each event, which
+costs memory and time at loading big schematics. So each event is bound only once at the tag "schematic-element",
+which all canvas items of the schematic elements have. When the event occurs, the canvas item under the mouse pointer
+is determined by the tag "current" and its schematic element is looked up in the canvas dictionary of the design.
+Canvas items, which are not stored in the canvas dictionary (for example the ports of a symbol), are registered as
+sub items of their schematic element.
+Each schematic element stores its handlers in its attribute event_handlers = {(canvas_id, event): handler}.
+"""
+
+import tkinter as tk
+
+# Tk calls the less specific binding, when no binding exists for the more specific event at the canvas item.
+# As the events are bound at a tag shared by all elements, the less specific handler is searched by the dispatcher:
+_LESS_SPECIFIC_EVENTS = {
+    "<Double-Button-1>": "<Button-1>",
+    "<Shift-Button-1>": "<Button-1>",
+    "<Shift-Button-3>": "<Button-3>",
+}
+
+
+class CanvasEventDispatcher:
+    """This class dispatches the events at canvas items to the handlers of the schematic elements."""
+
+    def __init__(self, canvas, design):
+        self.canvas = canvas
+        self.design = design
+        self.owners_of_sub_items = {}  # {canvas_id: schematic element}
+        self.bound_events = set()
+
+    def bind(self, element, canvas_id, event, handler):
+        """Replaces canvas.tag_bind(canvas_id, event, handler) for a canvas item of a schematic element."""
+        element.event_handlers[canvas_id, event] = handler
+        if event not in self.bound_events:
+            self.bound_events.add(event)
+            self.canvas.tag_bind("schematic-element", event, lambda tk_event: self._dispatch(tk_event, event))
+
+    def unbind(self, element, canvas_id, event):
+        """Replaces canvas.tag_unbind(canvas_id, event) for a canvas item of a schematic element."""
+        element.event_handlers.pop((canvas_id, event), None)
+
+    def add_sub_item(self, element, canvas_id):
+        """Registers a canvas item of the element, which is not stored in the canvas dictionary."""
+        self.owners_of_sub_items[canvas_id] = element
+
+    def remove_sub_item(self, canvas_id):
+        """Must be called, when a registered canvas item is deleted."""
+        self.owners_of_sub_items.pop(canvas_id, None)
+
+    def clear(self):
+        """Must be called, when all canvas items are deleted."""
+        self.owners_of_sub_items.clear()
+
+    def _dispatch(self, tk_event, event):
+        if tk_event.type == tk.EventType.KeyPress:  # Key events are sent to the canvas item which has the focus.
+            canvas_ids = self.canvas.find_withtag(self.canvas.focus())
+        else:
+            canvas_ids = self.canvas.find_withtag("current")
+        if not canvas_ids:
+            return None
+        canvas_id = canvas_ids[0]
+        handler = None
+        for element in self.design.get_references([canvas_id]) + [self.owners_of_sub_items.get(canvas_id)]:
+            event_handlers = getattr(element, "event_handlers", {})
+            handler = event_handlers.get((canvas_id, event))
+            if handler is None and event in _LESS_SPECIFIC_EVENTS:
+                handler = event_handlers.get((canvas_id, _LESS_SPECIFIC_EVENTS[event]))
+            if handler is not None:
+                break
+        if handler is None:
+            return None
+        return handler(tk_event)
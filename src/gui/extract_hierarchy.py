@@ -4,7 +4,7 @@ This class determines the hierarchy of a VHDL or a Verilog module.
 
 from tkinter import messagebox
 
-from hdl_parser import verilog_parsing, vhdl_parsing
+from data_io import hdl_file_summary
 
 # This is an example of a hierarchy dictionary created here:
 # hierarchy-dict = {
@@ -39,9 +39,12 @@ from hdl_parser import verilog_parsing, vhdl_parsing
 class ExtractHierarchy:
     """This class is used for extracting the hierarchy of a VHDL or a Verilog module."""
 
-    def __init__(self, instance_dict):
+    def __init__(self, instance_dict, revalidate_in_background=False):
         # The dictionary instance_dict has an empty list in instance_dict["sub_modules"].
         # This list is created here. All other entries are already filled.
+        # When revalidate_in_background is True, the old summary of a changed HDL file is used,
+        # until its new summary was created in the background (see hdl_file_summary).
+        self.revalidate_in_background = revalidate_in_background
         language = instance_dict["language"]
         if instance_dict["architecture_filename"] != "" and language == "VHDL":  # True for 2-file-VHDL
             filelist = [instance_dict["architecture_filename"]] + instance_dict["additional_files"]
@@ -96,14 +99,10 @@ class ExtractHierarchy:
         used_modules_dict = {}
         for file_name in file_name_list:
             try:
-                with open(file_name, encoding="utf-8") as fileobject:
-                    data_read = fileobject.read()
-                if language == "VHDL":
-                    hdl_dict = vhdl_parsing.VhdlParser(data_read, "entity_context")
-                    entity_name_used_in_arch = hdl_dict.get("entity_name_used_in_architecture")
-                else:
-                    hdl_dict = verilog_parsing.VerilogParser(data_read, "module")
-                    entity_name_used_in_arch = hdl_dict.get("entity_name")
+                hdl_dict = hdl_file_summary.HdlFileSummary.get_summary(
+                    file_name, language, self.revalidate_in_background
+                )
+                entity_name_used_in_arch = hdl_dict.get("entity_name_used_in_architecture")
                 entity_name = hdl_dict.get("entity_name")
                 if entity_name == "":
                     if entity_name_used_in_arch == "":
@@ -1,5 +1,8 @@
 """
 This class draws a grid into the canvas.
+The grid is only drawn into the visible area of the canvas, so it must be redrawn at each scroll and zoom. In order
+not to delete and create all the grid lines again at each redraw, the canvas items of the lines are kept in a pool
+and only get new coordinates. Lines, which are not needed at the moment, are hidden.
 """
 
 
@@ -11,41 +14,69 @@ class GridDraw:
         self.diagram_tab = diagram_tab
         self.design = design
         self.canvas = canvas
+        self.horizontal_lines = []  # Canvas-IDs of the pool of horizontal grid lines.
+        self.vertical_lines = []
+        self.number_of_shown_lines = {"horizontal": 0, "vertical": 0}
 
     def draw_grid(self):
         """Draws a grid into the canvas."""
         if self.root.show_grid:
-            self.remove_grid()
             grid_size = self.design.get_grid_size()
             if grid_size > 10:
                 self._draw_horizontal_grid(grid_size)
                 self._draw_vertical_grid(grid_size)
+            else:
+                self.remove_grid()
             # self.canvas.create_oval(-2,-2,+2,+2, fill="red", tags="grid_line")
 
     def remove_grid(self):
-        """Removes the grid from the canvas."""
-        self.canvas.delete("grid_line")
+        """Removes the grid from the canvas (the lines are only hidden, so hidden lines are not found by bbox)."""
+        self._show_lines(self.horizontal_lines, "horizontal", [])
+        self._show_lines(self.vertical_lines, "vertical", [])
+
+    def forget_grid_lines(self):
+        """Must be called, when the grid lines were deleted together with all other canvas items."""
+        self.horizontal_lines = []
+        self.vertical_lines = []
+        self.number_of_shown_lines = {"horizontal": 0, "vertical": 0}
 
     def _draw_horizontal_grid(self, grid_size):
         x_min = self.diagram_tab.canvas_visible_area[0] - self.diagram_tab.canvas_visible_area[0] % grid_size
         x_max = self.diagram_tab.canvas_visible_area[2] + self.diagram_tab.canvas_visible_area[2] % grid_size
         y = self.diagram_tab.canvas_visible_area[1] - self.diagram_tab.canvas_visible_area[1] % grid_size
         y_max = self.diagram_tab.canvas_visible_area[3] + self.diagram_tab.canvas_visible_area[3] % grid_size
+        list_of_coords = []
         while y < y_max:
-            canvas_id_of_line = self.canvas.create_line(
-                x_min, y, x_max, y, dash=(1, 1), fill="gray85", tags=("grid_line", "layer5")
-            )
-            self.canvas.tag_raise("schematic-element", canvas_id_of_line)
+            list_of_coords.append([x_min, y, x_max, y])
             y += grid_size
+        self._show_lines(self.horizontal_lines, "horizontal", list_of_coords)
 
     def _draw_vertical_grid(self, grid_size):
         x = self.diagram_tab.canvas_visible_area[0] - self.diagram_tab.canvas_visible_area[0] % grid_size
         x_max = self.diagram_tab.canvas_visible_area[2] + self.diagram_tab.canvas_visible_area[2] % grid_size
         y_min = self.diagram_tab.canvas_visible_area[1] - self.diagram_tab.canvas_visible_area[1] % grid_size
         y_max = self.diagram_tab.canvas_visible_area[3] + self.diagram_tab.canvas_visible_area[3] % grid_size
+        list_of_coords = []
         while x < x_max:
-            canvas_id_of_line = self.canvas.create_line(
-                x, y_min, x, y_max, dash=(1, 1), fill="gray85", tags=("grid_line", "layer5")
-            )
-            self.canvas.tag_raise("schematic-element", canvas_id_of_line)
+            list_of_coords.append([x, y_min, x, y_max])
             x += grid_size
+        self._show_lines(self.vertical_lines, "vertical", list_of_coords)
+
+    def _show_lines(self, pool, direction, list_of_coords):
+        number_of_shown_lines = self.number_of_shown_lines[direction]
+        lines_were_created = False
+        for index, coords in enumerate(list_of_coords):
+            if index < len(pool):
+                self.canvas.coords(pool[index], *coords)
+                if index >= number_of_shown_lines:
+                    self.canvas.itemconfigure(pool[index], state="normal")
+            else:
+                pool.append(
+                    self.canvas.create_line(*coords, dash=(1, 1), fill="gray85", tags=("grid_line", "layer5"))
+                )
+                lines_were_created = True
+        for canvas_id in pool[len(list_of_coords) : number_of_shown_lines]:
+            self.canvas.itemconfigure(canvas_id, state="hidden")
+        self.number_of_shown_lines[direction] = len(list_of_coords)
+        if lines_were_created:
+            self.canvas.tag_lower("grid_line")  # All schematic elements must stay above the grid.
@@ -4,26 +4,32 @@ When a SchematicWindow object is created, also a HierarchyTree object is created
 
 When a file is read in by the user at last the "generated HDL" tab is updated by update_hdl_tab_from and
 also HdlGenerateHierarchy is called in order to fill the link-dictionary.
-During HDL generation all sub-modules are also read from file, if they are not already opened.
-Each file, which is read, calls its refresh-treeviews() method and so its sub-modules are stored in the
+The sub-modules which are not opened in a window are read by design_metadata without creating a window.
+The sub-modules which are HDL files are read by extract_hierarchy, which gets the summaries of the files from the
+cache in hdl_file_summary.
+Each file, which is opened in a window, calls its refresh-treeviews() method and so its sub-modules are stored in the
 treeview of the toplevel module. At each time a sub-module removes an instance or adds an instance the object
 in the the toplevel module is updated.
 
 When a change to the stack in design_data is done, then in design_data the "sorted_list_of_instance_dictionaries"
-is updated. After this update, design_data calls refresh-treeviews() from here.
-From there the method refresh_treeview_in_all_windows_by_top_module_window() is called.
+is updated. After this update, design_data calls refresh_treeviews_if_hierarchy_changed() from here, which calls
+refresh_treeviews() only when the instances, the module itself or the HDL files of the instances have changed.
+From there the method create_top_dict_if_top_module() is called in all windows.
 Only the toplevel gets active and creates a new hierarchy dictionary.
-When the dictionary is ready, then in all open windows insert_dict_into_treeview(top_dict) is called and
-all tree views are updated.
+When the dictionaries are ready, then in all open windows update_treeview(top_dicts) is called and
+all tree views are updated, by changing only the items which differ from the new hierarchy.
 
 See an example of the hierarchy tree at the end of this file.
 
 """
 
+import json
+import os
 import re
 import tkinter as tk
 from tkinter import ttk
 
+from data_io import design_metadata, hdl_file_summary
 from elements import symbol_instance
 from gui import extract_hierarchy
 
@@ -43,6 +49,9 @@ class HierarchyTree:
         self.hierarchy_button = ttk.Button(frame, text="Show hierarchy", command=self._hide_show_button_was_pressed)
         self.compile_order_list = {}
         self.top_dict = {}
+        self.revalidation_poll_is_scheduled = False
+        self.hierarchy_fingerprint = None
+        self.item_contents = {}  # {iid: (text, values)} of all items of the treeview
 
     def open_design_in_new_window(self, event, treeview_ref):
         """This method is bound to a doubleclick at each treeview item in notebook_diagram_tab."""
@@ -90,37 +99,95 @@ class HierarchyTree:
                 column_property["id"], width=column_property["width"]
             )
 
-    # When design_data detects changes in the database or diagram_tab detects "Undo/Redo" in the
-    # schematic or a toplevel window is closed, then this method is called:
+    # When design_data detects changes in the database, this method is called:
+    def refresh_treeviews_if_hierarchy_changed(self):
+        """Refreshes the treeviews, when the instances of this module or the HDL files of the instances changed."""
+        hierarchy_fingerprint = self._get_hierarchy_fingerprint()
+        if hierarchy_fingerprint != self.hierarchy_fingerprint:
+            self.hierarchy_fingerprint = hierarchy_fingerprint
+            self.refresh_treeviews()
+
+    def _get_hierarchy_fingerprint(self):
+        # Contains all information the hierarchy of this module is created from, so a design change which does not
+        # change the hierarchy (as moving a symbol or drawing a wire) does not refresh the treeviews.
+        sorted_list_of_instance_dictionaries = self.schematic_window.design.get_sorted_list_of_instance_dictionaries()
+        file_signatures = []
+        for instance_dict in sorted_list_of_instance_dictionaries:
+            if not instance_dict["filename"].endswith(".hse") and not instance_dict["filename"].endswith(".hfe"):
+                for file_name in [instance_dict["filename"], instance_dict["architecture_filename"]] + instance_dict[
+                    "additional_files"
+                ]:
+                    try:
+                        stat_result = os.stat(file_name)
+                        file_signatures.append([file_name, stat_result.st_mtime_ns, stat_result.st_size])
+                    except OSError:
+                        file_signatures.append([file_name, None, None])
+        return json.dumps([self._create_top_dict(), sorted_list_of_instance_dictionaries, file_signatures], default=str)
+
+    # When the hierarchy of a module may have changed or a toplevel window is closed, then this method is called:
     def refresh_treeviews(self):
-        """This method is called when design_data detects changes."""
+        """Creates the hierarchy of all toplevel modules and updates the treeviews of all windows."""
+        instantiated_module_names = self._get_instantiated_module_names()
+        top_dicts = []
         for open_window, _ in self.schematic_window.__class__.open_window_dict.items():
-            open_window.hierarchytree.remove_tree_and_update_top_module()
+            top_dict = open_window.hierarchytree.create_top_dict_if_top_module(instantiated_module_names)
+            if top_dict is not None:
+                top_dicts.insert(0, top_dict)  # The last toplevel module is shown first.
+        hdl_file_summary.HdlFileSummary.save()
         for open_window, _ in self.schematic_window.__class__.open_window_dict.items():
-            open_window.hierarchytree.refresh_treeview_in_all_windows_by_top_module_window()
+            open_window.hierarchytree.update_treeview(top_dicts)
+        if hdl_file_summary.HdlFileSummary.revalidation_is_running() and not self.revalidation_poll_is_scheduled:
+            self.revalidation_poll_is_scheduled = True
+            self.root.after(200, self._refresh_after_revalidation)
 
-    def remove_tree_and_update_top_module(self):
-        """Removes the tree and updates the top module."""
-        children = self.schematic_window.notebook_top.diagram_tab.treeview.get_children()
-        self.schematic_window.notebook_top.diagram_tab.treeview.delete(*children)
-        self.this_module_is_top_module = self._check_for_top_module()
+    def create_top_dict_if_top_module(self, instantiated_module_names):
+        """Returns the hierarchy dictionary of this module, when it is a toplevel module, otherwise None."""
+        # When this module is also found as an instance in a database, it can't be the toplevel:
+        self.this_module_is_top_module = self.schematic_window.design.get_module_name() not in instantiated_module_names
+        if not self.this_module_is_top_module:
+            return None
+        hdl_file_summary.HdlFileSummary.set_project_directory(self.schematic_window.design.get_working_directory())
+        top_dict = self._create_top_dict()
+        self._fill_sub_modules_into_top_dict(top_dict)
+        return top_dict
 
-    def _check_for_top_module(self):
+    def _get_instantiated_module_names(self):
+        # Collects the module names of all instances in the open windows and in all their sub-modules,
+        # which are not opened in a window and therefore are read by design_metadata.
+        instantiated_module_names = set()
+        path_names_of_open_windows = set()
+        instance_dicts_to_check = []
         for open_window, _ in self.schematic_window.__class__.open_window_dict.items():
-            for instance_dict in open_window.design.get_sorted_list_of_instance_dictionaries():
-                if instance_dict["module_name"] == self.schematic_window.design.get_module_name():
-                    # This module is also found as an instance in a database, so it can't be the toplevel.
-                    return False
-        return True
-
-    def refresh_treeview_in_all_windows_by_top_module_window(self):
-        """Refreshes the treeview in all windows by the top module window."""
-        if self.this_module_is_top_module:
-            self.top_dict = self._create_top_dict()
-            self._fill_sub_modules_into_top_dict()
-            for open_window, _ in self.schematic_window.__class__.open_window_dict.items():
-                open_window.hierarchytree.insert_dict_into_treeview(self.top_dict)
-            # self.create_hdl_file_list()
+            path_names_of_open_windows.add(open_window.design.get_path_name())
+            instance_dicts_to_check.extend(open_window.design.get_sorted_list_of_instance_dictionaries())
+        checked_designs = set()
+        while instance_dicts_to_check:
+            instance_dict = instance_dicts_to_check.pop()
+            instantiated_module_names.add(instance_dict["module_name"])
+            design_key = (instance_dict["filename"], instance_dict["architecture_name"])
+            if (
+                instance_dict["filename"].endswith(".hse")
+                and instance_dict["filename"] not in path_names_of_open_windows
+                and design_key not in checked_designs
+            ):
+                checked_designs.add(design_key)
+                instance_dicts_to_check.extend(
+                    design_metadata.DesignMetadata.get_sorted_list_of_instance_dictionaries(*design_key)
+                )
+        return instantiated_module_names
+
+    def _refresh_after_revalidation(self):
+        # The hierarchy tree was created with old summaries of changed HDL files, so it is refreshed again,
+        # when the new summaries are ready and differ from the old ones.
+        if hdl_file_summary.HdlFileSummary.revalidation_is_running():
+            self.root.after(200, self._refresh_after_revalidation)
+            return
+        self.revalidation_poll_is_scheduled = False
+        if (
+            hdl_file_summary.HdlFileSummary.take_revalidated_changes()
+            and self.schematic_window in self.schematic_window.__class__.open_window_dict
+        ):
+            self.refresh_treeviews()
 
     def _create_top_dict(self):
         library = self.schematic_window.design.get_module_library()
@@ -144,12 +211,12 @@ class HierarchyTree:
         }
         return top_dict
 
-    def _fill_sub_modules_into_top_dict(self):
+    def _fill_sub_modules_into_top_dict(self, top_dict):
         for instance_dict in self.schematic_window.design.get_sorted_list_of_instance_dictionaries():
-            if instance_dict["module_name"] != self.top_dict["module_name"]:
+            if instance_dict["module_name"] != top_dict["module_name"]:
                 sub_module_dict = self.get_sub_module_dict(instance_dict)
                 if sub_module_dict is not None:
-                    self.top_dict["sub_modules"].append(sub_module_dict)
+                    top_dict["sub_modules"].append(sub_module_dict)
 
     def get_sub_module_dict(self, instance_dict):
         """This method is called for each instance in the toplevel module."""
@@ -160,18 +227,38 @@ class HierarchyTree:
             or instance_dict["filename"].endswith(".sv")
         ):
             sub_module_dict["sub_modules"] = extract_hierarchy.ExtractHierarchy(
-                instance_dict
+                instance_dict, revalidate_in_background=True
             ).get_list_of_sub_modules_dicts()
         elif instance_dict["filename"].endswith(".hse"):  # no action when filename ends with ".hfe".
+            module_is_opened_in_a_window = False
             for open_window, _ in self.schematic_window.__class__.open_window_dict.items():
                 if open_window.design.get_module_name() == instance_dict["module_name"]:
+                    module_is_opened_in_a_window = True
                     for sub_instance_dict in open_window.design.get_sorted_list_of_instance_dictionaries():
                         if sub_instance_dict["module_name"] != sub_module_dict["module_name"]:
                             sub_module_dict["sub_modules"].append(
                                 open_window.hierarchytree.get_sub_module_dict(sub_instance_dict)
                             )
+            if not module_is_opened_in_a_window:
+                for sub_instance_dict in design_metadata.DesignMetadata.get_sorted_list_of_instance_dictionaries(
+                    instance_dict["filename"], instance_dict["architecture_name"]
+                ):
+                    if sub_instance_dict["module_name"] != sub_module_dict["module_name"]:
+                        sub_module_dict["sub_modules"].append(self.get_sub_module_dict(sub_instance_dict))
         return sub_module_dict
 
+    def open_windows_of_all_sub_modules(self):
+        """Opens a withdrawn window for each sub-module of the hierarchy, which is not opened in a window yet."""
+        self._open_windows_of_sub_modules(self.top_dict)
+
+    def _open_windows_of_sub_modules(self, module_dict):
+        for sub_module_dict in module_dict.get("sub_modules", []):
+            if sub_module_dict["filename"].endswith(".hse"):
+                self.schematic_window.__class__.get_subwindow(
+                    self.root, sub_module_dict["filename"], sub_module_dict["architecture_name"]
+                )
+            self._open_windows_of_sub_modules(sub_module_dict)
+
     def _create_sub_module_dict(self, instance_dict):
         if instance_dict["filename"].endswith(".hse") or instance_dict["filename"].endswith(".hfe"):
             entity_filename_for_generation, architecture_filename_for_generation = (
@@ -199,63 +286,64 @@ class HierarchyTree:
         sub_module_dict["sub_modules"] = []
         return sub_module_dict
 
-    def insert_dict_into_treeview(self, topdict):
-        """This method is called for each open window, so the treeview in each window is updated."""
-        self.top_dict = (
-            topdict  # In any submodule self.top_dict would be empty. Information is here provided for "view instance"
-        )
+    def update_treeview(self, top_dicts):
+        """This method is called for each open window, only the changed items of its treeview are updated."""
+        if top_dicts:
+            # In any submodule self.top_dict would be empty. Information is here provided for "view instance".
+            self.top_dict = top_dicts[0]
         self.compile_order_list = {}
-        top = self.schematic_window.notebook_top.diagram_tab.treeview.insert(
-            "",
-            0,
-            text="top-level",
-            tags="tree_view_entry",
-            values=[
-                topdict["module_name"],
-                topdict["configuration_library"],
-                topdict["filename"],
-                topdict["architecture_filename"],
-                topdict["architecture_name"],
-            ],
-            open=True,
-        )
-        for mod_dict in topdict["sub_modules"]:
-            self.fill_tree(top, mod_dict)
-        self.compile_order_list[topdict["configuration_library"] + ":" + topdict["module_name"]] = {
-            "library": topdict["configuration_library"],
-            "entity_filename": topdict["entity_filename"],
-            "architecture_filename": topdict["architecture_filename"],
-        }
+        new_item_contents = {}
+        self._update_tree_items("", top_dicts, new_item_contents)
+        self.item_contents = new_item_contents
+
+    def _update_tree_items(self, parent_iid, module_dicts, new_item_contents):
+        # The existing items are kept, when their text (the instance name) is still found under the same parent,
+        # so only the changed subtrees are modified and the open/closed state of all other items is kept.
+        treeview = self.schematic_window.notebook_top.diagram_tab.treeview
+        iids_by_text = {}
+        for iid in treeview.get_children(parent_iid):
+            iids_by_text.setdefault(self.item_contents.get(iid, (None, None))[0], []).append(iid)
+        item_contents = [self._get_item_contents(module_dict, parent_iid == "") for module_dict in module_dicts]
+        matching_iids = []
+        for text, _ in item_contents:
+            iids = iids_by_text.get(text)
+            matching_iids.append(iids.pop(0) if iids else None)
+        iids_to_delete = [iid for iids in iids_by_text.values() for iid in iids]
+        if iids_to_delete:
+            treeview.delete(*iids_to_delete)
+        for index, (module_dict, (text, values), iid) in enumerate(zip(module_dicts, item_contents, matching_iids)):
+            if iid is None:
+                iid = treeview.insert(parent_iid, index, text=text, tags="tree_view_entry", values=values, open=True)
+            else:
+                if treeview.index(iid) != index:
+                    treeview.move(iid, parent_iid, index)
+                if self.item_contents[iid][1] != values:
+                    treeview.item(iid, values=values)
+            new_item_contents[iid] = (text, values)
+            self._update_tree_items(iid, module_dict["sub_modules"], new_item_contents)
+            identifier = module_dict["configuration_library"] + ":" + module_dict["module_name"]
+            if identifier not in self.compile_order_list:
+                self.compile_order_list[identifier] = {
+                    "library": module_dict["configuration_library"],
+                    "entity_filename": module_dict["entity_filename"],
+                    "architecture_filename": module_dict["architecture_filename"],
+                }
 
-    def fill_tree(self, parent_iid, mod_dict):
-        """This method is called recursively for each sub-module in the hierarchy."""
-        if mod_dict["env_language"] == "VHDL":
+    def _get_item_contents(self, mod_dict, is_top_module):
+        if is_top_module:
+            instance_name = "top-level"
+        elif mod_dict["env_language"] == "VHDL":
             instance_name = re.sub(r"--.*", "", mod_dict["instance_name"])
         else:
             instance_name = re.sub(r"//.*", "", mod_dict["instance_name"])
-        iid = self.schematic_window.notebook_top.diagram_tab.treeview.insert(
-            parent_iid,
-            "end",
-            text=instance_name,
-            tags="tree_view_entry",
-            values=[
-                mod_dict["module_name"],
-                mod_dict["configuration_library"],
-                mod_dict["filename"],
-                mod_dict["architecture_filename"],
-                mod_dict["architecture_name"],
-            ],
-            open=True,
-        )
-        for sub_dict in mod_dict["sub_modules"]:
-            self.fill_tree(iid, sub_dict)
-        identifier = mod_dict["configuration_library"] + ":" + mod_dict["module_name"]
-        if identifier not in self.compile_order_list:
-            self.compile_order_list[identifier] = {
-                "library": mod_dict["configuration_library"],
-                "entity_filename": mod_dict["entity_filename"],
-                "architecture_filename": mod_dict["architecture_filename"],
-            }
+        values = [
+            mod_dict["module_name"],
+            mod_dict["configuration_library"],
+            mod_dict["filename"],
+            mod_dict["architecture_filename"],
+            mod_dict["architecture_name"],
+        ]
+        return instance_name, values
 
     # Not used:
     # def create_hdl_file_list(self):
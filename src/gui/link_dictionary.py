@@ -12,6 +12,10 @@ LinkDictionary is called, which shows the graphical source of this HLD code line
 When the LinkDictionary is filled by the HDL generation, a HDL-file-name and a HDL-file-line-number must be handed over.
 These 2 parameters are the keys of the LinkDictionary, so when the user clicks on a line in a HDL file in the HDL-tab,
 line-number and file-name are determined and the corresponding entry of the LinkDictionary can be read.
+
+The HDL files of sub-modules, which are not opened in a window, are only registered by add_design_without_window().
+When a link into such a file is needed, open_design_without_window() opens a withdrawn window for the sub-module,
+whose HDL generation then fills the LinkDictionary for these files.
 """
 
 
@@ -24,6 +28,7 @@ class LinkDictionary:
         self.root = root
         LinkDictionary.link_dict_reference = self
         self.link_dict = {}
+        self.designs_without_window = {}  # {HDL-file-name: (path_name, architecture_name)}
 
     def add(
         self,
@@ -40,7 +45,10 @@ class LinkDictionary:
     ):
         """This method is called when the HDL is generated."""
         # print("add =", file_name, file_line_number, hdl_item_type, number_of_lines , hdl_item_name, number_of_line)
+        if window is None:  # HDL is generated in batch mode, there is no window to link to.
+            return
         if file_name not in self.link_dict:
+            self.designs_without_window.pop(file_name, None)
             self.link_dict[file_name] = {}
             self.link_dict[file_name]["window"] = window
             self.link_dict[file_name]["lines"] = {}
@@ -172,6 +180,22 @@ class LinkDictionary:
                 "number_of_line": number_of_line,
             }  # name of the connected signal
 
+    def add_design_without_window(self, file_names, path_name, architecture_name):
+        """This method is called when the HDL files of a sub-module are not linked, because it has no window."""
+        for file_name in file_names:
+            if file_name is not None and file_name not in self.link_dict:
+                self.designs_without_window[file_name] = (path_name, architecture_name)
+
+    def open_design_without_window(self, file_name):
+        """Opens a withdrawn window for the sub-module of the HDL file, so that the HDL file gets linked."""
+        if file_name in self.designs_without_window:
+            # Imported here, because schematic_window imports link_dictionary indirectly (and the import is only
+            # needed, when a link into a sub-module without window is used):
+            from gui import schematic_window  # pylint: disable=import-outside-toplevel
+
+            path_name, architecture_name = self.designs_without_window.pop(file_name)
+            schematic_window.SchematicWindow.get_subwindow(self.root, path_name, architecture_name)
+
     def jump_to_source(self, selected_file, file_line_number, use_external_editor=False):
         """Used in the "Generated HDL"-Tab and in the "Messages"-Tab (reached by Control-Button-1)."""
         window_to_lift___ = self.link_dict[selected_file]["window"]
@@ -101,7 +101,8 @@ class NotebookControlTab:
             + "$file1\t\t= Entity-File\n"
             + "$file2\t\t= Architecture-File\n"
             + "$file3\t\t= File with Entity and Architecture\n"
-            + "$name\t\t= Module Name",
+            + "$name\t\t= Module Name\n"
+            + "$changed-files\t= HDL-Files changed since the last compile",
             padding=0,
         )
         self.compile_cmd_docu.grid(row=7, column=1, sticky=tk.W)
@@ -118,7 +119,8 @@ class NotebookControlTab:
             self.control_frame,
             text="Variables for compile through hierarchy command:\n"
             + "$name\t\t= Module Name\n"
-            + "$hdl-file-list\t= Name of the hdl-file-list generated by HDL-SCHEM-Editor",
+            + "$hdl-file-list\t= Name of the hdl-file-list generated by HDL-SCHEM-Editor\n"
+            + "$changed-files\t= HDL-Files changed since the last compile",
             padding=0,
         )
         self.compile_hierarchy_cmd_docu.grid(row=9, column=1, sticky=tk.W)
@@ -249,7 +251,8 @@ class NotebookControlTab:
             self.compile_cmd.set(self.vhdl_compile_cmd2)
             self.compile_cmd_docu.config(
                 text="Variables for compile command:\n$file1\t= Entity-File\n$file2\t= Architecture-File\n"
-                "$file3\t= File with Entity and Architecture\n$name\t= Entity Name"
+                "$file3\t= File with Entity and Architecture\n$name\t= Entity Name\n"
+                "$changed-files\t= HDL-Files changed since the last compile"
             )
             self.notebook.tab(1, text="Entity Declarations")
             self.window.notebook_top.interface_tab.paned_window.insert(
@@ -284,7 +287,8 @@ class NotebookControlTab:
             else:
                 self.compile_cmd.set(self.system_verilog_compile_cmd)
             self.compile_cmd_docu.config(
-                text="Variables for compile command:\n$file\t= Module-File\n$name\t= Module Name"
+                text="Variables for compile command:\n$file\t= Module-File\n$name\t= Module Name\n"
+                "$changed-files\t= HDL-Files changed since the last compile"
             )
             self.notebook.tab(1, text="Parameters")
             self.window.notebook_top.interface_tab.paned_window.forget(
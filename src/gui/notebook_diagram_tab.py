@@ -20,7 +20,7 @@ from elements import (
     wire_highlight,
     wire_insertion,
 )
-from gui import grid_drawing, schematic_window
+from gui import canvas_event_dispatcher, grid_drawing, schematic_window
 from widgets import color_changer, listbox_animated
 
 
@@ -50,6 +50,11 @@ class NotebookDiagramTab:
         self.func_id_3 = None
         self.func_id_4 = None
         self.func_id_6 = None
+        # During a bulk update (Undo/Redo, file read) sorting the layers and creating the canvas bindings
+        # is done only once at the end instead of once for each element:
+        self.bulk_update_is_running = False
+        self.layers_must_be_sorted = False
+        self.canvas_bindings_must_be_created = False
         self.func_id_7 = None
         self.funcid_motion = None
         self.funcid_button1_start_move_of_selection = None
@@ -327,6 +332,7 @@ class NotebookDiagramTab:
         self.canvas.bind("<Control-Button-5>", self.zoom_wheel)  # MouseWheel-Scroll-Down used at Linux.
         # self.window.bind("<Motion>", self._coord_info)
         self.grid_drawer = grid_drawing.GridDraw(self.root, self, self.design, self.canvas)
+        self.canvas_event_dispatcher = canvas_event_dispatcher.CanvasEventDispatcher(self.canvas, self.design)
         # Needed for Entry-Widget for new architecture name:
         self.architecture_name_stringvar = tk.StringVar()
 
@@ -361,11 +367,14 @@ class NotebookDiagramTab:
     def _redraw_grid_after_idle(self):
         if self.after_identifier is not None:
             self.canvas.after_cancel(self.after_identifier)
-        self.grid_drawer.remove_grid()
+        # The grid lines are moved to the new visible area, when the scrolling is finished:
         self.after_identifier = self.canvas.after_idle(self.grid_drawer.draw_grid)
 
     def create_canvas_bindings(self):
         """Create the bindings for the canvas, which are needed for handling the selection rectangle."""
+        if self.bulk_update_is_running:
+            self.canvas_bindings_must_be_created = True
+            return
         self.func_id_3 = self.canvas.bind("<Button-1>", self._start_drawing_selection_rectangle)
         self.func_id_4 = self.canvas.bind("<Button-3>", self._start_drawing_zoom_rectangle)
 
@@ -421,6 +430,9 @@ class NotebookDiagramTab:
 
     def sort_layers(self):
         """Sort the layers of the canvas, so that the elements are displayed in the correct order."""
+        if self.bulk_update_is_running:  # Each sort moves all canvas items, so it is done only once at the end.
+            self.layers_must_be_sorted = True
+            return
         layers = ["layer1", "layer2", "layer3", "layer4", "layer5"]
         for layer in layers:
             self.canvas.lower(layer)
@@ -435,32 +447,6 @@ class NotebookDiagramTab:
     #     # print(self.canvas.canvasx(0), self.canvas.canvasy(0),
     #             self.canvas.canvasx(self.canvas.winfo_width()), self.canvas.canvasy(self.canvas.winfo_height()))
 
-    def get_enclosed_elements(self, coords):
-        """Get the canvas ids of the elements, which are enclosed by the rectangle with the given coordinates."""
-        element_canvas_ids = []
-        enclosed_element_list = self.canvas.find_enclosed(*coords)
-        for canvas_id in enclosed_element_list:
-            if canvas_id in self.design.get_canvas_ids_of_elements() and self.design.get_schematic_element_type_of(
-                canvas_id
-            ) in ["block", "instance", "generate_frame"]:
-                element_canvas_ids.append(canvas_id)
-        element_canvas_ids = self._add_overlapping_block_text_elements(enclosed_element_list, element_canvas_ids)
-        return element_canvas_ids
-
-    def _add_overlapping_block_text_elements(self, enclosed_element_list, element_canvas_ids):
-        for canvas_id in enclosed_element_list:
-            if (
-                self.canvas.type(canvas_id) == "rectangle"
-                and self.design.get_schematic_element_type_of(canvas_id) == "block-rectangle"
-            ):
-                ref = self.design.get_references([canvas_id])[0]
-                object_tag = ref.get_object_tag()
-                list_of_canvas_ids_of_object = self.canvas.find_withtag(object_tag)
-                for single_canvas_id_of_object in list_of_canvas_ids_of_object:
-                    if single_canvas_id_of_object != canvas_id and single_canvas_id_of_object not in element_canvas_ids:
-                        element_canvas_ids.append(single_canvas_id_of_object)
-        return element_canvas_ids
-
     def copy(self):
         """Copy the selected elements to the clipboard."""
         if NotebookDiagramTab.clipboard_window is not None:
@@ -639,6 +625,8 @@ class NotebookDiagramTab:
         file_name = self._search_filename_of_module_in_design_dict(
             self.window.design.get_module_name(), "", self.window.hierarchytree.top_dict
         )
+        if file_name.endswith(".hse"):  # The instantiating module may not be opened in a window yet.
+            schematic_window.SchematicWindow.get_subwindow(self.root, file_name, "")
         for open_window, window_file_name in schematic_window.SchematicWindow.open_window_dict.items():
             if window_file_name == file_name:
                 open_window.open_this_window()
@@ -833,12 +821,15 @@ class NotebookDiagramTab:
         for block_edit in self.design.get_block_edit_list():
             block_edit.text_edit_widget.adapt_to_new_fontsize(new_font_size)
         self.last_factor = factor_adapted
+        # Zooming scales all coordinates and the grid size by the same factor, so the port declarations stay valid:
+        port_declarations = self.design.get_cached_port_declarations()
         self.design.set_font_size(new_font_size)
         self.design.set_grid_size(self.design.get_grid_size() * factor_adapted)
         self.design.set_connector_size(self.design.get_connector_size() * factor_adapted)
         all_references = self.design.get_references()
         for reference in all_references:  # Store the new places of all canvas items.
             reference.store_item(push_design_to_stack=False, signal_design_change=False)
+        self.design.restore_cached_port_declarations(port_declarations)
         if zoom_command != "zoom_at_file_write":
             self._store_visible_center_point()
         self.adjust_scroll_region_at_zoom(factor_adapted)  # new grid size must be visible.
@@ -943,29 +934,74 @@ class NotebookDiagramTab:
 
     def update_diagram_tab(self, new_design, push_design_to_stack):
         """Load a new design into the diagram tab. Called by update_diagram_tab_from and by Undo/Redo."""
+        self._begin_bulk_update()
+        try:
+            self._delete_all_elements()
+            if "generate_frame_id" not in new_design:  # Old versions of HDL-SCHEM-Editor do not support them.
+                new_design["generate_frame_id"] = 0
+            self.architecture_name = new_design["architecture_name"]
+            self.design.store_new_architecture_name(new_design["architecture_name"], signal_design_change=False)
+            self.design.store_block_id(new_design["block_id"])
+            self.design.store_generate_frame_id(new_design["generate_frame_id"])
+            self.design.store_instance_id(new_design["instance_id"])
+            self.design.store_wire_id(new_design["wire_id"])
+            self.design.store_signal_name_font(new_design["signal_name_font"], signal_design_change=False)
+            self.design.store_font_size(new_design["font_size"], signal_design_change=False)
+            self.design.store_grid_size(new_design["grid_size"], signal_design_change=False)
+            self.design.store_connector_size(new_design["connector_size"], signal_design_change=False)
+            self.design.store_visible_center_point(
+                new_design["visible_center_point"], signal_design_change=False, push_design_to_stack=False
+            )
+            wire_ref = self._create_elements(new_design)
+            if wire_ref is not None:  # Check is needed for schematics without any wires.
+                wire_ref.add_dots_new_for_all_wires()
+        finally:
+            self._end_bulk_update()
+        # Needed to prevent winfo_width/height from being 1 in the following lines (only at the first read from file):
+        self.canvas.update_idletasks()
+        new_center = [
+            (self.canvas.canvasx(0) + self.canvas.canvasx(self.canvas.winfo_width())) / 2,
+            (self.canvas.canvasy(0) + self.canvas.canvasy(self.canvas.winfo_height())) / 2,
+        ]
+        self.canvas.configure(confine=False)  # scan_dragto is not limited by the scroll_region anymore.
+        self.canvas.scan_mark(*self.design.get_visible_center_point())
+        self.canvas.scan_dragto(int(new_center[0]), int(new_center[1]), gain=1)
+        if self.window.state != "withdrawn":
+            self._adjust_scroll_region()
+            self.grid_drawer.draw_grid()
+        self.canvas.configure(confine=True)
+        self.design.add_change_to_stack(
+            push_design_to_stack
+        )  # push_design_to_stack is only true, when data is read from a file.
+        if wire_highlight.WireHighlight.highlight_object is not None and self.window.winfo_viewable() == 1:
+            wire_highlight.WireHighlight.highlight_object.highlight_at_window_opening(self.window)
+
+    def _begin_bulk_update(self):
+        self.bulk_update_is_running = True
+        self.layers_must_be_sorted = False
+        self.canvas_bindings_must_be_created = False
+
+    def _end_bulk_update(self):
+        self.bulk_update_is_running = False
+        if self.layers_must_be_sorted:
+            self.sort_layers()
+        if self.canvas_bindings_must_be_created:
+            self.create_canvas_bindings()
+
+    def _delete_all_elements(self):
         references = self._get_references_without_signalnames("all")
-        for reference in references:
-            reference.delete_item(
-                push_design_to_stack=False
-            )  # The changes by delete shall not be tracked step by step.
+        # The changes by delete shall not be tracked step by step and shall not change the window title step by step:
+        self.design.suppress_window_title_updates(True)
+        try:
+            for reference in references:
+                reference.delete_item(push_design_to_stack=False)
+        finally:
+            self.design.suppress_window_title_updates(False)
         self.design.update_window_title(
             written=True
         )  # Each delete_item marks the window-title with '*'. But this is wrong in this case and fixed here.
-        if "generate_frame_id" not in new_design:  # Old versions of HDL-SCHEM-Editor do not support generate_frames
-            new_design["generate_frame_id"] = 0
-        self.architecture_name = new_design["architecture_name"]
-        self.design.store_new_architecture_name(new_design["architecture_name"], signal_design_change=False)
-        self.design.store_block_id(new_design["block_id"])
-        self.design.store_generate_frame_id(new_design["generate_frame_id"])
-        self.design.store_instance_id(new_design["instance_id"])
-        self.design.store_wire_id(new_design["wire_id"])
-        self.design.store_signal_name_font(new_design["signal_name_font"], signal_design_change=False)
-        self.design.store_font_size(new_design["font_size"], signal_design_change=False)
-        self.design.store_grid_size(new_design["grid_size"], signal_design_change=False)
-        self.design.store_connector_size(new_design["connector_size"], signal_design_change=False)
-        self.design.store_visible_center_point(
-            new_design["visible_center_point"], signal_design_change=False, push_design_to_stack=False
-        )
+
+    def _create_elements(self, new_design):
         wire_ref = None
         dummy = None
         for canvas_id in new_design["canvas_dictionary"]:
@@ -1054,26 +1090,7 @@ class NotebookDiagramTab:
                     self,  # push_design_to_stack=False,
                     generate_definition=new_design["canvas_dictionary"][canvas_id][2],
                 )
-        if wire_ref is not None:  # Check is needed for schematics without any wires.
-            wire_ref.add_dots_new_for_all_wires()
-        # Needed to prevent winfo_width/height from being 1 in the following lines (only at the first read from file):
-        self.canvas.update_idletasks()
-        new_center = [
-            (self.canvas.canvasx(0) + self.canvas.canvasx(self.canvas.winfo_width())) / 2,
-            (self.canvas.canvasy(0) + self.canvas.canvasy(self.canvas.winfo_height())) / 2,
-        ]
-        self.canvas.configure(confine=False)  # scan_dragto is not limited by the scroll_region anymore.
-        self.canvas.scan_mark(*self.design.get_visible_center_point())
-        self.canvas.scan_dragto(int(new_center[0]), int(new_center[1]), gain=1)
-        if self.window.state != "withdrawn":
-            self._adjust_scroll_region()
-            self.grid_drawer.draw_grid()
-        self.canvas.configure(confine=True)
-        self.design.add_change_to_stack(
-            push_design_to_stack
-        )  # push_design_to_stack is only true, when data is read from a file.
-        if wire_highlight.WireHighlight.highlight_object is not None and self.window.winfo_viewable() == 1:
-            wire_highlight.WireHighlight.highlight_object.highlight_at_window_opening(self.window)
+        return wire_ref
 
     def _start_drawing_selection_rectangle(self, event):
         self.canvas.focus_set()  # needed to catch Ctrl-z
@@ -1508,9 +1525,9 @@ class NotebookDiagramTab:
 
     def clear_canvas_for_new_schematic(self):
         """Called by design.create_new_and_empty_schematic()"""
-        all_canvas_ids = self.canvas.find_all()
-        for canvas_id in all_canvas_ids:
-            self.canvas.delete(canvas_id)
+        self.canvas.delete("all")
+        self.canvas_event_dispatcher.clear()
+        self.grid_drawer.forget_grid_lines()
 
     def _open_entry_window(self):
         self.architecture_name_stringvar.set("")
@@ -1678,10 +1695,10 @@ class NotebookDiagramTab:
 
     def update_all_instances(self):
         """Updates all instances by updating the symbol of each instance."""
-        for canvas_id in self.canvas.find_all():
-            if (
-                canvas_id in self.design.get_canvas_ids_of_elements()
-                and self.design.get_schematic_element_type_of(canvas_id) == "instance"
-            ):
+        # Each source file is read only once, its result is used for all instances of the module:
+        symbol_define_refs = {}
+        # A copy of the list is needed, because an update may replace the instance in the design:
+        for canvas_id in list(self.design.get_canvas_ids_of_type("instance")):
+            if self.design.get_schematic_element_type_or_none(canvas_id) == "instance":
                 ref = self.design.get_references(canvas_ids=[canvas_id])[0]
-                ref.update_symbol_from_source_without_generics(show_ranges=False)
+                ref.update_symbol_from_source_without_generics(show_ranges=False, symbol_define_refs=symbol_define_refs)
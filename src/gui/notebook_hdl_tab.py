@@ -91,13 +91,17 @@ class NotebookHdlTab:
     def update_hdl_tab_from(self, new_dict):
         """Updates the content of the HDL-tab from the given design dictionary."""
         filename, filename_architecture = self._determine_file_names_from_dict(new_dict)
-        # Compare modification time of HDL file against modification_time of design file (.hse):
+        # Compare the HDL files against the design file (.hse) by their content hashes or modification times:
         hdl = ""
         path_name = self.schematic_window.design.get_path_name()
         if not path_name.startswith(
             "unnamed"
         ) and not hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
-            path_name, filename, filename_architecture, show_message=False
+            path_name,
+            filename,
+            filename_architecture,
+            show_message=False,
+            architecture_name=new_dict.get("architecture_name", ""),
         ):
             # Copy HDL from file into HDL-tab, because HDL-file(s) exists and are "newer" than the design-file.
             try:
@@ -238,6 +238,7 @@ class NotebookLogTab:
                     file_name = re.sub(
                         "_flipflop_stat", "", file_name
                     )  # The flipflop_stat files are not stored in the LinkDict.
+                    link_dictionary.LinkDictionary.link_dict_reference.open_design_without_window(file_name)
                     if (
                         file_name in link_dictionary.LinkDictionary.link_dict_reference.link_dict
                     ):  # For example ieee source files are not a key in link_dict.
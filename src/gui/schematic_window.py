@@ -9,8 +9,18 @@ from pathlib import Path
 from tkinter import messagebox, ttk
 
 from codegen import hdl_generate_through_hierarchy
-from data_io import design_data_selector, file_read, file_write, write_data_creator
+from data_io import (
+    backup_writer,
+    design_data,
+    design_data_selector,
+    design_file_format,
+    file_read,
+    file_write,
+    write_data_creator,
+)
 from gui import hierarchy_tree, menu_bar, notebook_diagram_tab, notebook_top, quick_access
+from hdl_parser import parse_cache
+from widgets import parser_pool
 
 
 class SchematicWindow(tk.Toplevel):
@@ -98,6 +108,7 @@ class SchematicWindow(tk.Toplevel):
         last_line_frame.columnconfigure(0, weight=1)
         last_line_frame.columnconfigure(1, weight=0)
         self.design = design_data_selector.DesignDataSelector(self.root, window=self)
+        self.backup_writer = backup_writer.BackupWriter(self)
         self.write_data_creator_ref = write_data_creator.WriteDataCreator(standard_size=self.design.get_font_size())
         self.hierarchytree = hierarchy_tree.HierarchyTree(
             self.root, schematic_window=self, frame=last_line_frame, column=1, row=0
@@ -176,6 +187,7 @@ class SchematicWindow(tk.Toplevel):
         # removed from open_window_dict and also disappear in the hierarchy tree.
         if self._abort_closing():
             return
+        self.backup_writer.flush()
         self.quick_access_object.remove_quick_access_button(self.design.get_path_name())
         if self.hierarchytree.this_module_is_top_module:
             SchematicWindow.number_of_open_windows -= 1
@@ -203,6 +215,10 @@ class SchematicWindow(tk.Toplevel):
         config_dictionary = {}
         config_dictionary["schematic_background"] = self.notebook_top.diagram_tab.canvas.cget("bg")
         config_dictionary["working_directory"] = self.design.get_working_directory()
+        config_dictionary["undo_stack_depth"] = design_data.DesignData.change_stack_max_depth
+        config_dictionary["undo_stack_memory_mb"] = design_data.DesignData.change_stack_max_memory // (1024 * 1024)
+        config_dictionary["compact_file_format"] = design_file_format.DesignFileFormat.compact
+        config_dictionary["parse_cache_directory"] = parse_cache.ParseCache.cache_directory
         try:
             with open(Path.home() / ".hdl-schem-editor.rc", "w", encoding="utf-8") as fileobject:
                 fileobject.write(json.dumps(config_dictionary, indent=4, default=str))
@@ -219,6 +235,7 @@ class SchematicWindow(tk.Toplevel):
                     window.close_this_window()
             except tk.TclError:
                 pass  # Happens after the tkinter application has been destroyed.
+        parser_pool.ParserPool.shutdown()
 
     def iconify_all_windows(self):
         """Iconifies all windows. Called by menu_bar.MenuBar when the user clicks at "Minimize All" in the menu."""
@@ -253,6 +270,7 @@ class SchematicWindow(tk.Toplevel):
         return False
 
     def _remove_back_up_file(self, path_name):
+        self.backup_writer.cancel()
         if os.path.isfile(path_name + ".tmp"):
             os.remove(path_name + ".tmp")
 
@@ -284,6 +302,17 @@ class SchematicWindow(tk.Toplevel):
         file_read.FileRead(sub_window, filename, architecture_name)
         return sub_window
 
+    @classmethod
+    def get_subwindow(cls, root, filename, architecture_name):
+        """Returns the window of the design file, which is opened as withdrawn window if it is not open yet."""
+        for open_window in SchematicWindow.open_window_dict:
+            if open_window.design.get_path_name() == filename:
+                return open_window
+        sub_window = cls.open_subwindow(root, filename, architecture_name)
+        # Fill the link-dictionary for the new window:
+        hdl_generate_through_hierarchy.HdlGenerateHierarchy(root, sub_window, force=False, write_to_file=False)
+        return sub_window
+
     @classmethod
     def open_clipboard_window(cls, root):
         """Creates a clipboard window, which is used for copy and paste."""
@@ -0,0 +1,41 @@
+"""
+Tokenizer used by the VHDL and the Verilog parser.
+The text is scanned once by a single compiled regular expression, which is an alternation of all separators.
+Each step returns the text before the next separator and the separator itself, both as a list
+[word, start-index, end-index], where the indices are positions in the scanned text.
+"""
+
+import re
+
+
+def compile_separators(separator_list):
+    """Combines a list of separator regular expressions into one compiled regular expression.
+    At each position the alternatives are tried from left to right, so the order of the list defines
+    which separator wins, when several separators match at the same position (for example "<=" before "<").
+    """
+    return re.compile("|".join("(?:" + separator + ")" for separator in separator_list))
+
+
+def split_into_words(text, separator_reg_ex, max_number_of_characters=None, start=0):
+    """Splits text into a list of alternating words and separators without copying the remaining text."""
+    return list(iterate_words(text, separator_reg_ex, max_number_of_characters, start))
+
+
+def iterate_words(text, separator_reg_ex, max_number_of_characters=None, start=0):
+    """Returns the words and separators of split_into_words() one by one, so a parser which stops early does not
+    scan the rest of the text.
+    A start index bigger than 0 must be the end of a separator, then the words behind it are the same as at a split
+    of the whole text.
+    """
+    length = len(text)
+    number_of_characters_read = start
+    search = separator_reg_ex.search
+    while number_of_characters_read < length and (
+        max_number_of_characters is None or number_of_characters_read < max_number_of_characters
+    ):
+        # Always matches, because the last separator alternative also matches at the end of the text.
+        match = search(text, number_of_characters_read)
+        start, end = match.span()
+        yield [text[number_of_characters_read:start], number_of_characters_read, start]  # Text
+        yield [text[start:end], start, end]  # Separator
+        number_of_characters_read = end
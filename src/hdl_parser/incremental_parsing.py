@@ -0,0 +1,277 @@
+"""
+Parses an edited HDL text only partly again, which is used for the syntax highlighting of the editor widgets.
+At a complete parse the parser stores checkpoints at line starts, each of them is the state of the parser at this
+position: its region, the local variables of _analyze() and the parse result. After an edit the parser starts at the
+last checkpoint in front of the change. It stops at the first checkpoint behind the change, where its state is the
+same as the state at the old text, because from there on it would find the same results as at the old text, only
+shifted by the number of inserted or deleted characters. So these results are taken from the old parse result.
+The result is only used for the positions of the syntax highlighting. The strings, which the parser collects in local
+variables or attributes (like the generic definition or the architecture body), are not complete after a partial parse.
+Integers, which are stored in lists by the parser, are positions in the text, all other integers are counters.
+The lists of the parse result, which the parser reads (given by parser_class.checkpoint_lists), are stored completely
+at a checkpoint. Of all other lists only the length and the last entry are stored, because the parser only appends
+to them or changes their last entry. At the start of a partial parse these lists are built from the old parse result.
+Checkpoints are only stored at line starts, because a word always starts there. A multiline comment of
+parser_class.multiline_comment reaches up to the last comment end of the text, so a checkpoint behind the first comment
+start can only be used, when the last comment end of the edited text is unchanged and in front of the checkpoint.
+"""
+
+import bisect
+import pickle
+
+
+class IncrementalParse:
+    """This class contains the parse result of an HDL text and parses an edited version of the text partly again."""
+
+    checkpoint_distance = 500  # Minimal number of characters between 2 checkpoints.
+    max_characters_to_parse = 10000  # A longer partial parse is stopped and a complete parse is needed.
+    max_text_length = 100000  # The Verilog parser stops after 100000 characters, so the rest could not be shifted.
+
+    def __init__(self, parser_class, hdl, region, checkpoints=None):
+        self.parser_class = parser_class
+        self.hdl = hdl
+        self.region = region
+        if checkpoints is None:
+            checkpoints = _Checkpoints(parser_class, hdl.lower())
+        parser = parser_class(hdl, region, checkpoints=checkpoints)
+        self.parse_result = parser.parse_result
+        self.checkpoints = checkpoints.get_new_checkpoints()  # [[position, pickled state, shifts], ...]
+
+    def parse_edited_text(self, hdl):
+        """Returns the IncrementalParse of the edited text or None, when the text must be parsed completely."""
+        if hdl == self.hdl:
+            return self
+        if len(hdl) >= self.max_text_length or len(self.hdl) >= self.max_text_length:
+            return None
+        old_text = self.hdl.lower()
+        text = hdl.lower()
+        change_start = _get_common_prefix_length(old_text, text)
+        common_suffix_length = _get_common_suffix_length(
+            old_text, text, min(len(old_text), len(text)) - change_start
+        )
+        old_change_end = len(old_text) - common_suffix_length
+        checkpoints = _Checkpoints(
+            self.parser_class,
+            text,
+            self,
+            self._get_start_checkpoint(old_text, text, change_start),
+            old_change_end,
+            len(text) - len(old_text),
+        )
+        try:
+            return IncrementalParse(self.parser_class, hdl, self.region, checkpoints)
+        except Exception:  # pylint: disable=broad-except
+            # The partial parse got too long or the parser failed, which a complete parse will show again.
+            return None
+
+    def _get_start_checkpoint(self, old_text, text, change_start):
+        positions = [checkpoint[0] for checkpoint in self.checkpoints]
+        # The characters at the checkpoint must not be changed, because a separator in front of it could get longer:
+        index = bisect.bisect_left(positions, change_start) - 1
+        if self.parser_class.multiline_comment is not None and index >= 0:
+            comment_start, comment_end = self.parser_class.multiline_comment
+            first_comment_start = text.find(comment_start)
+            if first_comment_start != -1 and positions[index] > first_comment_start:
+                last_comment_end = text.rfind(comment_end)
+                if (
+                    last_comment_end != old_text.rfind(comment_end)
+                    or last_comment_end + len(comment_end) > positions[index]
+                ):
+                    index = bisect.bisect_right(positions, first_comment_start) - 1
+        return self.checkpoints[index] if index >= 0 else None
+
+    def get_positions(self, tag_name):
+        """Returns the positions for the given tag_name."""
+        return self.parse_result.get(tag_name, [])
+
+
+class _Checkpoints:
+    """The parser calls reached() at the first word at or behind next_position, which stores or compares checkpoints."""
+
+    def __init__(self, parser_class, text, old_parse=None, start_checkpoint=None, old_change_end=0, shift=0):
+        self.checkpoint_lists = parser_class.checkpoint_lists
+        self.text = text
+        self.old_parse = old_parse
+        self.start_checkpoint = start_checkpoint
+        self.start_position = 0 if start_checkpoint is None else start_checkpoint[0]
+        self.old_change_end = old_change_end
+        self.shift = shift
+        self.change_end = old_change_end + shift
+        self.new_checkpoints = []
+        self.last_position = self.start_position
+        self.next_position = self.start_position + IncrementalParse.checkpoint_distance
+        self.old_checkpoint_positions = []
+        self.old_checkpoint_index = None
+        self.old_lengths = {}
+        self.length_differences = {}
+        if old_parse is not None:
+            self.old_checkpoint_positions = [checkpoint[0] for checkpoint in old_parse.checkpoints]
+            self._set_next_position(self.start_position)
+
+    def get_start_state(self):
+        """Returns the region, return_region, parse result and local variables of the parser at the start position."""
+        state = _get_stored_state(self.start_checkpoint)
+        region, return_region, variables, complete_lists, values, last_entries, lengths = state
+        parse_result = {}
+        parse_result.update(values)
+        parse_result.update(complete_lists)
+        for key, length in lengths.items():
+            parse_result[key] = self.old_parse.parse_result[key][: length - 1] + last_entries[key] if length else []
+        return region, return_region, parse_result, variables
+
+    def reached(self, position, region, return_region, parse_result, variables):
+        """Is called by the parser, returns True, when the parser must stop."""
+        if self.old_parse is not None and position - self.start_position > IncrementalParse.max_characters_to_parse:
+            raise _PartialParseTooLong()
+        if self.text[position - 1] != "\n":
+            pass  # A checkpoint is only stored at a line start.
+        elif (
+            self.old_parse is not None
+            and position > self.change_end
+            and self._is_same_state_as_at_old_text(position, region, return_region, parse_result, variables)
+        ):
+            self._take_rest_from_old_parse_result(parse_result)
+            return True
+        elif position >= self.last_position + IncrementalParse.checkpoint_distance:
+            state = self._get_state(region, return_region, parse_result, variables)
+            self.new_checkpoints.append([position, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), []])
+            self.last_position = position
+        self._set_next_position(position)
+        return False
+
+    def get_new_checkpoints(self):
+        """Returns all checkpoints, which can be used for the text."""
+        if self.old_parse is None:
+            return self.new_checkpoints
+        old_checkpoints = self.old_parse.checkpoints
+        checkpoints = old_checkpoints[: bisect.bisect_right(self.old_checkpoint_positions, self.start_position)]
+        checkpoints += self.new_checkpoints
+        if self.old_checkpoint_index is not None:  # The parser stopped at this old checkpoint.
+            for position, state, shifts in old_checkpoints[self.old_checkpoint_index :]:
+                shifts = shifts + [(self.old_change_end, self.shift, self.length_differences)]
+                checkpoint = [position + self.shift, state, shifts]
+                if len(shifts) > 10:  # Limits the time needed to get the state of the checkpoint.
+                    state = pickle.dumps(_get_stored_state(checkpoint), protocol=pickle.HIGHEST_PROTOCOL)
+                    checkpoint = [checkpoint[0], state, []]
+                checkpoints.append(checkpoint)
+        return checkpoints
+
+    def _set_next_position(self, position):
+        next_position = max(position + 1, self.last_position + IncrementalParse.checkpoint_distance)
+        if self.old_parse is not None:
+            index = bisect.bisect_right(self.old_checkpoint_positions, max(position, self.change_end) - self.shift)
+            if index < len(self.old_checkpoint_positions):
+                next_position = min(next_position, self.old_checkpoint_positions[index] + self.shift)
+            next_position = min(next_position, self.start_position + IncrementalParse.max_characters_to_parse + 1)
+        self.next_position = next_position
+
+    def _get_state(self, region, return_region, parse_result, variables):
+        complete_lists = {}
+        values = {}
+        last_entries = {}
+        lengths = {}
+        for key, value in parse_result.items():
+            if not isinstance(value, list):
+                values[key] = value
+            elif any(name in key for name in self.checkpoint_lists):
+                complete_lists[key] = value
+            else:
+                last_entries[key] = value[-1:]  # A list, so the integers of the entry are positions.
+                lengths[key] = len(value)
+        return region, return_region, variables, complete_lists, values, last_entries, lengths
+
+    def _is_same_state_as_at_old_text(self, position, region, return_region, parse_result, variables):
+        index = bisect.bisect_left(self.old_checkpoint_positions, position - self.shift)
+        if index == len(self.old_checkpoint_positions) or self.old_checkpoint_positions[index] != position - self.shift:
+            return False
+        old_state = _get_stored_state(self.old_parse.checkpoints[index])
+        state = self._get_state(region, return_region, parse_result, variables)
+        if old_state[6].keys() != state[6].keys():
+            return False
+        if _shift_positions(old_state[:6], self.old_change_end, self.shift) != state[:6]:
+            return False
+        self.old_checkpoint_index = index
+        self.old_lengths = old_state[6]
+        self.length_differences = {key: len(parse_result[key]) - length for key, length in old_state[6].items()}
+        return True
+
+    def _take_rest_from_old_parse_result(self, parse_result):
+        old_parse_result = self.old_parse.parse_result
+        for key, value in parse_result.items():
+            if not isinstance(value, list):
+                parse_result[key] = old_parse_result[key]
+            elif key not in self.old_lengths:
+                parse_result[key] = _shift_positions(old_parse_result[key], self.old_change_end, self.shift)
+            elif self.old_lengths[key] != 0:
+                # The last entry may have been changed by the parser behind the checkpoint:
+                parse_result[key] = value[:-1] + _shift_positions(
+                    old_parse_result[key][self.old_lengths[key] - 1 :], self.old_change_end, self.shift
+                )
+            else:
+                parse_result[key] = _shift_positions(old_parse_result[key], self.old_change_end, self.shift)
+
+
+class _PartialParseTooLong(Exception):
+    pass
+
+
+def _get_stored_state(checkpoint):
+    _, pickled_state, shifts = checkpoint
+    state = pickle.loads(pickled_state)
+    for change_end, shift, length_differences in shifts:
+        state = _shift_positions(state[:6], change_end, shift) + (
+            {key: length + length_differences[key] for key, length in state[6].items()},
+        )
+    return state
+
+
+def _shift_positions(value, change_end, shift, in_list=False, copies=None):
+    """Returns a copy of value, where all positions at or behind change_end are shifted."""
+    if shift == 0:
+        return value
+    if copies is None:
+        copies = {}  # Keeps the references between the lists of value.
+    if isinstance(value, (list, tuple, dict)):
+        if id(value) in copies:
+            return copies[id(value)]
+        if isinstance(value, list):
+            copy = []
+            copies[id(value)] = copy
+            copy.extend(_shift_positions(entry, change_end, shift, True, copies) for entry in value)
+        elif isinstance(value, tuple):
+            copy = tuple(_shift_positions(entry, change_end, shift, in_list, copies) for entry in value)
+            copies[id(value)] = copy
+        else:
+            copy = {}
+            copies[id(value)] = copy
+            for key, entry in value.items():
+                copy[key] = _shift_positions(entry, change_end, shift, in_list, copies)
+        return copy
+    if in_list and type(value) is int and value >= change_end:  # pylint: disable=unidiomatic-typecheck
+        return value + shift
+    return value
+
+
+def _get_common_prefix_length(text1, text2):
+    # The strings are compared in slices, which is much faster than a comparison of single characters:
+    low = 0
+    high = min(len(text1), len(text2))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text1[low:middle] == text2[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _get_common_suffix_length(text1, text2, max_length):
+    low = 0
+    high = max_length
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text1[len(text1) - middle : len(text1) - low] == text2[len(text2) - middle : len(text2) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
@@ -0,0 +1,200 @@
+"""
+A cache of the results of the VHDL- and Verilog-parser.
+The same HDL text is parsed again and again (at each refresh of the hierarchy tree, at each HDL generation, at each
+update of a symbol), although it did not change. So the result of each parse is stored by the hash of the parsed text,
+the parser class, the region and the parse_big_files flag. Only the result is stored (not the parser object), as a
+JSON string, so each caller gets its own copy and cannot change the cached result by changing the lists it got.
+The texts of the editor widgets are not cached here, because each edit would create a new entry.
+The cache keeps the most recently used entries up to a maximum number and a maximum size in memory.
+When a cache directory is configured (key "parse_cache_directory" of the configuration file), each entry is also
+stored in a file there, so the results survive a restart of the HDL-SCHEM-Editor. The files of the cache directory
+are ignored, when the parser module or the tokenizer module was changed after they were written, or when they were
+written with another format_version. As the files only contain JSON, reading a file cannot execute any code.
+"""
+
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import sys
+
+from hdl_parser import hdl_tokenizer
+
+
+class ParseResult:
+    """Contains the result of a parser and offers the same methods to read it as the parser."""
+
+    def __init__(self, parse_result, architecture_declarations, architecture_body):
+        self.parse_result = parse_result
+        self.architecture_declarations = architecture_declarations
+        self.architecture_body = architecture_body
+
+    def get(self, tag_name):
+        """Returns the content for the given tag_name. If the tag_name does not exist, an empty string is returned."""
+        return self.parse_result.get(tag_name, "")
+
+    def get_positions(self, tag_name):
+        """Returns the positions for the given tag_name."""
+        return self.parse_result.get(tag_name, [])
+
+    def get_architecture_declarations(self):
+        """Returns the architecture declarations as a string."""
+        return self.architecture_declarations
+
+    def get_architecture_body(self):
+        """Returns the architecture body as a string."""
+        return self.architecture_body
+
+
+class ParseCache:
+    """This class returns cached parse results, the parser only runs when its result is not cached yet."""
+
+    format_version = 2  # Must be incremented, when the content of the stored results is changed.
+    max_entries = 64
+    max_bytes = 64 * 1024 * 1024
+    max_files = 1000
+    cache_directory = ""  # Is configured by the key "parse_cache_directory" of the configuration file.
+    entries = collections.OrderedDict()  # {key: JSON string of the result}, the least recently used entry is the first.
+    number_of_bytes = 0
+    number_of_stored_files = 0
+    write_failed = False
+
+    @classmethod
+    def get_parse_result(cls, parser_class, hdl, region, parse_big_files=False):
+        """Returns the ParseResult for the HDL text, which is read from the cache or created by parser_class."""
+        parse_result = cls.lookup(parser_class, hdl, region, parse_big_files)
+        if parse_result is None:
+            parser = parser_class(hdl, region, parse_big_files=parse_big_files)
+            parse_result = ParseResult(parser.parse_result, parser.architecture_declarations, parser.architecture_body)
+            cls.store(parser_class, hdl, region, parse_result, parse_big_files)
+        return parse_result
+
+    @classmethod
+    def lookup(cls, parser_class, hdl, region, parse_big_files=False):
+        """Returns the cached ParseResult for the HDL text or None."""
+        key = cls._get_key(parser_class, hdl, region, parse_big_files)
+        json_string = cls.entries.get(key)
+        if json_string is not None:
+            cls.entries.move_to_end(key)
+        else:
+            json_string = cls._read_file(parser_class, key)
+            if json_string is None:
+                return None
+            cls._store_in_memory(key, json_string)
+        try:
+            return ParseResult(*json.loads(json_string))
+        except (ValueError, TypeError):
+            # A file of the cache directory is damaged.
+            cls._remove(key)
+            return None
+
+    @classmethod
+    def store(cls, parser_class, hdl, region, parse_result, parse_big_files=False):
+        """Stores a ParseResult, which was created for the HDL text outside of the cache."""
+        content = [parse_result.parse_result, parse_result.architecture_declarations, parse_result.architecture_body]
+        json_string = json.dumps(content)
+        if json.loads(json_string) != content:
+            return  # The result contains tuples, which JSON would turn into lists.
+        key = cls._get_key(parser_class, hdl, region, parse_big_files)
+        cls._store_in_memory(key, json_string)
+        cls._write_file(key, json_string)
+
+    @classmethod
+    def clear(cls):
+        """Removes all entries from the memory (the files of the cache directory are kept)."""
+        cls.entries.clear()
+        cls.number_of_bytes = 0
+
+    @classmethod
+    def _get_key(cls, parser_class, hdl, region, parse_big_files):
+        text_hash = hashlib.sha256(hdl.encode("utf-8", "surrogatepass")).hexdigest()
+        return "_".join(
+            [text_hash, parser_class.__name__, region, str(bool(parse_big_files)), "v" + str(cls.format_version)]
+        )
+
+    @classmethod
+    def _store_in_memory(cls, key, json_string):
+        if key in cls.entries:
+            cls.number_of_bytes -= len(cls.entries.pop(key))
+        if len(json_string) > cls.max_bytes:
+            return
+        cls.entries[key] = json_string
+        cls.number_of_bytes += len(json_string)
+        while len(cls.entries) > cls.max_entries or cls.number_of_bytes > cls.max_bytes:
+            _, removed_json_string = cls.entries.popitem(last=False)
+            cls.number_of_bytes -= len(removed_json_string)
+
+    @classmethod
+    def _remove(cls, key):
+        if key in cls.entries:
+            cls.number_of_bytes -= len(cls.entries.pop(key))
+        file_name = cls._get_file_name(key)
+        if file_name != "":
+            with contextlib.suppress(OSError):
+                os.remove(file_name)
+
+    @classmethod
+    def _get_file_name(cls, key):
+        if cls.cache_directory == "":
+            return ""
+        # The text hash at the beginning of the key keeps the file name short enough:
+        return os.path.join(cls.cache_directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    @classmethod
+    def _read_file(cls, parser_class, key):
+        file_name = cls._get_file_name(key)
+        if file_name == "":
+            return None
+        try:
+            if os.path.getmtime(file_name) < cls._get_parser_modification_time(parser_class):
+                return None
+            with open(file_name, encoding="utf-8") as fileobject:
+                json_string = fileobject.read()
+            os.utime(file_name)  # The oldest files are removed first, so a used file is made young again.
+            return json_string
+        except OSError:
+            return None
+
+    @classmethod
+    def _write_file(cls, key, json_string):
+        file_name = cls._get_file_name(key)
+        if file_name == "" or cls.write_failed:
+            return
+        try:
+            os.makedirs(cls.cache_directory, mode=0o700, exist_ok=True)  # The HDL texts are only readable by the user.
+            # The file is written into a temporary file first and then renamed, so no incomplete file can be read:
+            with open(file_name + ".part", "w", encoding="utf-8") as fileobject:
+                fileobject.write(json_string)
+            os.replace(file_name + ".part", file_name)
+        except OSError as error:
+            print(
+                "HDL-SCHEM-Editor-Warning: Could not write to the parse cache directory " + cls.cache_directory, error
+            )
+            cls.write_failed = True  # Do not try again for each parse.
+            return
+        cls.number_of_stored_files += 1
+        if cls.number_of_stored_files % 100 == 0:
+            cls._remove_oldest_files()
+
+    @classmethod
+    def _remove_oldest_files(cls):
+        with contextlib.suppress(OSError):
+            file_names = [
+                os.path.join(cls.cache_directory, file_name)
+                for file_name in os.listdir(cls.cache_directory)
+                if file_name.endswith(".json")
+            ]
+            if len(file_names) > cls.max_files:
+                file_names.sort(key=os.path.getmtime)
+                for file_name in file_names[: len(file_names) - cls.max_files]:
+                    os.remove(file_name)
+
+    @classmethod
+    def _get_parser_modification_time(cls, parser_class):
+        modification_time = 0
+        for module in (sys.modules.get(parser_class.__module__), hdl_tokenizer):
+            if module is None or getattr(module, "__file__", None) is None:
+                return float("inf")  # Files can not be checked, so they are not used.
+            modification_time = max(modification_time, os.path.getmtime(module.__file__))
+        return modification_time
@@ -5,49 +5,57 @@ The Verilog Parser does leave generate loops before they are ended. This allows
 
 import re
 
+from hdl_parser import hdl_tokenizer
+
+_SEPARATOR_REG_EX = hdl_tokenizer.compile_separators(
+    [
+        # The order is important here, see vhdl_parsing.py.
+        r"\(",
+        r"\)",
+        r"\[",
+        r"\]",
+        r"\n",
+        r"<=",
+        r">=",
+        r"==",
+        r"!=",
+        r"#",
+        r";",
+        r":",
+        r"=",
+        r"<",
+        r">",
+        r",",
+        r"@",
+        r"//.*(\n|$)",
+        r"(?s:/\*.*\*/)",  # Multiline comment. (?s:...) = Extension notation, 's' means '.' matches all (newline too).
+        r"[ \n\r\t]|$",  # White space: Blank, Return, Linefeed, Tabulator or String-End
+    ]
+)
+
 
 class VerilogParser:
     """This class is used for parsing a Verilog module. The result of the parsing is stored in self.parse_result."""
 
-    def __init__(self, verilog, region="module", parse_big_files=False):
+    # See vhdl_parsing.py:
+    checkpoint_lists = ("clocked_signals", "_interface_")
+    # A multiline comment reaches up to the last "*/" of the text, so the words behind its "/*" depend on the text
+    # behind them (see incremental_parsing.py):
+    multiline_comment = ("/*", "*/")
+
+    def __init__(self, verilog, region="module", parse_big_files=False, checkpoints=None):
         self.debug = False
         self.verilog = verilog.lower()
         self.region = region
         self.return_region = None
-        length = len(self.verilog)
-        reg_ex_list_for_splitting_into_words = [
-            # re.compile(r"$"),
-            re.compile(r"\("),
-            re.compile(r"\)"),
-            re.compile(r"\["),
-            re.compile(r"\]"),
-            re.compile(r"\n"),
-            re.compile(r"<="),
-            re.compile(r">="),
-            re.compile(r"=="),
-            re.compile(r"!="),
-            re.compile(r"#"),
-            re.compile(r";"),
-            re.compile(r":"),
-            re.compile(r"="),
-            re.compile(r"<"),
-            re.compile(r">"),
-            re.compile(r","),
-            re.compile(r"@"),
-            re.compile(r"//.*(\n|$)"),
-            re.compile(
-                r"(?s)/\*.*\*/"
-            ),  # Multiline comment. (?s) = Extension notation, 's' means '.' matches all (newline too).
-            re.compile(r"[ \n\r\t]|$"),  # White space: Blank, Return, Linefeed, Tabulator or String-End
-        ]
-        self.number_of_characters_read = 0
-        word_list = []
-        while self.number_of_characters_read < length and (self.number_of_characters_read < 100000 or parse_big_files):
-            # data_word1 contains the characters from index 0 to the string searched for.
-            # data_word2 contains the string searched for.
-            data_word1, data_word2 = self._get_next_words(reg_ex_list_for_splitting_into_words)
-            word_list.append(data_word1)
-            word_list.append(data_word2)
+        # When parse_big_files is False, the parsing stops after 100000 characters:
+        # With checkpoints (see incremental_parsing.py) the parsing may start at a checkpoint behind the text start:
+        word_list = hdl_tokenizer.iterate_words(
+            self.verilog,
+            _SEPARATOR_REG_EX,
+            max_number_of_characters=None if parse_big_files else 100000,
+            start=0 if checkpoints is None else checkpoints.start_position,
+        )
         self.parse_result = {}
         self.parse_result[
             "keyword_positions"
@@ -85,48 +93,9 @@ class VerilogParser:
         ] = []  # Contains a list of conditions for each element of self.parse_result["clocked_signals")
         self.architecture_declarations = ""
         self.architecture_body = ""
-        self._analyze(word_list)
-
-    def _get_next_words(self, reg_ex_list_for_splitting_into_words):
-        match_list = []
-        for reg_ex in reg_ex_list_for_splitting_into_words:
-            match = reg_ex.search(self.verilog)
-            if match is not None:
-                match_list.append(match)
-        end_of_file = False
-        first_match = 0
-        if len(match_list) == 1:
-            first_match = match_list[0]
-            if str(match.re) == "re.compile('$')":
-                end_of_file = True
-        else:
-            index_of_first_match = len(self.verilog)
-            for match in match_list:
-                if match.start() < index_of_first_match:
-                    first_match = match
-                    index_of_first_match = match.start()
-        start_index_of_word_before_search_string = self.number_of_characters_read
-        end_index_of_word_before_search_string = self.number_of_characters_read + first_match.start()
-        start_index_of_search_string_match = end_index_of_word_before_search_string
-        end_index_of_search_string_match = self.number_of_characters_read + first_match.end()
-        word1 = self.verilog[0 : first_match.start()]
-        # Without checking end_of_file, word2 would get the value "" (empty string).
-        # Here this empty string is replaced by "End-Of-File".
-        # This change is needed, because at region=="parameter_value" the incoming parameter value can consist
-        # out of several words. So these words are accumulated to the needed parameter-value and stored
-        # in parse_result["generics_interface_init"] as soon as the region is left. But when a parameter_list
-        # was parsed "alone", the region will not be left. Then the end of file must be detected, which becomes
-        # possible by the replacement done here:
-        word2 = self.verilog[first_match.start() : first_match.end()] if not end_of_file else "End-Of-File"
-        self.verilog = self.verilog[first_match.end() :]
-        self.number_of_characters_read = end_index_of_search_string_match
-        return [word1, start_index_of_word_before_search_string, end_index_of_word_before_search_string], [
-            word2,
-            start_index_of_search_string_match,
-            end_index_of_search_string_match,
-        ]
+        self._analyze(word_list, checkpoints)
 
-    def _analyze(self, word_list):
+    def _analyze(self, word_list, checkpoints):
         parameter_definition = ""
         in_generate = 0
         active_generate_conditions = []
@@ -137,7 +106,58 @@ class VerilogParser:
         clocked_always_block = False
         generate_for_condition_string = ""
         generate_case_condition_string = ""
+        # These variables are set by the regions which use them, but must exist for storing them at a checkpoint:
+        parameter_range = ""
+        port_range = ""
+        begin_counter = 0
+        open_bracket = 0
+        signal_name = ""
+        generate_if_condition_string = ""
+        bracket_counter = 0
+        if checkpoints is not None and checkpoints.start_position != 0:
+            self.region, self.return_region, self.parse_result, variables = checkpoints.get_start_state()
+            (
+                parameter_definition,
+                in_generate,
+                active_generate_conditions,
+                in_architecture_body,
+                previous_word,
+                parameter_value,
+                parameter_value_position,
+                clocked_always_block,
+                generate_for_condition_string,
+                generate_case_condition_string,
+                parameter_range,
+                port_range,
+                begin_counter,
+                open_bracket,
+                signal_name,
+                generate_if_condition_string,
+                bracket_counter,
+            ) = variables
         for word in word_list:
+            if checkpoints is not None and word[1] >= checkpoints.next_position:
+                variables = (
+                    parameter_definition,
+                    in_generate,
+                    active_generate_conditions,
+                    in_architecture_body,
+                    previous_word,
+                    parameter_value,
+                    parameter_value_position,
+                    clocked_always_block,
+                    generate_for_condition_string,
+                    generate_case_condition_string,
+                    parameter_range,
+                    port_range,
+                    begin_counter,
+                    open_bracket,
+                    signal_name,
+                    generate_if_condition_string,
+                    bracket_counter,
+                )
+                if checkpoints.reached(word[1], self.region, self.return_region, self.parse_result, variables):
+                    break
             if self.debug and word[0] not in ["", " ", "\n", "\r", "\t"]:
                 print("word[0] =", word[0])
             if in_architecture_body and word[0] != "endmodule":
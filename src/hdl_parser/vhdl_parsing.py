@@ -21,11 +21,52 @@ Additionally it can be called with this other argument:
 
 import re
 
+from hdl_parser import hdl_tokenizer
+
+_SEPARATOR_REG_EX = hdl_tokenizer.compile_separators(
+    [
+        # The order is important here.
+        # For example when a "<=" is in the VHDL code, then the search for "<=" will have a match,
+        # but also the search for "<" will have a match.
+        # They both will have the same match-start index.
+        # But as "<=" is the first alternative in the list, "<=" is the match and not "<".
+        r"\(",
+        r"\)",
+        r"\n",
+        r"\.",
+        r";",
+        r"<=",
+        r">=",
+        r"=>",
+        r":=",
+        r":",
+        r"=",
+        r"<",
+        r">",
+        r",",
+        r"'",
+        r"--.*(\n|$)",
+        r"[ \n\r\t]|$",  # White space: Blank, Return, Linefeed, Tabulator or String-End
+    ]
+)
+
 
 class VhdlParser:
     """This class parses a VHDL string and creates a Python dictionary containing information about the VHDL string."""
 
-    def __init__(self, vhdl, region="entity_context", parse_big_files=False):
+    # The lists of the parse result, which are read by _analyze() or whose entries (not only the last one) are changed
+    # later, are stored completely at a checkpoint. All names are checked as parts of the keys of the parse result:
+    checkpoint_lists = (
+        "entity_library_name",
+        "architecture_library_name",
+        "clocked_signals",
+        "architecture_type_declarations",
+        "_interface_",
+    )
+    # The words in front of a checkpoint must not depend on the text behind it. Each VHDL separator ends in its line:
+    multiline_comment = None
+
+    def __init__(self, vhdl, region="entity_context", parse_big_files=False, checkpoints=None):
         parse_big_files = True
         # Regions which are handled by the multiple used "interface..." regions could be defined
         # by the correct region, but an information is needed for the return region.
@@ -51,42 +92,14 @@ class VhdlParser:
             self.region = region
             self.return_region = ""
         self.vhdl = vhdl.lower()
-        length = len(self.vhdl)
-        reg_ex_list_for_splitting_into_words = [
-            # The order is important here.
-            # For example when a "<=" is in the VHDL code, then the search for "<=" will have a match,
-            # but also the search for "<" will have a match.
-            # They both will have the same match-start index.
-            # But the match of "<=" will be "before" the match of "<" in the match list.
-            # So when the match with the smallest match index is searched, the match index of "<=" will
-            # be stored as the smallest match and as the match-index of "<" is equal to the match-index of "<=",
-            # it cannot change the smallest match index anymore.
-            re.compile(r"\("),
-            re.compile(r"\)"),
-            re.compile(r"\n"),
-            re.compile(r"\."),
-            re.compile(r";"),
-            re.compile(r"<="),
-            re.compile(r">="),
-            re.compile(r"=>"),
-            re.compile(r":="),
-            re.compile(r":"),
-            re.compile(r"="),
-            re.compile(r"<"),
-            re.compile(r">"),
-            re.compile(r","),
-            re.compile(r"'"),
-            re.compile(r"--.*(\n|$)"),
-            re.compile(r"[ \n\r\t]|$"),  # White space: Blank, Return, Linefeed, Tabulator or String-End
-        ]
-        self.number_of_characters_read = 0
-        word_list = []
-        while self.number_of_characters_read < length and (self.number_of_characters_read < 100000 or parse_big_files):
-            # data_word1 contains the characters from index 0 to the string searched for.
-            # data_word2 contains the string searched for.
-            data_word1, data_word2 = self._get_next_words(reg_ex_list_for_splitting_into_words)
-            word_list.append(data_word1)
-            word_list.append(data_word2)
+        # When parse_big_files is False, the parsing stops after 100000 characters:
+        # With checkpoints (see incremental_parsing.py) the parsing may start at a checkpoint behind the text start:
+        word_list = hdl_tokenizer.iterate_words(
+            self.vhdl,
+            _SEPARATOR_REG_EX,
+            max_number_of_characters=None if parse_big_files else 100000,
+            start=0 if checkpoints is None else checkpoints.start_position,
+        )
         self.parse_result = {}
         self.parse_result["keyword_positions"] = []
         self.parse_result["comment"] = []
@@ -203,36 +216,9 @@ class VhdlParser:
         ] = []  # Contains a list of conditions for each element of self.parse_result["clocked_signals")
         self.architecture_declarations = ""
         self.architecture_body = ""
-        self._analyze(word_list)
-
-    def _get_next_words(self, reg_ex_list_for_splitting_into_words):
-        match_list = []
-        for reg_ex in reg_ex_list_for_splitting_into_words:
-            match = reg_ex.search(self.vhdl)
-            if match is not None:
-                match_list.append(match)
-        if len(match_list) == 1:
-            first_match = match_list[0]
-        else:
-            index_of_first_match = len(self.vhdl)
-            for match in match_list:
-                if match.start() < index_of_first_match:
-                    first_match = match
-                    index_of_first_match = match.start()
-        start_index_of_word_before_search_string = self.number_of_characters_read
-        end_index_of_word_before_search_string = self.number_of_characters_read + first_match.start()
-        start_index_of_search_string_match = end_index_of_word_before_search_string
-        end_index_of_search_string_match = self.number_of_characters_read + first_match.end()
-        word1 = self.vhdl[0 : first_match.start()]
-        word2 = self.vhdl[first_match.start() : first_match.end()]
-        self.vhdl = self.vhdl[first_match.end() :]
-        self.number_of_characters_read = end_index_of_search_string_match
-        return [
-            [word1, start_index_of_word_before_search_string, end_index_of_word_before_search_string],  # Text
-            [word2, start_index_of_search_string_match, end_index_of_search_string_match],
-        ]  # Separator
+        self._analyze(word_list, checkpoints)
 
-    def _analyze(self, word_list):
+    def _analyze(self, word_list, checkpoints):
         generic_definition = ""
         actual_library = ""
         in_block_comment = False
@@ -245,8 +231,84 @@ class VhdlParser:
         sequential_statement_in_clocked_process = None
         previous_word = []
         generate_if_condition_string = ""
+        # These variables are set by the regions which use them, but must exist for storing them at a checkpoint:
+        first_word_of_use_clause = False
+        procedure_return_region = ""
+        busrange = ""
+        start_of_signal_constant_variable_declaration_type_integer_range = False
+        number_of_open_brackets = 0
+        open_if_counter = 0
+        type_is_stored = False
+        number_of_words_in_range = 0
+        use_as_bus_range = False
+        number_of_close_brackets = 0
+        start_of_interface_init = False
+        number_of_open_brackets_in_interface_range_range = 0
+        busconstraint = ""
+        start_of_interface_range_range = False
+        if checkpoints is not None and checkpoints.start_position != 0:
+            self.region, self.return_region, self.parse_result, variables = checkpoints.get_start_state()
+            (
+                generic_definition,
+                actual_library,
+                in_block_comment,
+                in_generate,
+                active_generate_conditions,
+                in_architecture_declarative_region,
+                in_architecture_body,
+                extend_position_of_init_value,
+                architecture_type_declaration,
+                sequential_statement_in_clocked_process,
+                previous_word,
+                generate_if_condition_string,
+                first_word_of_use_clause,
+                procedure_return_region,
+                busrange,
+                start_of_signal_constant_variable_declaration_type_integer_range,
+                number_of_open_brackets,
+                open_if_counter,
+                type_is_stored,
+                number_of_words_in_range,
+                use_as_bus_range,
+                number_of_close_brackets,
+                start_of_interface_init,
+                number_of_open_brackets_in_interface_range_range,
+                busconstraint,
+                start_of_interface_range_range,
+            ) = variables
 
         for word in word_list:
+            if checkpoints is not None and word[1] >= checkpoints.next_position:
+                variables = (
+                    generic_definition,
+                    actual_library,
+                    in_block_comment,
+                    in_generate,
+                    active_generate_conditions,
+                    in_architecture_declarative_region,
+                    in_architecture_body,
+                    extend_position_of_init_value,
+                    architecture_type_declaration,
+                    sequential_statement_in_clocked_process,
+                    previous_word,
+                    generate_if_condition_string,
+                    first_word_of_use_clause,
+                    procedure_return_region,
+                    busrange,
+                    start_of_signal_constant_variable_declaration_type_integer_range,
+                    number_of_open_brackets,
+                    open_if_counter,
+                    type_is_stored,
+                    number_of_words_in_range,
+                    use_as_bus_range,
+                    number_of_close_brackets,
+                    start_of_interface_init,
+                    number_of_open_brackets_in_interface_range_range,
+                    busconstraint,
+                    start_of_interface_range_range,
+                )
+                if checkpoints.reached(word[1], self.region, self.return_region, self.parse_result, variables):
+                    break
             if in_architecture_declarative_region:
                 self.architecture_declarations += word[0]
             if in_architecture_body:
@@ -4,6 +4,7 @@ import argparse
 import json
 import multiprocessing
 import re
+import sys
 import tkinter as tk
 import urllib.request
 from os.path import exists
@@ -11,9 +12,11 @@ from pathlib import Path
 from tkinter import messagebox, ttk
 
 import constants
-from codegen import hdl_generate_through_hierarchy
-from data_io import file_read
+from codegen import hdl_generate_batch, hdl_generate_through_hierarchy
+from data_io import design_data, design_file_format, file_read
 from gui import link_dictionary, schematic_window
+from hdl_parser import parse_cache
+from widgets import parser_pool
 
 
 class MyTk(tk.Tk):
@@ -36,12 +39,17 @@ class HdlSchemEditor:
             self._check_version()
         if not args.no_message:
             self._read_message()
+        if args.generate_hdl:
+            sys.exit(self._generate_hdl_in_batch_mode(args))
+        if args.convert is not None:
+            sys.exit(self._convert_design_file(args))
         root = MyTk()
         root.withdraw()
         working_directory = self._configure_hse(root)
         link_dictionary.LinkDictionary(root)
         self._open_first_window(root, working_directory, args)
         root.mainloop()
+        parser_pool.ParserPool.shutdown()
 
     def _parse_arguments(self):
         argument_parser = argparse.ArgumentParser()
@@ -54,9 +62,53 @@ class HdlSchemEditor:
         argument_parser.add_argument(
             "-no_message", action="store_true", help="HDL-SCHEM-Editor will not check for a message at start."
         )
+        argument_parser.add_argument(
+            "--generate-hdl",
+            "--batch",
+            dest="generate_hdl",
+            action="store_true",
+            help="HDL-SCHEM-Editor generates HDL for the file and all its sub-modules without opening a window.",
+        )
+        argument_parser.add_argument(
+            "--force",
+            action="store_true",
+            help="At --generate-hdl the HDL is generated also for modules which are up to date.",
+        )
+        argument_parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="At --generate-hdl the HDL of this number of modules is generated in parallel processes.",
+        )
+        argument_parser.add_argument(
+            "--convert",
+            choices=("compact", "indented"),
+            help="HDL-SCHEM-Editor rewrites the file in the compact or indented format without opening a window.",
+        )
         arguments = argument_parser.parse_args()
         return arguments
 
+    def _generate_hdl_in_batch_mode(self, args):
+        if args.filename is None:
+            print("Error in HDL-SCHEM-Editor: --generate-hdl needs a filename.")
+            return 1
+        if not exists(args.filename):
+            print("Error in HDL-SCHEM-Editor: File " + args.filename + " was not found.")
+            return 1
+        batch = hdl_generate_batch.HdlGenerateBatch(args.filename, force=args.force, number_of_jobs=args.jobs)
+        return 1 if batch.get_number_of_errors() else 0
+
+    def _convert_design_file(self, args):
+        if args.filename is None:
+            print("Error in HDL-SCHEM-Editor: --convert needs a filename.")
+            return 1
+        error_message = design_file_format.DesignFileFormat.convert_file(args.filename, args.convert == "compact")
+        if error_message != "":
+            print("Error in HDL-SCHEM-Editor: " + error_message)
+            return 1
+        print("File " + args.filename + " was converted into the " + args.convert + " format.")
+        return 0
+
     def _check_version(self):
         try:
             print("Checking for a newer version ...")
@@ -118,6 +170,14 @@ class HdlSchemEditor:
             config_dict = json.loads(data)
             root.schematic_background_color = config_dict["schematic_background"]
             work_dir = config_dict["working_directory"]
+            design_data.DesignData.change_stack_max_depth = config_dict.get(
+                "undo_stack_depth", constants.UNDO_STACK_DEPTH
+            )
+            design_data.DesignData.change_stack_max_memory = (
+                config_dict.get("undo_stack_memory_mb", constants.UNDO_STACK_MEMORY_MB) * 1024 * 1024
+            )
+            design_file_format.DesignFileFormat.compact = config_dict.get("compact_file_format", False)
+            parse_cache.ParseCache.cache_directory = config_dict.get("parse_cache_directory", "")
             # print("working-dir gefunden:", working_directory)
         except Exception:  # pylint: disable=broad-except
             work_dir = ""
@@ -1,6 +1,6 @@
 """This class expands the tkinter Text-class"""
 
-import concurrent.futures
+import bisect
 import contextlib
 import os
 import re
@@ -10,14 +10,20 @@ from typing import Literal
 from actions import edit_ext
 from codegen import hdl_generate_through_hierarchy
 from data_io import file_read
-from hdl_parser import vhdl_parsing
+from hdl_parser import incremental_parsing, vhdl_parsing
 
 from .code_editor import CodeEditor
+from .parser_pool import ParserPool
 
 
-# Module-level function – must be a top-level def to be pickleable for ProcessPoolExecutor.
+# Module-level function – must be a top-level def to be pickleable for the ParserPool.
+# Only the parse result and the checkpoints are returned, so the big parser object must not be pickled for the transfer
+# to the main process.
 def _run_parser(parser_class, hdl, region):
-    parse_ref = parser_class(hdl, region)
+    return incremental_parsing.IncrementalParse(parser_class, hdl, region)
+
+
+def _get_positions(parse_ref):
     return {text_type: parse_ref.get_positions(text_type + "_positions") for text_type in CustomText.hdl_text_style}
 
 
@@ -76,6 +82,11 @@ class CustomText(CodeEditor):
         self.text = ""
         self.overwrite = False  # Is used to switch from "insert" mode to "overwrite" mode. Toggle per "Insert" key.
         self.after_identifier = None
+        self.parse_future = None  # The parse of a long text, which is running in the ParserPool.
+        self.highlight_generation = 0  # Is incremented at each new highlighting, to drop outdated tagging.
+        # After an edit only the changed part of the text is parsed again. The parse cache is not used for the text
+        # of the widget, because each edit would create a new entry and replace the cached file parses:
+        self.last_parse = None  # IncrementalParse of the last parsed text.
         super().__init__(*args, **kwargs)
         if self.disabled:
             self.config(state=tk.DISABLED)
@@ -250,49 +261,94 @@ class CustomText(CodeEditor):
         hdl = self._replace_line_numbers_with_blanks(text) if self.has_line_numbers else text
         region = self.region["vhdl"] if self.window.design.get_language() == "VHDL" else self.region["verilog"]
         if self.parser_class is not None:  # Check needed, because no parser exists for the message tab.
-            if len(hdl) > 10000:  # Avoid freezing the GUI for very long texts.
-                executor = concurrent.futures.ProcessPoolExecutor(max_workers=None)
-                future = executor.submit(_run_parser, self.parser_class, hdl, region)
-                executor.shutdown(wait=False)  # Free any resources after executing, but no waiting here.
-                for text_type in CustomText.hdl_text_style:
-                    self.tag_remove(text_type, "1.0", tk.END)
-                self._poll_parse_result(future)
+            self.highlight_generation += 1  # Stops the tagging for an older version of the text.
+            if self.parse_future is not None:
+                # The text has changed, so the result of the running parse is not needed anymore:
+                self.parse_future.cancel()  # Has only an effect, if the parse has not started yet.
+                self.parse_future = None
+            incremental_parse = None
+            if self.last_parse is not None and (self.last_parse.parser_class, self.last_parse.region) == (
+                self.parser_class,
+                region,
+            ):
+                incremental_parse = self.last_parse.parse_edited_text(hdl)  # None, if a complete parse is needed.
+            if incremental_parse is not None:
+                self.last_parse = incremental_parse
+                self._update_tags(hdl, _get_positions(incremental_parse), self.highlight_generation)
+            elif len(hdl) > 10000:  # Avoid freezing the GUI for very long texts.
+                self.parse_future = ParserPool.submit(_run_parser, self.parser_class, hdl, region)
+                self._poll_parse_result(self.parse_future, hdl, self.highlight_generation)
             else:
-                object_positions = _run_parser(self.parser_class, hdl, region)
-                for text_type, positions in object_positions.items():
-                    self.tag_remove(text_type, "1.0", tk.END)
-                    for position in positions:
-                        self.tag_add(
-                            text_type, "1.0 +" + str(position[0]) + " chars", "1.0 +" + str(position[1]) + " chars"
-                        )
-
-    def _poll_parse_result(self, future):
+                self.last_parse = _run_parser(self.parser_class, hdl, region)
+                self._update_tags(hdl, _get_positions(self.last_parse), self.highlight_generation)
+
+    def _poll_parse_result(self, future, hdl, generation):
+        if generation != self.highlight_generation:
+            return  # The text was changed, so the parse result does not fit to the text anymore.
         if not future.done():
-            self.after(50, self._poll_parse_result, future)
+            self.after(50, self._poll_parse_result, future, hdl, generation)
         else:
             try:
-                all_positions = future.result()
+                self.last_parse = future.result()
             except Exception:  # pylint: disable=broad-except
                 return
-            self._apply_tags_chunked(list(all_positions.items()), 0, 0, future)
-
-    def _apply_tags_chunked(self, tag_items, tag_index, position_index, future):
-        positions_to_tag = 100
-        positions_tagged = 0
-        while tag_index < len(tag_items) and positions_tagged < positions_to_tag:
-            tag, positions = tag_items[tag_index]
-            positions_remaining = positions[position_index:]
-            batch = positions_remaining[: positions_to_tag - positions_tagged]
-            if batch:
-                args = [idx for pos in batch for idx in (f"1.0 +{pos[0]}c", f"1.0 +{pos[1]}c")]
-                self.tk.call(self._w, "tag", "add", tag, *args)
-            positions_tagged += len(batch)
-            position_index += len(batch)
-            if position_index == len(positions):
-                tag_index += 1
-                position_index = 0
-        if tag_index < len(tag_items):
-            self.after(50, self._apply_tags_chunked, tag_items, tag_index, position_index, future)
+            self._update_tags(hdl, _get_positions(self.last_parse), generation)
+
+    def _update_tags(self, hdl, object_positions, generation):
+        # Only the differences between the tags at the text and the new positions are removed or added,
+        # so after a small change only a few tags are changed. The tags in the visible lines are added first,
+        # the tags of all other lines are added later, when the GUI is idle.
+        line_start_positions = [0] + [match.end() for match in re.finditer("\n", hdl)]
+        first_visible_line = int(self.index("@0,0").split(".")[0])
+        last_visible_line = int(self.index(f"@0,{self.winfo_height()}").split(".")[0])
+        visible_tags_to_add = []
+        other_tags_to_add = []
+        for text_type, positions in object_positions.items():
+            new_ranges = {
+                (self._get_index(line_start_positions, start), self._get_index(line_start_positions, end))
+                for start, end in self._merge_positions(positions, len(hdl))
+            }
+            tag_ranges = self.tag_ranges(text_type)  # Tk merges overlapping and adjacent ranges of a tag.
+            old_ranges = {(str(tag_ranges[i]), str(tag_ranges[i + 1])) for i in range(0, len(tag_ranges), 2)}
+            for start, end in old_ranges - new_ranges:
+                self.tag_remove(text_type, start, end)
+            for start, end in new_ranges - old_ranges:
+                if int(start.split(".")[0]) <= last_visible_line and int(end.split(".")[0]) >= first_visible_line:
+                    visible_tags_to_add.append((text_type, start, end))
+                else:
+                    other_tags_to_add.append((text_type, start, end))
+        self._add_tags(visible_tags_to_add)
+        self._add_tags_after_idle(other_tags_to_add, generation)
+
+    def _merge_positions(self, positions, text_length):
+        # The ranges are merged in the same way as Tk does it, so they can be compared with the ranges of the tag.
+        merged_positions = []
+        for start, end in sorted((position[0], min(position[1], text_length)) for position in positions):
+            if start >= end:
+                continue  # Tk ignores empty ranges.
+            if merged_positions and start <= merged_positions[-1][1]:
+                merged_positions[-1][1] = max(merged_positions[-1][1], end)
+            else:
+                merged_positions.append([start, end])
+        return merged_positions
+
+    def _get_index(self, line_start_positions, position):
+        line_number = bisect.bisect_right(line_start_positions, position)
+        return str(line_number) + "." + str(position - line_start_positions[line_number - 1])
+
+    def _add_tags(self, tags_to_add):
+        ranges_by_tag = {}
+        for tag, start, end in tags_to_add:
+            ranges_by_tag.setdefault(tag, []).extend((start, end))
+        for tag, indices in ranges_by_tag.items():
+            self.tk.call(self._w, "tag", "add", tag, *indices)
+
+    def _add_tags_after_idle(self, tags_to_add, generation):
+        if generation != self.highlight_generation:
+            return  # The text was changed, a new parse will add the tags.
+        if tags_to_add:
+            self._add_tags(tags_to_add[:500])
+            self.after_idle(self._add_tags_after_idle, tags_to_add[500:], generation)
 
     def _replace_line_numbers_with_blanks(self, hdl):
         return re.sub("^[0-9]+:", self._replace_with_blanks, hdl, flags=re.MULTILINE)
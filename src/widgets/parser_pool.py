@@ -0,0 +1,33 @@
+"""
+The process pool, which is shared by all CustomText widgets for parsing long HDL texts for syntax highlighting.
+The pool is started when the first long text is parsed and keeps its worker processes, so that process start and
+module import are only paid once. It is shut down when all windows are closed.
+"""
+
+import concurrent.futures
+import os
+
+
+class ParserPool:
+    """This class provides the process pool for parsing long HDL texts."""
+
+    max_workers = min(4, os.cpu_count() or 1)
+    executor = None
+
+    @classmethod
+    def submit(cls, function, *args):
+        """Submits function(*args) to the pool and returns the future."""
+        if cls.executor is None:
+            cls.executor = concurrent.futures.ProcessPoolExecutor(max_workers=cls.max_workers)
+        try:
+            return cls.executor.submit(function, *args)
+        except RuntimeError:  # The pool is broken, because a worker process terminated unexpectedly.
+            cls.executor = concurrent.futures.ProcessPoolExecutor(max_workers=cls.max_workers)
+            return cls.executor.submit(function, *args)
+
+    @classmethod
+    def shutdown(cls):
+        """Cancels all waiting parses and stops the worker processes."""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
@@ -0,0 +1,6 @@
+"""The modules of HDL-SCHEM-Editor are imported like main.py does, so the source directory is put into the path."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
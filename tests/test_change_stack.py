@@ -0,0 +1,74 @@
+"""Tests of the undo stack of DesignData, whose entries share the strings of unchanged elements."""
+
+import random
+
+import pytest
+
+from data_io import design_data
+
+
+@pytest.fixture(name="design")
+def fixture_design(monkeypatch):
+    monkeypatch.setattr(design_data.DesignData, "change_stack_max_depth", 8)
+    monkeypatch.setattr(design_data.DesignData, "change_stack_max_memory", 10**9)
+    design = design_data.DesignData(None, None)
+    design.elements = [["wire", [0, 0, index, 10], "x" * (index % 7)] for index in range(30)]
+    design._collect_design_dictionary = lambda: {
+        "module_name": "top",
+        "canvas_dictionary": {index: list(element) for index, element in enumerate(design.elements)},
+    }
+    design.change_stack = []
+    design.change_stack_memory = 0
+    design.change_stack_pointer = -1
+    return design
+
+
+def get_memory_of_change_stack(design):
+    # Each shared string is counted once:
+    element_strings = {}
+    memory = 0
+    for change_stack_entry in design.change_stack:
+        memory += len(change_stack_entry["design"]) + 8 * len(change_stack_entry["elements"])
+        for element_string in change_stack_entry["elements"]:
+            element_strings[id(element_string)] = len(element_string)
+    return memory + sum(element_strings.values())
+
+
+def test_memory_is_correct_when_the_oldest_entries_are_removed(design):
+    rand = random.Random(7)
+    for step in range(200):
+        design.elements[rand.randrange(30)][2] = "y" * rand.randint(10, 50)
+        design._push_change_stack_entry()
+        assert design.change_stack_memory == get_memory_of_change_stack(design), step
+    assert len(design.change_stack) == 8
+    assert design.change_stack_pointer == 7
+    assert design.change_stack_was_truncated
+
+
+def test_unchanged_elements_are_shared_by_the_entries(design):
+    design._push_change_stack_entry()
+    design.elements[3][2] = "changed"
+    design._push_change_stack_entry()
+    first, second = design.change_stack
+    shared = [string1 is string2 for string1, string2 in zip(first["elements"], second["elements"])]
+    assert shared.count(False) == 1 and not shared[3]
+    assert second["memory"] == len(second["design"]) + len(second["elements"][3]) + 8 * 30
+
+
+def test_memory_limit_keeps_the_current_entry(design, monkeypatch):
+    design._push_change_stack_entry()
+    monkeypatch.setattr(design_data.DesignData, "change_stack_max_memory", design.change_stack_memory)
+    design.elements[0][2] = "changed"
+    design._push_change_stack_entry()
+    assert len(design.change_stack) == 1
+    assert design.change_stack_pointer == 0
+    assert design.change_stack_memory == get_memory_of_change_stack(design)
+
+
+def test_entry_is_converted_back_into_the_design_dictionary(design):
+    design._push_change_stack_entry()
+    design_dictionary = design.get_design_dictionary_from_change_stack_entry(design.get_current_change_stack_entry())
+    assert design_dictionary["module_name"] == "top"
+    assert design_dictionary["canvas_dictionary"] == {
+        str(index): element for index, element in enumerate(design.elements)
+    }
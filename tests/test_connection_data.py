@@ -0,0 +1,19 @@
+"""Tests of DesignData.get_connection_data, which reads the elements by the type index of the canvas dictionary."""
+
+from data_io import design_data
+
+
+def test_ports_keep_the_order_of_the_canvas_dictionary():
+    design = design_data.DesignData(None, None)
+    port_types = ["output", "input", "inout", "input", "output"]
+    for canvas_id, port_type in enumerate(port_types, start=1):
+        design._store_in_canvas_dictionary(canvas_id, [None, port_type, [canvas_id, 0]])
+    design._store_in_canvas_dictionary(2, [None, "output", [2, 0]])  # A changed port keeps its position.
+    port_types[1] = "output"
+    port_list, _, _, _, _ = design.get_connection_data()
+    assert port_list == [
+        {"type": port_type, "coords": [canvas_id, 0]} for canvas_id, port_type in enumerate(port_types, start=1)
+    ]
+    assert [port["type"] for port in port_list] == [
+        element[1] for element in design.canvas_dictionary.values() if element[1] in ("input", "output", "inout")
+    ]
@@ -0,0 +1,74 @@
+"""Tests of GenerateHDL._write_hdl_file, which does not write HDL files again whose content is unchanged."""
+
+import os
+
+import pytest
+
+from codegen import hdl_generate
+
+ENTITY = "entity top is\nend entity top;\n"
+ARCHITECTURE = "architecture struct of top is\nbegin\nend architecture struct;\n"
+
+
+class Design:
+    """Contains the 2 values of the design data, which are read when HDL files are written."""
+
+    def __init__(self, path_name, design_is_saved):
+        self.path_name = path_name
+        self.design_is_saved = design_is_saved
+
+    def get_path_name(self):
+        return self.path_name
+
+    def get_design_is_saved(self):
+        return self.design_is_saved
+
+
+@pytest.fixture(name="files")
+def fixture_files(tmp_path):
+    path_name = str(tmp_path / "top.hse")
+    with open(path_name, "w", encoding="utf-8") as fileobject:
+        fileobject.write("{}")
+    return path_name, str(tmp_path / "top_e.vhd"), str(tmp_path / "top_struct.vhd")
+
+
+def write_hdl_files(path_name, file_name, file_name_architecture, design_is_saved=True, header_time="10:00"):
+    hdl_generator = hdl_generate.GenerateHDL.__new__(hdl_generate.GenerateHDL)
+    hdl_generator.design = Design(path_name, design_is_saved)
+    header = "-- Created by HDL-SCHEM-Editor at " + header_time + "\n"
+    return hdl_generator._write_hdl_file(file_name, file_name_architecture, header, ENTITY, ARCHITECTURE)
+
+
+def test_only_files_with_changed_content_are_written(files):
+    path_name, file_name, file_name_architecture = files
+    assert write_hdl_files(path_name, file_name, file_name_architecture) == [file_name, file_name_architecture]
+    os.utime(file_name, (1000, 1000))
+    os.utime(file_name_architecture, (1000, 1000))
+    # Only the timestamp in the header is different:
+    assert write_hdl_files(path_name, file_name, file_name_architecture, header_time="11:00") == []
+    assert os.path.getmtime(file_name) == 1000
+    with open(file_name_architecture, "a", encoding="utf-8") as fileobject:
+        fileobject.write("-- edited\n")
+    assert write_hdl_files(path_name, file_name, file_name_architecture) == [file_name_architecture]
+    with open(file_name_architecture, encoding="utf-8") as fileobject:
+        assert fileobject.read().endswith(ARCHITECTURE)
+
+
+def test_unchanged_file_of_a_saved_design_is_not_touched(files):
+    path_name, file_name, _ = files
+    write_hdl_files(path_name, file_name, "")
+    os.utime(file_name, (1000, 1000))
+    assert write_hdl_files(path_name, file_name, "", design_is_saved=True) == []
+    assert os.path.getmtime(file_name) == 1000
+
+
+def test_unchanged_file_of_an_unsaved_design_is_touched_only_when_older_than_the_design_file(files):
+    path_name, file_name, _ = files
+    write_hdl_files(path_name, file_name, "")
+    design_file_time = os.path.getmtime(path_name)
+    os.utime(file_name, (design_file_time + 100, design_file_time + 100))
+    assert write_hdl_files(path_name, file_name, "", design_is_saved=False) == []
+    assert os.path.getmtime(file_name) == design_file_time + 100
+    os.utime(file_name, (design_file_time - 100, design_file_time - 100))
+    assert write_hdl_files(path_name, file_name, "", design_is_saved=False) == []
+    assert os.path.getmtime(file_name) >= design_file_time
@@ -0,0 +1,101 @@
+"""Tests of the HdlManifest, which decides by content hashes if the HDL of a design must be generated again."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from codegen import hdl_generate_batch, hdl_generate_functions, hdl_manifest
+from gui import link_dictionary
+
+DESIGN = {
+    "active__architecture": "struct",
+    "struct": {"architecture_name": "struct", "elements": [["wire", [0, 0, 10, 0]]], "visible_center_point": [5, 5]},
+    "rtl": {"architecture_name": "rtl", "elements": []},
+}
+
+
+@pytest.fixture(name="files")
+def fixture_files(tmp_path):
+    path_name = str(tmp_path / "top.hse")
+    hdl_file_name = str(tmp_path / "hdl" / "top.vhd")
+    os.mkdir(tmp_path / "hdl")
+    write_file(path_name, json.dumps(DESIGN))
+    write_file(hdl_file_name, "entity top is\nend entity;\n")
+    hdl_manifest.HdlManifest.record_generated_hdl(path_name, "", [hdl_file_name])
+    return path_name, hdl_file_name
+
+
+def write_file(file_name, text):
+    with open(file_name, "w", encoding="utf-8") as fileobject:
+        fileobject.write(text)
+
+
+def is_up_to_date(path_name, hdl_file_name, architecture_name=""):
+    return hdl_manifest.HdlManifest.hdl_is_up_to_date(path_name, architecture_name, [hdl_file_name])
+
+
+def test_design_file_written_again_without_changes_is_up_to_date(files):
+    path_name, hdl_file_name = files
+    design = json.loads(json.dumps(DESIGN))
+    design["struct"]["visible_center_point"] = [100, 100]  # Has no influence on the HDL.
+    write_file(path_name, json.dumps(design, indent=4, sort_keys=True))
+    os.utime(hdl_file_name, (0, 0))  # The HDL file is older than the design file.
+    assert is_up_to_date(path_name, hdl_file_name) is True
+    assert not hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
+        path_name, hdl_file_name, None, show_message=False
+    )
+
+
+def test_changed_design_or_hdl_file_is_not_up_to_date(files):
+    path_name, hdl_file_name = files
+    design = json.loads(json.dumps(DESIGN))
+    design["struct"]["elements"].append(["wire", [0, 0, 0, 10]])
+    write_file(path_name, json.dumps(design))
+    assert is_up_to_date(path_name, hdl_file_name) is False
+    write_file(path_name, json.dumps(DESIGN))
+    assert is_up_to_date(path_name, hdl_file_name) is True
+    write_file(hdl_file_name, "-- edited\n")
+    assert is_up_to_date(path_name, hdl_file_name) is False
+
+
+def test_other_architecture_is_not_up_to_date(files):
+    path_name, hdl_file_name = files
+    assert is_up_to_date(path_name, hdl_file_name, "struct") is True
+    assert is_up_to_date(path_name, hdl_file_name, "rtl") is False
+
+
+def test_without_entry_the_modification_times_are_used(files):
+    path_name, hdl_file_name = files
+    hdl_manifest.HdlManifest.forget_generated_hdl(path_name, [hdl_file_name])
+    assert is_up_to_date(path_name, hdl_file_name) is None
+    os.utime(hdl_file_name, (0, 0))
+    assert hdl_generate_functions.HdlGenerateFunctions.hdl_must_be_generated(
+        path_name, hdl_file_name, None, show_message=False
+    )
+
+
+@pytest.mark.parametrize("exit_code, number_of_errors", [(0, 0), (1, 1)], ids=["success", "failure"])
+def test_fsm_hdl_is_recorded_only_when_hdl_fsm_editor_succeeded(
+    tmp_path, monkeypatch, capsys, exit_code, number_of_errors
+):
+    monkeypatch.setattr(hdl_generate_functions.HdlGenerateFunctions, "batch_mode", False)
+    monkeypatch.setattr(link_dictionary.LinkDictionary, "link_dict_reference", None)
+    hdl_directory = tmp_path / "hdl"
+    os.mkdir(hdl_directory)
+    path_name = str(tmp_path / "fsm.hfe")
+    hdl_file_name = str(hdl_directory / "fsm.vhd")
+    write_file(path_name, json.dumps({"generate_path": str(hdl_directory), "number_of_files": 1}))
+    write_file(hdl_file_name, "-- old fsm\n")
+    hdl_manifest.HdlManifest.record_generated_hdl(path_name, "", [hdl_file_name])
+    hfe_cmd = str(tmp_path / "hfe.sh")
+    write_file(hfe_cmd, f"#!/bin/sh\necho '-- fsm' > {hdl_file_name}\nexit {exit_code}\n")
+    os.chmod(hfe_cmd, os.stat(hfe_cmd).st_mode | stat.S_IXUSR)
+    symbol_definition = {"filename": path_name, "entity_name": {"name": "fsm"}, "language": "VHDL"}
+    module_generation = hdl_generate_batch.ModuleGeneration(force=True, hfe_cmd=hfe_cmd)
+    module_generation.generate_hdl_for_hfe_symbol(symbol_definition)
+    assert module_generation.get_number_of_errors() == number_of_errors
+    assert is_up_to_date(path_name, hdl_file_name) is (True if exit_code == 0 else None)
+    if exit_code != 0:
+        assert "HDL-FSM-Editor exit code 1" in capsys.readouterr().out
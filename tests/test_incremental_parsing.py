@@ -0,0 +1,150 @@
+"""Tests of the partial parse of edited HDL texts, which must find the same positions as a complete parse."""
+
+import bisect
+import random
+
+import pytest
+
+from hdl_parser import incremental_parsing, verilog_parsing, vhdl_parsing
+from widgets import custom_text
+
+
+def create_vhdl(number_of_signals):
+    lines = [
+        "library ieee;",
+        "use ieee.std_logic_1164.all;",
+        "entity top is",
+        "    generic (g_width : natural := 8); -- width",
+        "    port (clk, res : in std_logic; d : out std_logic_vector(7 downto 0));",
+        "end entity top;",
+        "architecture struct of top is",
+        "    type t_state is (idle, run);",
+    ]
+    lines += [
+        f"    signal s_{index} : std_logic_vector({index % 16} downto 0); -- signal {index}"
+        for index in range(number_of_signals)
+    ]
+    lines += ["begin"]
+    for index in range(number_of_signals // 4):
+        lines += [
+            f"    p_{index}: process (clk, res)",
+            "    begin",
+            "        if res = '1' then",
+            f"            s_{index} <= (others => '0');",
+            "        elsif rising_edge(clk) then",
+            f"            s_{index} <= s_{index + 1}; -- clocked",
+            "        end if;",
+            "    end process;",
+            f"    g_{index}: if g_width > {index} generate",
+            f"        inst_{index} : entity work.sub port map (a => s_{index}, b => open);",
+            "    end generate;",
+        ]
+    lines += ["end architecture;"]
+    return "\n".join(lines) + "\n"
+
+
+def create_verilog(number_of_signals):
+    lines = [
+        "/* Header of",
+        "   the module top */",
+        "module top #(parameter g_width = 8)",
+        "    (input clk, input res, output [7:0] d);",
+    ]
+    lines += [f"    reg [{index % 16}:0] s_{index}; // signal {index}" for index in range(number_of_signals)]
+    for index in range(number_of_signals // 4):
+        lines += [
+            "    always @(posedge clk or negedge res) begin",
+            f"        if (!res) s_{index} <= 0;",
+            f"        else s_{index} <= s_{index + 1};",
+            "    end",
+            "    generate",
+            f"    if (g_width > {index}) begin : g_{index}",
+            f"        sub inst_{index} (.a(s_{index}), .b());",
+            "    end",
+            "    endgenerate",
+        ]
+    lines += ["endmodule"]
+    return "\n".join(lines) + "\n"
+
+
+def edit(rand, text):
+    position = rand.randrange(len(text) + 1)
+    kind = rand.randrange(4)
+    if kind == 0:
+        insertion = rand.choice(["x", " ", "\n", "(", ";", "--", "//", "begin ", "end ", "'"])
+        return text[:position] + insertion + text[position:]
+    if kind == 1:
+        return text[:position] + text[position + rand.randint(1, 30) :]
+    lines = text.split("\n")
+    index = rand.randrange(len(lines))
+    if kind == 2:
+        lines.insert(index, lines[rand.randrange(len(lines))])
+    else:
+        del lines[index]
+    return "\n".join(lines)
+
+
+def get_positions(parse_result):
+    return {key: value for key, value in parse_result.items() if key.endswith("_positions")}
+
+
+@pytest.mark.parametrize(
+    "parser_class, region, text",
+    [
+        (vhdl_parsing.VhdlParser, "entity_context", create_vhdl(120)),
+        (verilog_parsing.VerilogParser, "module", create_verilog(120)),
+    ],
+    ids=["VHDL", "Verilog"],
+)
+def test_partial_parse_finds_the_positions_of_a_complete_parse(parser_class, region, text):
+    rand = random.Random(1)
+    incremental_parse = incremental_parsing.IncrementalParse(parser_class, text, region)
+    number_of_partial_parses = 0
+    for _ in range(60):
+        text = edit(rand, text)
+        try:
+            expected = get_positions(parser_class(text, region).parse_result)
+        except Exception:  # pylint: disable=broad-except
+            text = incremental_parse.hdl  # The parser cannot parse the edited text.
+            continue
+        new_incremental_parse = incremental_parse.parse_edited_text(text)
+        if new_incremental_parse is None:
+            new_incremental_parse = incremental_parsing.IncrementalParse(parser_class, text, region)
+        else:
+            number_of_partial_parses += 1
+        assert get_positions(new_incremental_parse.parse_result) == expected
+        incremental_parse = new_incremental_parse
+    assert number_of_partial_parses > 30
+
+
+def test_partial_parse_stops_behind_the_change():
+    text = create_vhdl(400)
+    incremental_parse = incremental_parsing.IncrementalParse(vhdl_parsing.VhdlParser, text, "entity_context")
+    position = text.index("\n", len(text) // 2) + 1
+    checkpoint_positions = [checkpoint[0] for checkpoint in incremental_parse.checkpoints]
+    start_index = bisect.bisect_left(checkpoint_positions, position) - 1
+    edited_text = text[:position] + "  " + text[position:]
+    checkpoints = incremental_parsing._Checkpoints(
+        vhdl_parsing.VhdlParser, edited_text, incremental_parse, incremental_parse.checkpoints[start_index], position, 2
+    )
+    incremental_parsing.IncrementalParse(vhdl_parsing.VhdlParser, edited_text, "entity_context", checkpoints)
+    assert checkpoints.old_checkpoint_index == start_index + 1
+
+
+def test_unchanged_text_is_not_parsed_again():
+    text = create_verilog(10)
+    incremental_parse = incremental_parsing.IncrementalParse(verilog_parsing.VerilogParser, text, "module")
+    assert incremental_parse.parse_edited_text(text) is incremental_parse
+
+
+def test_too_long_partial_parse_is_stopped():
+    text = create_vhdl(800)
+    incremental_parse = incremental_parsing.IncrementalParse(vhdl_parsing.VhdlParser, text, "entity_context")
+    # Without the architecture header the parser never gets into the same state as at the old text again:
+    position = text.index("architecture")
+    assert incremental_parse.parse_edited_text(text[:position] + "-- " + text[position:]) is None
+
+
+def test_positions_are_merged_like_tk_merges_tag_ranges():
+    positions = [[5, 9], [0, 3], [3, 4], [6, 7], [8, 8], [10, 20]]
+    assert custom_text.CustomText._merge_positions(None, positions, 15) == [[0, 4], [5, 9], [10, 15]]
@@ -0,0 +1,69 @@
+"""Tests of the net index of DesignData, which is updated at each store or remove of a wire or signal-name."""
+
+import random
+
+from codegen import hdl_generate_functions
+from data_io import design_data
+
+
+def get_wire_canvas_ids_of_net_from_canvas_dictionary(design, signal_name):
+    wire_tags = {
+        element[5]
+        for element in design.canvas_dictionary.values()
+        if element[1] == "signal-name"
+        and hdl_generate_functions.HdlGenerateFunctions.split_declaration(element[4], design.language)[0]
+        == signal_name
+    }
+    return sorted(
+        canvas_id
+        for canvas_id, element in design.canvas_dictionary.items()
+        if element[1] == "wire" and any(tag in wire_tags for tag in element[3])
+    )
+
+
+def store_wire(design, canvas_id, wire_tag):
+    design._store_in_canvas_dictionary(canvas_id, [None, "wire", [0, 0, 10, 0], ["layer2", wire_tag], "none", 1])
+
+
+def store_signal_name(design, canvas_id, declaration, wire_tag):
+    design._store_in_canvas_dictionary(canvas_id, [None, "signal-name", [0, 0], 0, declaration, wire_tag])
+
+
+def remove(design, canvas_id):
+    design._remove_from_indexes(canvas_id, design.canvas_dictionary.pop(canvas_id))
+
+
+def test_net_index_follows_all_changes():
+    rand = random.Random(3)
+    design = design_data.DesignData(None, None)
+    declarations = ["a : std_logic", "b : std_logic_vector(3 downto 0)", "c(1) : t_array(1 downto 0)", "a"]
+    for step in range(600):
+        canvas_id = rand.randint(1, 40)
+        wire_tag = "wire_" + str(rand.randint(1, 8))
+        action = rand.randrange(4)
+        if action == 0:
+            store_wire(design, canvas_id, wire_tag)
+        elif action == 1:
+            store_signal_name(design, canvas_id, rand.choice(declarations), wire_tag)
+        elif action == 2 and canvas_id in design.canvas_dictionary:
+            remove(design, canvas_id)
+        elif action == 3 and step % 50 == 0:
+            design.set_language("Verilog" if design.language == "VHDL" else "VHDL")
+        if step % 7 == 0:  # The signal-names stored in between are indexed at the next lookup.
+            for signal_name in ("a", "b", "c", "d"):
+                assert sorted(design.get_wire_canvas_ids_of_net(signal_name)) == (
+                    get_wire_canvas_ids_of_net_from_canvas_dictionary(design, signal_name)
+                )
+
+
+def test_renamed_signal_name_moves_the_wires_to_the_other_net():
+    design = design_data.DesignData(None, None)
+    store_wire(design, 1, "wire_1")
+    store_wire(design, 2, "wire_1")
+    store_signal_name(design, 3, "a : std_logic", "wire_1")
+    assert design.get_wire_canvas_ids_of_net("a") == [1, 2]
+    store_signal_name(design, 3, "b : std_logic", "wire_1")
+    assert design.get_wire_canvas_ids_of_net("a") == []
+    assert design.get_wire_canvas_ids_of_net("b") == [1, 2]
+    remove(design, 2)
+    assert design.get_wire_canvas_ids_of_net("b") == [1]
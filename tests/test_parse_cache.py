@@ -0,0 +1,91 @@
+"""Tests of the ParseCache, which stores the results of the VHDL- and Verilog-parser in memory and in files."""
+
+import json
+import os
+
+import pytest
+
+from hdl_parser import hdl_tokenizer, parse_cache, vhdl_parsing
+
+VHDL = """library ieee;
+use ieee.std_logic_1164.all;
+entity top is
+    generic (g_width : natural := 8);
+    port (clk : in std_logic; d : out std_logic_vector(g_width-1 downto 0));
+end entity top;
+architecture struct of top is
+    signal s : std_logic;
+begin
+    d <= (others => s);
+end architecture;
+"""
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path):
+    cache = parse_cache.ParseCache
+    cache.clear()
+    cache.cache_directory = str(tmp_path / "parse_cache")
+    cache.write_failed = False
+    yield cache
+    cache.clear()
+    cache.cache_directory = ""
+
+
+def get_cache_files(cache):
+    return [os.path.join(cache.cache_directory, file_name) for file_name in os.listdir(cache.cache_directory)]
+
+
+def test_cached_result_equals_parser_result(cache):
+    parser = vhdl_parsing.VhdlParser(VHDL, "entity_context")
+    first = cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context")
+    second = cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context")
+    for result in (first, second):
+        assert result.parse_result == parser.parse_result
+        assert result.get_architecture_declarations() == parser.get_architecture_declarations()
+        assert result.get_architecture_body() == parser.get_architecture_body()
+        assert result.get("entity_name") == "top"
+        assert result.get("unknown") == ""
+
+
+def test_caller_cannot_change_the_cached_result(cache):
+    cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context").get("port_interface_names").append("x")
+    assert "x" not in cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context").get(
+        "port_interface_names"
+    )
+
+
+def test_result_is_read_from_a_json_file_after_a_restart(cache):
+    expected = cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context").parse_result
+    (file_name,) = get_cache_files(cache)
+    assert file_name.endswith(".json")
+    with open(file_name, encoding="utf-8") as fileobject:
+        json.loads(fileobject.read())
+    cache.clear()
+    assert cache.lookup(vhdl_parsing.VhdlParser, VHDL, "entity_context").parse_result == expected
+
+
+def test_file_older_than_the_tokenizer_is_ignored(cache):
+    cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context")
+    (file_name,) = get_cache_files(cache)
+    tokenizer_time = os.path.getmtime(hdl_tokenizer.__file__)
+    os.utime(file_name, (tokenizer_time - 10, tokenizer_time - 10))
+    cache.clear()
+    assert cache.lookup(vhdl_parsing.VhdlParser, VHDL, "entity_context") is None
+
+
+def test_file_of_another_format_version_is_ignored(cache, monkeypatch):
+    cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context")
+    cache.clear()
+    monkeypatch.setattr(cache, "format_version", cache.format_version + 1)
+    assert cache.lookup(vhdl_parsing.VhdlParser, VHDL, "entity_context") is None
+
+
+def test_damaged_file_is_removed(cache):
+    cache.get_parse_result(vhdl_parsing.VhdlParser, VHDL, "entity_context")
+    (file_name,) = get_cache_files(cache)
+    with open(file_name, "w", encoding="utf-8") as fileobject:
+        fileobject.write('{"not": "a result"')
+    cache.clear()
+    assert cache.lookup(vhdl_parsing.VhdlParser, VHDL, "entity_context") is None
+    assert not os.path.exists(file_name)
@@ -0,0 +1,83 @@
+"""Tests of the ParserPool, the process pool which is shared by all CustomText widgets for parsing long texts."""
+
+import concurrent.futures
+import os
+
+import pytest
+
+from hdl_parser import vhdl_parsing
+from widgets import custom_text, parser_pool
+
+
+@pytest.fixture(name="pool")
+def fixture_pool(monkeypatch):
+    monkeypatch.setattr(parser_pool.ParserPool, "max_workers", 2)
+    monkeypatch.setattr(parser_pool.ParserPool, "executor", None)
+    yield parser_pool.ParserPool
+    parser_pool.ParserPool.shutdown()
+
+
+def test_pool_is_started_once_and_reused(pool):
+    assert pool.executor is None
+    assert pool.submit(pow, 2, 10).result(timeout=60) == 1024
+    executor = pool.executor
+    futures = [pool.submit(os.getpid) for _ in range(8)]
+    assert pool.executor is executor
+    assert len({future.result(timeout=60) for future in futures}) <= 2
+
+
+def test_shutdown_stops_the_pool_and_a_new_submit_starts_it_again(pool):
+    pool.submit(pow, 2, 2).result(timeout=60)
+    pool.shutdown()
+    assert pool.executor is None
+    pool.shutdown()  # Is also called, when the pool was never started.
+    assert pool.submit(pow, 2, 3).result(timeout=60) == 8
+
+
+def test_broken_pool_is_replaced(pool):
+    future = pool.submit(os._exit, 1)  # Terminates the worker process.
+    with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+        future.result(timeout=60)
+    broken_executor = pool.executor
+    assert pool.submit(pow, 3, 2).result(timeout=60) == 9
+    assert pool.executor is not broken_executor
+
+
+def test_parse_in_the_pool_finds_the_same_positions(pool):
+    hdl = "entity top is\n    port (clk : in std_logic);\nend entity top;\n" * 200
+    future = pool.submit(custom_text._run_parser, vhdl_parsing.VhdlParser, hdl, "entity_context")
+    expected = custom_text._run_parser(vhdl_parsing.VhdlParser, hdl, "entity_context")
+    assert custom_text._get_positions(future.result(timeout=60)) == custom_text._get_positions(expected)
+
+
+class Widget:
+    """Contains the attributes and methods of CustomText, which are used by _poll_parse_result."""
+
+    def __init__(self):
+        self.highlight_generation = 1
+        self.last_parse = None
+        self.polls = []
+        self.updates = []
+
+    _poll_parse_result = custom_text.CustomText._poll_parse_result
+
+    def after(self, _, function, *args):
+        self.polls.append((function, args))
+
+    def _update_tags(self, hdl, object_positions, generation):
+        self.updates.append((hdl, generation))
+
+
+def test_result_of_a_superseded_parse_is_dropped():
+    widget = Widget()
+    future = concurrent.futures.Future()
+    widget._poll_parse_result(future, "old text", 1)
+    assert len(widget.polls) == 1 and not widget.updates  # The parse is still running.
+    widget.highlight_generation = 2  # The text was changed.
+    future.set_result(custom_text._run_parser(vhdl_parsing.VhdlParser, "old text", "entity_context"))
+    widget._poll_parse_result(future, "old text", 1)
+    assert widget.last_parse is None
+    assert len(widget.polls) == 1 and not widget.updates
+    widget._poll_parse_result(future, "old text", 2)
+    assert widget.last_parse is future.result()
+    assert widget.updates == [("old text", 2)]
@@ -0,0 +1,154 @@
+"""Tests of SortElements and of the EnclosureIndex, which must give the same results as the former algorithm."""
+
+import copy
+import random
+
+import pytest
+
+from codegen import enclosure_index, hdl_generate_sort_elements
+
+
+def get_enclosed_canvas_ids(rectangles, coords):
+    # The former check of all rectangles:
+    frame_left, frame_right = sorted((coords[0], coords[2]))
+    frame_top, frame_bottom = sorted((coords[1], coords[3]))
+    return [
+        canvas_id
+        for canvas_id, (x1, y1, x2, y2) in rectangles.items()
+        if frame_left <= min(x1, x2)
+        and max(x1, x2) <= frame_right
+        and frame_top <= min(y1, y2)
+        and max(y1, y2) <= frame_bottom
+    ]
+
+
+def sort_canvas_ids(canvas_ids, elements_dictionary):
+    prios = [elements_dictionary[canvas_id]["prio"] for canvas_id in canvas_ids]
+    prios = [prio for prio in prios if prio != -1]
+    if len(prios) != len(set(prios)):  # The elements are not sorted, when a priority is used twice.
+        return list(canvas_ids)
+    with_prio = sorted((elements_dictionary[canvas_id]["prio"], canvas_id) for canvas_id in canvas_ids)
+    return [canvas_id for prio, canvas_id in with_prio if prio != -1] + [
+        canvas_id for canvas_id in canvas_ids if elements_dictionary[canvas_id]["prio"] == -1
+    ]
+
+
+def sort_elements_like_before(elements_dictionary, rectangles):
+    # The former algorithm, which removed the elements from lists by repeated linear searches:
+    enclosed_dictionary = {
+        canvas_id: [
+            enclosed
+            for enclosed in get_enclosed_canvas_ids(rectangles, element["coords"])
+            if enclosed != canvas_id
+        ]
+        for canvas_id, element in elements_dictionary.items()
+        if element["type"] == "generate_frame"
+    }
+    top_elements = list(elements_dictionary)
+    for enclosed_elements in enclosed_dictionary.values():
+        for enclosed_element in enclosed_elements:
+            if enclosed_element in top_elements:
+                top_elements.remove(enclosed_element)
+    top_elements = sort_canvas_ids(top_elements, elements_dictionary)
+
+    def remove_ambiguity(canvas_ids):
+        for canvas_id in canvas_ids:
+            if elements_dictionary[canvas_id]["type"] == "generate_frame":
+                enclosed_of_this_generate = enclosed_dictionary[canvas_id]
+                for other_canvas_id, enclosed_of_other_generate in enclosed_dictionary.items():
+                    if other_canvas_id != canvas_id:
+                        for enclosed_element in enclosed_of_other_generate:
+                            if enclosed_element in enclosed_of_this_generate:
+                                enclosed_of_this_generate.remove(enclosed_element)
+                remove_ambiguity(enclosed_dictionary[canvas_id])
+
+    remove_ambiguity(top_elements)
+    for canvas_id, enclosed_elements in enclosed_dictionary.items():
+        enclosed_dictionary[canvas_id] = sort_canvas_ids(enclosed_elements, elements_dictionary)
+    sorted_list = []
+
+    def expand(canvas_ids):
+        for canvas_id in canvas_ids:
+            sorted_list.append(canvas_id)
+            if canvas_id in enclosed_dictionary:
+                sorted_list.append("begin-generate " + "".join(str(x) + " " for x in enclosed_dictionary[canvas_id]))
+                expand(enclosed_dictionary[canvas_id])
+                sorted_list.append("end generate " + str(canvas_id))
+
+    expand(top_elements)
+    return sorted_list
+
+
+class Design:
+    """Contains the methods of DesignData, which are used by SortElements."""
+
+    def __init__(self, elements_dictionary, rectangles):
+        self.elements_dictionary = elements_dictionary
+        self.rectangles = rectangles
+
+    def create_schematic_elements_dictionary(self):
+        return copy.deepcopy(self.elements_dictionary)
+
+    def get_rectangles_of_hdl_elements(self):
+        return self.rectangles
+
+    def get_module_name(self):
+        return "top"
+
+
+def create_random_schematic(rand):
+    elements_dictionary = {}
+    rectangles = {}
+    for canvas_id in rand.sample(range(1, 100), rand.randint(1, 25)):
+        x1 = rand.randint(0, 100)
+        y1 = rand.randint(0, 100)
+        coords = [x1, y1, x1 + rand.randint(0, 80) * rand.choice([1, -1]), y1 + rand.randint(0, 80)]
+        rectangles[canvas_id] = coords
+        elements_dictionary[canvas_id] = {
+            "prio": rand.choice([-1, -1, rand.randint(0, 30)]),
+            "type": rand.choice(["block", "instance", "generate_frame"]),
+            "coords": coords,
+        }
+    return elements_dictionary, rectangles
+
+
+def test_enclosure_index_finds_the_enclosed_rectangles_of_a_complete_search():
+    rand = random.Random(5)
+    for _ in range(300):
+        _, rectangles = create_random_schematic(rand)
+        index = enclosure_index.EnclosureIndex(rectangles)
+        for coords in list(rectangles.values()) + [[0, 0, 200, 200], [50, 50, 10, 10]]:
+            assert index.get_canvas_ids_enclosed_by(coords) == get_enclosed_canvas_ids(rectangles, coords)
+
+
+def test_sorted_elements_are_the_same_as_before():
+    rand = random.Random(9)
+    for _ in range(1000):
+        elements_dictionary, rectangles = create_random_schematic(rand)
+        design = Design(elements_dictionary, rectangles)
+        sorted_list = hdl_generate_sort_elements.SortElements(design, False).get_sorted_list_of_schematic_elements()
+        assert sorted_list == sort_elements_like_before(copy.deepcopy(elements_dictionary), rectangles)
+
+
+@pytest.mark.parametrize("write_to_file", [False, True])
+def test_nested_generates_contain_only_their_direct_elements(write_to_file):
+    elements_dictionary = {
+        1: {"prio": -1, "type": "generate_frame", "coords": [0, 0, 100, 100]},
+        2: {"prio": -1, "type": "generate_frame", "coords": [10, 10, 50, 50]},
+        3: {"prio": 2, "type": "instance", "coords": [20, 20, 30, 30]},
+        4: {"prio": 1, "type": "block", "coords": [60, 60, 70, 70]},
+        5: {"prio": -1, "type": "block", "coords": [200, 0, 210, 10]},
+    }
+    rectangles = {canvas_id: element["coords"] for canvas_id, element in elements_dictionary.items()}
+    sort_elements = hdl_generate_sort_elements.SortElements(Design(elements_dictionary, rectangles), write_to_file)
+    assert sort_elements.get_sorted_list_of_schematic_elements() == [
+        1,
+        "begin-generate 4 2 ",
+        4,
+        2,
+        "begin-generate 3 ",
+        3,
+        "end generate 2",
+        "end generate 1",
+        5,
+    ]
@@ -0,0 +1,91 @@
+"""Tests of the cache of HdlGenerateFunctions.split_declaration."""
+
+import pytest
+
+from codegen import hdl_generate_functions
+
+# The results of the implementation without cache:
+DECLARATIONS = [
+    (
+        'data : std_logic_vector(7 downto 0) := X"77" -- complete range',
+        "VHDL",
+        ("data", "", "std_logic_vector(7 downto 0)", "-- complete range", ':= X"77"', ""),
+    ),
+    (
+        'data(7 downto 4) : std_logic_vector(7 downto 0) := X"77"',
+        "VHDL",
+        ("data", "(7 downto 4)", "std_logic_vector(7 downto 0)", "", ':= X"77"', ""),
+    ),
+    (
+        'data(1 downto 0) : t_std_logic_8_array(3 downto 0) := (X"77", X"66", X"55", X"44") -- comment',
+        "VHDL",
+        (
+            "data",
+            "(1 downto 0)",
+            "t_std_logic_8_array(3 downto 0)",
+            "-- comment",
+            ':= (X"77", X"66", X"55", X"44")',
+            "",
+        ),
+    ),
+    (
+        "data(3)(0) : t_std_logic_8_array(3 downto 0)",
+        "VHDL",
+        ("data", "(3)(0)", "t_std_logic_8_array(3 downto 0)", "", "", ""),
+    ),
+    (
+        "rec.field : t_record",
+        "VHDL",
+        ("rec", "", "t_record", "", "", ".field"),
+    ),
+    (
+        "wire [7:0] data // comment",
+        "Verilog",
+        ("data", "", "wire [7:0]", "// comment", "", ""),
+    ),
+    (
+        "wire [7:0] data[3:0]",
+        "Verilog",
+        ("data[3:0]", "", "wire [7:0]", "", "", ""),
+    ),
+    (
+        "reg signed [15:0] counter",
+        "Verilog",
+        ("counter", "", "reg signed [15:0]", "", "", ""),
+    ),
+]
+
+
+@pytest.fixture(name="functions")
+def fixture_functions():
+    functions = hdl_generate_functions.HdlGenerateFunctions
+    functions.split_declaration_cache.clear()
+    yield functions
+    functions.split_declaration_cache.clear()
+
+
+@pytest.mark.parametrize("declaration, language, expected", DECLARATIONS)
+def test_cached_result_equals_uncached_result(functions, declaration, language, expected):
+    assert functions._split_declaration(declaration, language) == expected
+    assert functions.split_declaration(declaration, language) == expected
+    assert functions.split_declaration(declaration, language) == expected  # Read from the cache.
+
+
+def test_result_cannot_be_changed_by_caller(functions):
+    result = functions.split_declaration(*DECLARATIONS[0][:2])
+    assert isinstance(result, tuple)
+
+
+def test_language_is_part_of_the_key(functions):
+    functions.split_declaration("data : std_logic", "VHDL")
+    functions.split_declaration("data : std_logic", "Verilog")
+    assert len(functions.split_declaration_cache) == 2
+
+
+def test_least_recently_used_entry_is_removed(functions, monkeypatch):
+    monkeypatch.setattr(functions, "split_declaration_cache_max_entries", 2)
+    functions.split_declaration("a : std_logic", "VHDL")
+    functions.split_declaration("b : std_logic", "VHDL")
+    functions.split_declaration("a : std_logic", "VHDL")  # "b" is now the least recently used entry.
+    functions.split_declaration("c : std_logic", "VHDL")
+    assert list(functions.split_declaration_cache) == [("a : std_logic", "VHDL"), ("c : std_logic", "VHDL")]